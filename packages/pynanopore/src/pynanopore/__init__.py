@@ -1,7 +1,7 @@
 """Pynanopore: single-molecule nanopore electrophysiology analysis."""
 
 from pynanopore._version import __version__
-from pynanopore.batch import BatchDetectConfig, batch_detect
+from pynanopore.batch import BatchDetectConfig, batch_detect, open_events_dataset
 from pynanopore.detection.baseline import (
     ConstantBaseline,
     MedianBaseline,
@@ -9,20 +9,36 @@ from pynanopore.detection.baseline import (
     PercentileBaseline,
 )
 from pynanopore.detection.chunking import ChunkGenerator
-from pynanopore.detection.events import Event, EventDetector
+from pynanopore.detection.events import Event, EventDetector, EventTable
+from pynanopore.detection.idealized import IdealizedTrace
 from pynanopore.detection.levels import LevelFeatures, analyze_event_levels
 from pynanopore.detection.pulse_shape import PulseShapeIdealizer, PulseShapeResult
-from pynanopore.dwelltime.fit import DwellTimeExponentialFit, DwellTimeFitResult
+from pynanopore.detection.streaming import StreamingEventDetector
+from pynanopore.detection.sweep import sweep_thresholds
+from pynanopore.dwelltime.bootstrap import BootstrapResult, bootstrap_dwell_fit
+from pynanopore.dwelltime.fit import (
+    DwellTimeExponentialFit,
+    DwellTimeFitResult,
+    ExponentialMixture,
+    clear_fit_cache,
+    fit_cache_info,
+    fit_exponential_mixture,
+    set_fit_cache_size,
+)
 from pynanopore.io.readers import load_trace
 from pynanopore.io.trace import Trace
 from pynanopore.psd.analyzer import PSDAnalyzer
 from pynanopore.psd.lorentzian import (
     CompositePSDFitter,
+    LogBinnedPSD,
     LorentzianFitter,
     LorentzianWhiteFitter,
     MultiLorentzianFitter,
     PSDFitDiagnostics,
+    log_bin_psd,
 )
+from pynanopore.psd.spectrogram import Spectrogram, compute_spectrogram, fit_spectrogram
+from pynanopore.psd.streaming import WelchAccumulator
 
 __all__ = [
     "Trace",
@@ -30,23 +46,41 @@ __all__ = [
     "ChunkGenerator",
     "Event",
     "EventDetector",
+    "EventTable",
+    "StreamingEventDetector",
+    "sweep_thresholds",
     "NoneBaseline",
     "ConstantBaseline",
     "MedianBaseline",
     "PercentileBaseline",
     "LevelFeatures",
     "analyze_event_levels",
+    "IdealizedTrace",
     "PulseShapeIdealizer",
     "PulseShapeResult",
     "DwellTimeExponentialFit",
     "DwellTimeFitResult",
+    "ExponentialMixture",
+    "fit_exponential_mixture",
+    "clear_fit_cache",
+    "fit_cache_info",
+    "set_fit_cache_size",
+    "BootstrapResult",
+    "bootstrap_dwell_fit",
     "PSDAnalyzer",
+    "WelchAccumulator",
+    "Spectrogram",
+    "compute_spectrogram",
+    "fit_spectrogram",
     "LorentzianFitter",
     "CompositePSDFitter",
     "LorentzianWhiteFitter",
     "MultiLorentzianFitter",
+    "LogBinnedPSD",
+    "log_bin_psd",
     "PSDFitDiagnostics",
     "BatchDetectConfig",
     "batch_detect",
+    "open_events_dataset",
     "__version__",
 ]
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+import shutil
+import sys
+import time
+import warnings
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote, unquote
 
 import pandas as pd
 
+from pynanopore._dtypes import load_dtype
 from pynanopore._version import __version__
 from pynanopore.detection.baseline import (
     ConstantBaseline,
@@ -20,10 +30,22 @@ from pynanopore.detection.baseline import (
 )
 from pynanopore.detection.events import EventDetector
 from pynanopore.dwelltime.fit import DwellTimeExponentialFit
+from pynanopore.io.npt import NPT_SUFFIX, read_npt_header
 from pynanopore.io.readers import load_trace
 
+if TYPE_CHECKING:
+    import pyarrow.dataset as pa_ds
+
 SCHEMA_VERSION = "1.1.0"
-SUPPORTED_SUFFIXES = {".abf", ".csv"}
+SUPPORTED_SUFFIXES = {".abf", ".csv", ".npt"}
+MANIFEST_NAME = "manifest.jsonl"
+EVENTS_DATASET = "events.parquet"  # hive-partitioned by ``file`` when output_format="parquet"
+_RUN_ONLY_FIELDS = frozenset({"n_jobs", "max_memory_gb"})  # cannot change the outputs
+_HASH_CHUNK = 1 << 23
+_WORKER_OVERHEAD = 200 << 20  # interpreter + numpy/scipy/pandas in a worker
+_CHUNK_COPIES = 8  # scaled chunk, baseline, deviation, masks, level features
+_CSV_BYTES_PER_ROW = 48  # parsed time + current (float64) and pandas/parser temporaries
+_CSV_PROBE = 1 << 16  # bytes read to estimate a CSV's row length
 
 
 @dataclass
@@ -35,32 +57,274 @@ class BatchDetectConfig:
     baseline: Literal["none", "median", "constant", "percentile"] = "none"
     baseline_window: float = 0.05
     baseline_percentile: float = 90.0
+    baseline_engine: Literal["exact", "decimate"] = "exact"
+    baseline_scope: Literal["chunk", "trace"] = "chunk"
     interval_length: float = 5.0
     overlap: float = 0.0
     fit_dwelltime: bool = True
     dwell_fit_type: Literal["single", "double", "auto"] = "single"
     analyze_levels: bool = True
     n_jobs: int = 1
+    dtype: Literal["auto", "float32", "float64"] = "auto"
+    max_memory_gb: float | None = None
+    output_format: Literal["csv", "parquet"] = "csv"
 
 
-def _baseline_from_name(name: str, window_s: float, percentile: float = 90.0):
+def _baseline_from_name(
+    name: str, window_s: float, percentile: float = 90.0, engine: str = "exact"
+):
     if name == "median":
-        return MedianBaseline(window_s=window_s)
+        return MedianBaseline(window_s=window_s, engine=engine)
     if name == "constant":
         return ConstantBaseline()
     if name == "percentile":
-        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5))
+        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5), engine=engine)
     return NoneBaseline()
 
 
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:
+        raise ImportError(
+            "pyarrow is required for Parquet output. Install with: pip install 'pynanopore[parquet]'"
+        ) from exc
+    return pyarrow
+
+
+def _write_events_parquet(df: pd.DataFrame, out_dir: Path, file_name: str) -> Path:
+    """Write one recording's events as the ``file=<name>`` partition of the events dataset."""
+    import pyarrow.parquet as pq
+
+    pa = _require_pyarrow()
+    partition = out_dir / EVENTS_DATASET / f"file={quote(file_name, safe='')}"
+    partition.mkdir(parents=True, exist_ok=True)
+    out_path = partition / "part-0.parquet"
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_table(table, out_path, compression="zstd")
+    return out_path
+
+
+def open_events_dataset(output_dir: str | Path) -> pa_ds.Dataset:
+    """
+    Events of a Parquet batch run as one ``pyarrow.dataset.Dataset`` with a ``file`` column.
+
+    Filters on ``file`` skip whole partitions and filters on event columns use the
+    row-group statistics, e.g.
+    ``open_events_dataset(out).to_table(filter=ds.field("dwell_time") > 1e-3).to_pandas()``.
+    """
+    import pyarrow.dataset as ds
+
+    pa = _require_pyarrow()
+    root = Path(output_dir) / EVENTS_DATASET
+    if not root.is_dir():
+        raise FileNotFoundError(f"No Parquet events dataset in {output_dir}")
+    partitioning = ds.partitioning(pa.schema([("file", pa.string())]), flavor="hive")
+    return ds.dataset(root, format="parquet", partitioning=partitioning)
+
+
 def discover_recordings(input_dir: str | Path) -> list[Path]:
+    """
+    ABF/CSV/``.npt`` recordings in ``input_dir``, sorted by name.
+
+    A ``<stem>.npt`` written by :func:`~pynanopore.io.npt.convert_to_npt` replaces the
+    ``<stem>.abf`` or ``<stem>.csv`` named in its header while that file's size and
+    mtime still match the header. If the source changed after conversion, the stale
+    cache is skipped with a warning and the source is used. Other same-stem files
+    (e.g. ``<stem>.csv`` next to a cache of ``<stem>.abf``) are separate recordings.
+    """
     root = Path(input_dir)
     if not root.is_dir():
         raise NotADirectoryError(f"Not a directory: {root}")
     files = sorted(
         p for p in root.iterdir() if p.is_file() and p.suffix.lower() in SUPPORTED_SUFFIXES
     )
-    return files
+    by_name = {p.name: p for p in files}
+    skip: set[Path] = set()
+    for cache in files:
+        if cache.suffix.lower() != NPT_SUFFIX:
+            continue
+        try:
+            source = read_npt_header(cache).get("source") or {}
+        except Exception:  # noqa: BLE001 - a corrupt cache is reported when processed
+            continue
+        src = by_name.get(Path(str(source.get("path", ""))).name)
+        if src is None or src is cache or src.stem != cache.stem:
+            continue
+        stat = src.stat()
+        if stat.st_size == source.get("size") and stat.st_mtime == source.get("mtime"):
+            skip.add(src)
+        else:
+            warnings.warn(
+                f"{src.name} changed after it was converted to {cache.name}; "
+                f"using {src.name} (re-run 'pynanopore convert' to refresh the cache)",
+                stacklevel=2,
+            )
+            skip.add(cache)
+    return [p for p in files if p not in skip]
+
+
+def file_digest(path: str | Path) -> str:
+    """BLAKE2b digest of a file's contents, read in 8 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_digest(config: BatchDetectConfig) -> str:
+    """Hash of the detection settings that determine a file's outputs."""
+    settings = {k: v for k, v in asdict(config).items() if k not in _RUN_ONLY_FIELDS}
+    blob = json.dumps({"schema_version": SCHEMA_VERSION, **settings}, sort_keys=True)
+    return hashlib.blake2b(blob.encode(), digest_size=16).hexdigest()
+
+
+def load_manifest(output_dir: str | Path) -> dict[str, dict[str, Any]]:
+    """
+    Completed files recorded in ``output_dir/manifest.jsonl``, keyed by file name.
+
+    Later lines win; a truncated last line (run killed mid-write) is ignored.
+    """
+    path = Path(output_dir) / MANIFEST_NAME
+    entries: dict[str, dict[str, Any]] = {}
+    if not path.exists():
+        return entries
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry["file"]] = entry
+    return entries
+
+
+def _append_manifest(handle: Any, entry: dict[str, Any]) -> None:
+    handle.write(json.dumps(entry) + "\n")
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+def _is_current(entry: dict[str, Any] | None, path: Path, out_dir: Path, cfg_hash: str) -> bool:
+    """True when ``entry`` records ``path``'s contents under ``cfg_hash`` and its outputs exist."""
+    if entry is None or entry.get("config_hash") != cfg_hash:
+        return False
+    if not all((out_dir / rel).exists() for rel in entry.get("outputs", [])):
+        return False
+    try:
+        stat = path.stat()
+        if entry.get("size") != stat.st_size:
+            return False
+        if entry.get("mtime_ns") == stat.st_mtime_ns:
+            return True
+        # Touched but possibly unchanged: compare contents
+        if file_digest(path) != entry.get("content_hash"):
+            return False
+    except OSError:  # vanished or unreadable: reprocess, and the worker reports it
+        return False
+    entry["mtime_ns"] = stat.st_mtime_ns
+    return True
+
+
+def _recording_shape(path: Path) -> tuple[int, float | None]:
+    """``(n_samples, sample_rate)`` from the file header, without reading the samples."""
+    suffix = path.suffix.lower()
+    if suffix == NPT_SUFFIX:
+        header = read_npt_header(path)
+        return int(header["n_samples"]), float(header["sample_rate"])
+    if suffix == ".abf":
+        import pyabf
+
+        abf = pyabf.ABF(str(path), loadData=False)
+        return int(abf.sweepPointCount), float(abf.dataRate)
+    # CSV: extrapolate the row count from the length of the first rows
+    size = path.stat().st_size
+    with open(path, "rb") as fh:
+        head = fh.read(_CSV_PROBE)
+    lines = max(1, head.count(b"\n"))
+    return max(1, int(size * lines / max(1, len(head)))), None
+
+
+def estimate_peak_memory(path: str | Path, config: BatchDetectConfig | None = None) -> int:
+    """
+    Rough peak memory (bytes) of processing one recording, from its header.
+
+    A worker's baseline footprint, plus ``n_samples`` x working-dtype bytes for arrays
+    that span the whole trace (CSV parsing, ``baseline_scope='trace'``), plus a few
+    chunk-sized working copies. ABF and ``.npt`` samples are memory-mapped and only
+    count through the chunks.
+    """
+    cfg = config or BatchDetectConfig()
+    path = Path(path)
+    n, fs = _recording_shape(path)
+    itemsize = load_dtype(cfg.dtype, n).itemsize
+    chunk = n if fs is None else min(n, int(cfg.interval_length * fs) + 1)
+    peak = _WORKER_OVERHEAD + _CHUNK_COPIES * chunk * itemsize
+    if path.suffix.lower() == ".csv":
+        peak += n * (_CSV_BYTES_PER_ROW + itemsize)
+    if cfg.baseline_scope == "trace":
+        peak += n * itemsize
+    return int(peak)
+
+
+def _reset_peak_rss() -> None:
+    # Linux: restart the VmHWM high-water mark so it covers only the next file
+    try:
+        with open("/proc/self/clear_refs", "w") as fh:
+            fh.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process since the last :func:`_reset_peak_rss`."""
+    try:
+        with open("/proc/self/status") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _error_row(path: Path, exc: BaseException) -> dict[str, Any]:
+    return {"file": path.name, "status": "error", "n_events": 0, "error": str(exc)}
+
+
+def _process_and_record(
+    payload: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, Any] | None]:
+    """Worker: hash the recording, process it and build its manifest entry."""
+    path = Path(payload["path"])
+    try:
+        stat = path.stat()
+        content_hash = file_digest(path)
+    except OSError as exc:
+        return _error_row(path, exc), None
+    _reset_peak_rss()
+    t0 = time.perf_counter()
+    row = _process_one_file(payload)
+    row["wall_time_s"] = time.perf_counter() - t0
+    row["peak_rss_mb"] = None if (peak := _peak_rss_bytes()) is None else peak / 2**20
+    row["est_memory_mb"] = payload["est_memory"] / 2**20
+    outputs = [row[key] for key in ("events_csv", "events_parquet") if row.get(key)]
+    entry = {
+        "file": path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "content_hash": content_hash,
+        "config_hash": payload["config_hash"],
+        "outputs": outputs,
+        "row": row,
+    }
+    return row, entry
 
 
 def _process_one_file(payload: dict[str, Any]) -> dict[str, Any]:
@@ -77,17 +341,27 @@ def _process_one_file(payload: dict[str, Any]) -> dict[str, Any]:
             min_duration=cfg.min_duration,
             direction=cfg.direction,
             baseline=_baseline_from_name(
-                cfg.baseline, cfg.baseline_window, cfg.baseline_percentile
+                cfg.baseline, cfg.baseline_window, cfg.baseline_percentile, cfg.baseline_engine
             ),
             analyze_levels=cfg.analyze_levels,
+            dtype=cfg.dtype,
         )
-        trace = load_trace(path)
+        trace = load_trace(path, mmap=True, dtype=cfg.dtype)
         events = detector.detect_trace(
-            trace, interval_length=cfg.interval_length, overlap=cfg.overlap
+            trace,
+            interval_length=cfg.interval_length,
+            overlap=cfg.overlap,
+            baseline_scope=cfg.baseline_scope,
+            as_table=True,
         )
-        df = pd.DataFrame([e.to_dict() for e in events])
-        out_csv = events_dir / f"{path.stem}_events.csv"
-        df.to_csv(out_csv, index=False)
+        df = events.to_pandas()
+        if cfg.output_format == "parquet":
+            events_key = "events_parquet"
+            events_path = _write_events_parquet(df, out_dir, path.name)
+        else:
+            events_key = "events_csv"
+            events_path = events_dir / f"{payload['events_stem']}_events.csv"
+            df.to_csv(events_path, index=False)
 
         row: dict[str, Any] = {
             "file": path.name,
@@ -105,7 +379,7 @@ def _process_one_file(payload: dict[str, Any]) -> dict[str, Any]:
             "frac_multilevel": (
                 float((df["n_levels"] > 1).mean()) if len(df) and "n_levels" in df.columns else None
             ),
-            "events_csv": str(out_csv.relative_to(out_dir)),
+            events_key: str(events_path.relative_to(out_dir)),
             "error": None,
         }
         if cfg.fit_dwelltime and len(df) >= 5:
@@ -114,73 +388,230 @@ def _process_one_file(payload: dict[str, Any]) -> dict[str, Any]:
                 result = fit.fit(cfg.dwell_fit_type, method="mle")
                 row["dwell_fit_type"] = result.fit_type
                 row["dwell_aic"] = result.aic
+                if result.n_iter is not None:
+                    row["dwell_n_iter"] = result.n_iter
                 for k, v in result.parameters.items():
                     row[f"dwell_{k}"] = v
             except Exception as fit_exc:  # noqa: BLE001
                 row["dwell_fit_error"] = str(fit_exc)
         return row
     except Exception as exc:  # noqa: BLE001
-        return {
-            "file": path.name,
-            "status": "error",
-            "n_events": 0,
-            "error": str(exc),
-        }
+        return _error_row(path, exc)
+
+
+def _safe_estimate(path: Path, cfg: BatchDetectConfig) -> int:
+    # Unreadable headers are reported by the worker; schedule them as small jobs
+    try:
+        return estimate_peak_memory(path, cfg)
+    except Exception:  # noqa: BLE001
+        return _WORKER_OVERHEAD
+
+
+def _run_scheduled(
+    payloads: list[dict[str, Any]],
+    n_jobs: int,
+    budget: float | None,
+    record: Any,
+) -> None:
+    """
+    Run ``payloads`` (largest first) on ``n_jobs`` workers within a memory ``budget``.
+
+    A worker that dies mid-file (e.g. killed for running out of memory) breaks the
+    pool and fails every job running beside it. The pool is then rebuilt and those
+    jobs are retried one at a time, so only a file that kills its worker on its own
+    is recorded as an error and the remaining files are still processed.
+    """
+    pending = list(payloads)
+    suspects: list[dict[str, Any]] = []  # in flight when a worker died
+    while pending or suspects:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            running: dict[Future, dict[str, Any]] = {}
+            isolated: set[Future] = set()
+            broken = False
+            while (pending or suspects or running) and not broken:
+                try:
+                    if not suspects:
+                        _submit_fitting(pool, pending, running, n_jobs, budget)
+                    elif not running:
+                        fut = pool.submit(_process_and_record, suspects[0])
+                        running[fut] = suspects.pop(0)
+                        isolated.add(fut)
+                except BrokenProcessPool:
+                    broken = True
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                while done:
+                    for fut in done:
+                        payload = running.pop(fut)
+                        try:
+                            result = fut.result()
+                        except BrokenProcessPool as exc:
+                            broken = True
+                            if fut not in isolated:
+                                suspects.append(payload)
+                                continue
+                            result = (_error_row(Path(payload["path"]), exc), None)
+                        except Exception as exc:  # noqa: BLE001
+                            result = (_error_row(Path(payload["path"]), exc), None)
+                        record(result)
+                    # Once broken, every other running job fails too; collect them all
+                    done = wait(running)[0] if broken else set()
+
+
+def _submit_fitting(
+    pool: ProcessPoolExecutor,
+    pending: list[dict[str, Any]],
+    running: dict[Future, dict[str, Any]],
+    n_jobs: int,
+    budget: float | None,
+) -> None:
+    """Start pending jobs, largest first, while workers are free and the ``budget`` allows."""
+    in_use = sum(p["est_memory"] for p in running.values())
+    while pending and len(running) < n_jobs:
+        # First (largest) job that fits; anything may start on an idle pool
+        pick = next(
+            (
+                i
+                for i, p in enumerate(pending)
+                if budget is None or not running or in_use + p["est_memory"] <= budget
+            ),
+            None,
+        )
+        if pick is None:
+            return
+        # Only dequeue once submitted, so a broken pool leaves the job pending
+        fut = pool.submit(_process_and_record, pending[pick])
+        running[fut] = pending.pop(pick)
+        in_use += running[fut]["est_memory"]
 
 
 def batch_detect(
     input_dir: str | Path,
     output_dir: str | Path,
     config: BatchDetectConfig | None = None,
+    *,
+    resume: bool = True,
 ) -> pd.DataFrame:
     """
-    Run event detection on all ABF/CSV files in ``input_dir``.
+    Run event detection on all ABF/CSV/``.npt`` files in ``input_dir``.
+
+    A current ``<stem>.npt`` cache is processed instead of the ``<stem>.abf`` /
+    ``<stem>.csv`` it was converted from (see :func:`discover_recordings`).
 
     Writes:
-    - ``output_dir/events/<stem>_events.csv``
+    - ``output_dir/events/<stem>_events.csv`` (``<stem>_<ext>_events.csv`` when
+      recordings share a stem)
+    - ``output_dir/manifest.jsonl`` (one line per completed file, appended as it finishes)
     - ``output_dir/summary.csv``
     - ``output_dir/run_metadata.json``
 
+    With ``config.output_format="parquet"`` (requires ``pyarrow``) the events go to one
+    zstd-compressed dataset, ``output_dir/events.parquet/file=<name>/part-0.parquet``,
+    hive-partitioned by recording (see :func:`open_events_dataset`), and the summary
+    to ``output_dir/summary.parquet``. Partitions of recordings no longer in
+    ``input_dir`` are removed, so the dataset always matches the run.
+
+    Each manifest line holds the file's content hash, the hash of the detection
+    settings (:func:`config_digest`), its output paths and its summary row. With
+    ``resume`` (default), files whose contents and settings match their manifest entry,
+    and whose outputs still exist, are not processed again: their rows are taken from
+    the manifest. An interrupted run therefore continues where it stopped. Files that
+    failed are retried. ``resume=False`` reprocesses everything.
+
     Set ``config.n_jobs > 1`` (or ``-1`` for all CPUs) to process files in parallel.
+    Files are started largest first by :func:`estimate_peak_memory`, so the longest
+    recordings do not become the tail of the run. With ``config.max_memory_gb`` a file
+    only starts while the estimates of all running files fit that budget. A smaller
+    file that fits may start ahead of a larger one that does not, and a file over the
+    whole budget runs alone. The summary reports each processed file's
+    ``wall_time_s``, ``peak_rss_mb`` (worker high-water mark; ``None`` where the
+    platform has no measure) and ``est_memory_mb``.
     """
     cfg = config or BatchDetectConfig()
     in_dir = Path(input_dir)
     out_dir = Path(output_dir)
-    events_dir = out_dir / "events"
-    events_dir.mkdir(parents=True, exist_ok=True)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if cfg.output_format == "csv":
+        (out_dir / "events").mkdir(exist_ok=True)
 
     files = discover_recordings(in_dir)
     if not files:
-        raise FileNotFoundError(f"No .abf/.csv files found in {in_dir}")
+        raise FileNotFoundError(f"No .abf/.csv/.npt files found in {in_dir}")
 
     n_jobs = int(cfg.n_jobs)
     if n_jobs == -1:
-        import os
-
         n_jobs = max(1, os.cpu_count() or 1)
     n_jobs = max(1, n_jobs)
+    if cfg.max_memory_gb is not None and cfg.max_memory_gb <= 0:
+        raise ValueError("max_memory_gb must be positive")
+    if cfg.output_format not in ("csv", "parquet"):
+        raise ValueError("output_format must be 'csv' or 'parquet'")
+    if cfg.output_format == "parquet":
+        _require_pyarrow()
 
     cfg_dict = asdict(cfg)
+    cfg_hash = config_digest(cfg)
+    manifest = load_manifest(out_dir) if resume else {}
+    done: dict[str, dict[str, Any]] = {}
+    todo: list[Path] = []
+    for p in files:
+        entry = manifest.get(p.name)
+        if entry is not None and _is_current(entry, p, out_dir, cfg_hash):
+            done[p.name] = entry
+        else:
+            todo.append(p)
+    # Same-stem recordings (run.abf and run.csv) get distinct events files
+    stems = Counter(p.stem for p in files)
     payloads = [
-        {"path": str(p.resolve()), "out_dir": str(out_dir.resolve()), "config": cfg_dict}
-        for p in files
+        {
+            "path": str(p.resolve()),
+            "events_stem": p.stem if stems[p.stem] == 1 else f"{p.stem}_{p.suffix.lower()[1:]}",
+            "out_dir": str(out_dir.resolve()),
+            "config": cfg_dict,
+            "config_hash": cfg_hash,
+            "est_memory": _safe_estimate(p, cfg),
+        }
+        for p in todo
     ]
+    payloads.sort(key=lambda payload: -payload["est_memory"])
 
-    rows: list[dict[str, Any]] = []
-    if n_jobs == 1:
-        for payload in payloads:
-            rows.append(_process_one_file(payload))
-    else:
-        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
-            futures = {pool.submit(_process_one_file, p): p for p in payloads}
-            for fut in as_completed(futures):
-                rows.append(fut.result())
+    rows: list[dict[str, Any]] = [entry["row"] for entry in done.values()]
+    manifest_path = out_dir / MANIFEST_NAME
+    with open(manifest_path, "a" if resume else "w", encoding="utf-8") as log:
+
+        def record(result: tuple[dict[str, Any], dict[str, Any] | None]) -> None:
+            row, entry = result
+            rows.append(row)
+            if entry is not None and row.get("status") == "ok":
+                done[entry["file"]] = entry
+                _append_manifest(log, entry)
+
+        if n_jobs == 1 or len(payloads) <= 1:
+            for payload in payloads:
+                record(_process_and_record(payload))
+        else:
+            budget = None if cfg.max_memory_gb is None else cfg.max_memory_gb * 2**30
+            _run_scheduled(payloads, min(n_jobs, len(payloads)), budget, record)
+
+    # Compact the log to one entry per current file
+    tmp = manifest_path.with_suffix(".jsonl.tmp")
+    with open(tmp, "w", encoding="utf-8") as fh:
+        for p in files:
+            if p.name in done:
+                fh.write(json.dumps(done[p.name]) + "\n")
+    os.replace(tmp, manifest_path)
 
     # Stable summary order by filename
     rows.sort(key=lambda r: str(r.get("file", "")))
     summary = pd.DataFrame(rows)
-    summary_path = out_dir / "summary.csv"
-    summary.to_csv(summary_path, index=False)
+    if cfg.output_format == "parquet":
+        summary.to_parquet(out_dir / "summary.parquet", index=False, compression="zstd")
+        dataset = out_dir / EVENTS_DATASET
+        current = {p.name for p in files}
+        for partition in dataset.glob("file=*") if dataset.is_dir() else []:
+            if unquote(partition.name.removeprefix("file=")) not in current:
+                shutil.rmtree(partition)
+    else:
+        summary.to_csv(out_dir / "summary.csv", index=False)
 
     metadata = {
         "schema_version": SCHEMA_VERSION,
@@ -189,8 +620,11 @@ def batch_detect(
         "input_dir": str(in_dir.resolve()),
         "output_dir": str(out_dir.resolve()),
         "n_files": len(files),
+        "n_processed": len(payloads),
+        "n_reused": len(files) - len(payloads),
         "n_jobs": n_jobs,
         "config": cfg_dict,
+        "config_hash": cfg_hash,
     }
     (out_dir / "run_metadata.json").write_text(json.dumps(metadata, indent=2), encoding="utf-8")
     return summary
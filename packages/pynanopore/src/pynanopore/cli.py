@@ -17,6 +17,7 @@ from pynanopore import (
     __version__,
     batch_detect,
     load_trace,
+    sweep_thresholds,
 )
 from pynanopore.detection.baseline import (
     ConstantBaseline,
@@ -24,20 +25,24 @@ from pynanopore.detection.baseline import (
     NoneBaseline,
     PercentileBaseline,
 )
+from pynanopore.io.npt import convert_to_npt
 from pynanopore.psd.lorentzian import (
     CompositePSDFitter,
     LorentzianWhiteFitter,
     MultiLorentzianFitter,
 )
+from pynanopore.psd.spectrogram import SPECTROGRAM_PARAMETERS, fit_spectrogram
 
+_PSD_STREAM_BLOCK = 1 << 22  # samples read per chunk by ``psd --stream``
 
-def _make_baseline(name: str, window_s: float, percentile: float = 90.0):
+
+def _make_baseline(name: str, window_s: float, percentile: float = 90.0, engine: str = "exact"):
     if name == "median":
-        return MedianBaseline(window_s=window_s)
+        return MedianBaseline(window_s=window_s, engine=engine)
     if name == "constant":
         return ConstantBaseline()
     if name == "percentile":
-        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5))
+        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5), engine=engine)
     return NoneBaseline()
 
 
@@ -50,7 +55,7 @@ def main(argv: list[str] | None = None) -> int:
     sub = parser.add_subparsers(dest="command", required=True)
 
     detect = sub.add_parser("detect", help="Detect events in a recording")
-    detect.add_argument("file", help="Path to .abf or .csv file")
+    detect.add_argument("file", help="Path to .abf, .csv or .npt file")
     detect.add_argument("--std-multiplier", type=float, default=0.25)
     detect.add_argument("--threshold-multiplier", type=float, default=1.5)
     detect.add_argument("--interval", type=float, default=5.0)
@@ -74,11 +79,37 @@ def main(argv: list[str] | None = None) -> int:
         default=90.0,
         help="Percentile for percentile baseline (use ~10 for upward events)",
     )
+    detect.add_argument(
+        "--baseline-engine",
+        choices=["exact", "decimate"],
+        default="exact",
+        help="Sliding-window engine for median/percentile baselines (decimate: fast, approximate)",
+    )
+    detect.add_argument(
+        "--baseline-scope",
+        choices=["chunk", "trace"],
+        default="chunk",
+        help="Estimate the baseline per chunk or once over the whole trace",
+    )
     detect.add_argument("--no-levels", action="store_true", help="Skip multi-level analysis")
     detect.add_argument("--output", "-o", help="Write events CSV to this path")
+    detect.add_argument(
+        "--n-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for chunk detection (1=serial, -1=all CPUs)",
+    )
+    detect.add_argument(
+        "--dtype",
+        choices=["auto", "float32", "float64"],
+        default="auto",
+        help="Working dtype for samples (auto: float32 for large recordings)",
+    )
 
-    batch = sub.add_parser("batch-detect", help="Detect events for all ABF/CSV files in a folder")
-    batch.add_argument("input_dir", help="Folder containing .abf / .csv recordings")
+    batch = sub.add_parser(
+        "batch-detect", help="Detect events for all ABF/CSV/NPT files in a folder"
+    )
+    batch.add_argument("input_dir", help="Folder containing .abf / .csv / .npt recordings")
     batch.add_argument("-o", "--output-dir", required=True, help="Output directory for results")
     batch.add_argument("--std-multiplier", type=float, default=0.25)
     batch.add_argument("--threshold-multiplier", type=float, default=1.5)
@@ -90,6 +121,18 @@ def main(argv: list[str] | None = None) -> int:
     )
     batch.add_argument("--baseline-window", type=float, default=0.05)
     batch.add_argument("--baseline-percentile", type=float, default=90.0)
+    batch.add_argument(
+        "--baseline-engine",
+        choices=["exact", "decimate"],
+        default="exact",
+        help="Sliding-window engine for median/percentile baselines (decimate: fast, approximate)",
+    )
+    batch.add_argument(
+        "--baseline-scope",
+        choices=["chunk", "trace"],
+        default="chunk",
+        help="Estimate the baseline per chunk or once over the whole trace",
+    )
     batch.add_argument("--no-dwell-fit", action="store_true", help="Skip per-file dwell MLE")
     batch.add_argument("--dwell-fit", choices=["single", "double", "auto"], default="single")
     batch.add_argument("--no-levels", action="store_true")
@@ -99,6 +142,67 @@ def main(argv: list[str] | None = None) -> int:
         default=1,
         help="Parallel workers (1=serial, -1=all CPUs)",
     )
+    batch.add_argument(
+        "--output-format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help="Per-file event CSVs, or one Parquet dataset partitioned by file (needs pyarrow)",
+    )
+    batch.add_argument(
+        "--max-memory-gb",
+        type=float,
+        default=None,
+        help="Start files only while their estimated peak memory fits this budget",
+    )
+    batch.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Reprocess every file instead of reusing unchanged results from manifest.jsonl",
+    )
+    batch.add_argument(
+        "--dtype",
+        choices=["auto", "float32", "float64"],
+        default="auto",
+        help="Working dtype for samples (auto: float32 for large recordings)",
+    )
+
+    sweep = sub.add_parser(
+        "sweep", help="Event counts and dwell/ΔI summaries over a threshold grid"
+    )
+    sweep.add_argument("file", help="Path to .abf, .csv or .npt file")
+    sweep.add_argument("--std-multipliers", type=float, nargs="+", default=[0.25])
+    sweep.add_argument("--threshold-multipliers", type=float, nargs="+", default=[1.5])
+    sweep.add_argument("--min-durations", type=float, nargs="+", default=[1e-4])
+    sweep.add_argument("--interval", type=float, default=5.0)
+    sweep.add_argument("--overlap", type=float, default=0.0)
+    sweep.add_argument("--direction", choices=["down", "up"], default="down")
+    sweep.add_argument(
+        "--baseline", choices=["none", "median", "constant", "percentile"], default="none"
+    )
+    sweep.add_argument("--baseline-window", type=float, default=0.05)
+    sweep.add_argument("--baseline-percentile", type=float, default=90.0)
+    sweep.add_argument("--baseline-engine", choices=["exact", "decimate"], default="exact")
+    sweep.add_argument("--baseline-scope", choices=["chunk", "trace"], default="chunk")
+    sweep.add_argument("--dtype", choices=["auto", "float32", "float64"], default="auto")
+    sweep.add_argument("--output", "-o", help="Write the sweep table CSV to this path")
+
+    convert = sub.add_parser(
+        "convert", help="Convert an ABF/CSV recording to the memory-mappable .npt format"
+    )
+    convert.add_argument("file", help="Path to .abf or .csv file")
+    convert.add_argument("--output", "-o", help="Output path (default: <file>.npt)")
+    convert.add_argument("--sweep", type=int, default=0, help="ABF sweep index")
+    convert.add_argument("--channel", type=int, default=0, help="ABF channel index")
+    convert.add_argument(
+        "--dtype",
+        choices=["float32", "float64"],
+        default=None,
+        help="Store scaled samples with this dtype (default: raw int16 for ABF, float64 for CSV)",
+    )
+    convert.add_argument(
+        "--no-invert", action="store_true", help="Keep negative open-pore polarity as recorded"
+    )
+    convert.add_argument("--sample-rate", type=float, default=None, help="Sample rate for CSV")
 
     dwell = sub.add_parser("dwelltime", help="Fit dwell-time histogram from events CSV")
     dwell.add_argument("events_csv", help="CSV with a 'difference' column")
@@ -106,10 +210,27 @@ def main(argv: list[str] | None = None) -> int:
     dwell.add_argument("--method", choices=["mle", "histogram"], default="mle")
     dwell.add_argument("--binning", choices=["linear", "log"], default="linear")
     dwell.add_argument("--bins", type=int, default=50)
+    dwell.add_argument(
+        "--ci",
+        type=float,
+        default=None,
+        help="Bootstrap confidence level for the parameters, e.g. 0.95 (MLE only)",
+    )
+    dwell.add_argument("--n-boot", type=int, default=1000, help="Bootstrap resamples")
+    dwell.add_argument("--seed", type=int, default=None, help="Bootstrap random seed")
+    dwell.add_argument(
+        "--n-jobs", type=int, default=1, help="Processes for bootstrap refits (-1 = all CPUs)"
+    )
 
     psd = sub.add_parser("psd", help="Compute PSD (+ optional model fit)")
-    psd.add_argument("file", help="Path to .abf or .csv file")
+    psd.add_argument("file", help="Path to .abf, .csv or .npt file")
     psd.add_argument("--fs", type=float, default=None, help="Override sample rate")
+    psd.add_argument(
+        "--dtype",
+        choices=["auto", "float32", "float64"],
+        default="auto",
+        help="Working dtype for samples (auto: float32 for large recordings)",
+    )
     psd.add_argument("--fit", action="store_true", help="Fit a spectral model")
     psd.add_argument(
         "--fit-model",
@@ -121,20 +242,63 @@ def main(argv: list[str] | None = None) -> int:
     psd.add_argument("--window", default="hamming")
     psd.add_argument("--scaling", choices=["spectrum", "density"], default="spectrum")
     psd.add_argument("--max-frequency", type=float, default=10000.0)
+    psd.add_argument(
+        "--log-bins",
+        type=int,
+        default=None,
+        metavar="PER_DECADE",
+        help="Fit log-frequency bin averages instead of every bin (diagnostics stay full-resolution)",
+    )
+    psd.add_argument(
+        "--stream",
+        action="store_true",
+        help="Memory-map the recording and average Welch segments chunk by chunk "
+        "(--nperseg defaults to 16384)",
+    )
+    psd.add_argument(
+        "--spectrogram",
+        type=float,
+        default=None,
+        metavar="WINDOW_S",
+        help="Fit the model in sliding windows of this length (s) and output a table of "
+        "t, S0, fc and diagnostics (models: lorentzian, lorentzian_white, composite)",
+    )
+    psd.add_argument(
+        "--step", type=float, default=None, help="Spectrogram window step in s (default: window)"
+    )
+    psd.add_argument(
+        "--no-warm-start",
+        action="store_true",
+        help="Fit every spectrogram window from the default initial guess",
+    )
+    psd.add_argument(
+        "--n-jobs", type=int, default=1, help="Processes for spectrogram fits (-1 = all CPUs)"
+    )
+    psd.add_argument("-o", "--output", default=None, help="Spectrogram CSV output path")
 
     args = parser.parse_args(argv)
 
     if args.command == "detect":
-        trace = load_trace(args.file)
+        trace = load_trace(args.file, mmap=True, dtype=args.dtype)
         detector = EventDetector(
             std_multiplier=args.std_multiplier,
             threshold_multiplier=args.threshold_multiplier,
             direction=args.direction,
-            baseline=_make_baseline(args.baseline, args.baseline_window, args.baseline_percentile),
+            baseline=_make_baseline(
+                args.baseline, args.baseline_window, args.baseline_percentile, args.baseline_engine
+            ),
             analyze_levels=not args.no_levels,
+            dtype=args.dtype,
+        )
+        events = detector.detect_trace(
+            trace,
+            interval_length=args.interval,
+            overlap=args.overlap,
+            baseline_scope=args.baseline_scope,
+            n_jobs=args.n_jobs,
+            as_table=True,
         )
-        events = detector.detect_trace(trace, interval_length=args.interval, overlap=args.overlap)
-        df = pd.DataFrame([e.to_dict() for e in events])
+        df = events.to_pandas()
         if args.output:
             df.to_csv(args.output, index=False)
             print(f"Wrote {len(df)} events to {args.output}")
@@ -150,36 +314,133 @@ def main(argv: list[str] | None = None) -> int:
             baseline=args.baseline,
             baseline_window=args.baseline_window,
             baseline_percentile=args.baseline_percentile,
+            baseline_engine=args.baseline_engine,
+            baseline_scope=args.baseline_scope,
             interval_length=args.interval,
             overlap=args.overlap,
             fit_dwelltime=not args.no_dwell_fit,
             dwell_fit_type=args.dwell_fit,
             analyze_levels=not args.no_levels,
             n_jobs=args.n_jobs,
+            dtype=args.dtype,
+            max_memory_gb=args.max_memory_gb,
+            output_format=args.output_format,
         )
-        summary = batch_detect(args.input_dir, args.output_dir, cfg)
+        summary = batch_detect(args.input_dir, args.output_dir, cfg, resume=not args.no_resume)
         ok = int((summary["status"] == "ok").sum()) if "status" in summary.columns else 0
-        print(f"Processed {len(summary)} files ({ok} ok). Summary: {args.output_dir}/summary.csv")
+        print(
+            f"Processed {len(summary)} files ({ok} ok). "
+            f"Summary: {args.output_dir}/summary.{args.output_format}"
+        )
+        return 0
+
+    if args.command == "sweep":
+        trace = load_trace(args.file, mmap=True, dtype=args.dtype)
+        detector = EventDetector(
+            direction=args.direction,
+            baseline=_make_baseline(
+                args.baseline, args.baseline_window, args.baseline_percentile, args.baseline_engine
+            ),
+            dtype=args.dtype,
+        )
+        table = sweep_thresholds(
+            trace,
+            {
+                "std_multiplier": args.std_multipliers,
+                "threshold_multiplier": args.threshold_multipliers,
+                "min_duration": args.min_durations,
+            },
+            detector=detector,
+            interval_length=args.interval,
+            overlap=args.overlap,
+            baseline_scope=args.baseline_scope,
+        )
+        if args.output:
+            table.to_csv(args.output, index=False)
+            print(f"Wrote {len(table)} grid points to {args.output}")
+        else:
+            print(table.to_string(index=False))
+        return 0
+
+    if args.command == "convert":
+        out = convert_to_npt(
+            args.file,
+            args.output,
+            sweep=args.sweep,
+            channel=args.channel,
+            invert_negative=not args.no_invert,
+            dtype=args.dtype,
+            sample_rate=args.sample_rate,
+        )
+        cached = load_trace(out, mmap=True)
+        print(
+            f"Wrote {len(cached.current)} samples at {cached.sample_rate:g} Hz to {out} "
+            f"({out.stat().st_size / 1e6:.1f} MB)"
+        )
         return 0
 
     if args.command == "dwelltime":
         events_df = pd.read_csv(args.events_csv)
         fit = DwellTimeExponentialFit(events_df, bins=args.bins, binning=args.binning)
-        result = fit.fit(args.fit, method=args.method)
+        result = fit.fit(
+            args.fit,
+            method=args.method,
+            ci=args.ci,
+            n_boot=args.n_boot,
+            seed=args.seed,
+            n_jobs=args.n_jobs,
+        )
         print(json.dumps(result.to_dict(), indent=2))
         return 0
 
     if args.command == "psd":
-        trace = load_trace(args.file)
+        spectrogram_mode = args.spectrogram is not None
+        trace = load_trace(args.file, mmap=args.stream or spectrogram_mode, dtype=args.dtype)
         fs = args.fs if args.fs is not None else trace.sample_rate
-        analyzer = PSDAnalyzer(fs=fs)
-        frequencies, power_spectrum = analyzer.compute_psd(
-            trace.current,
-            nperseg=args.nperseg,
-            noverlap=args.noverlap,
-            window=args.window,
-            scaling=args.scaling,
-        )
+        analyzer = PSDAnalyzer(fs=fs, dtype=args.dtype)
+        if spectrogram_mode:
+            if args.fit_model not in SPECTROGRAM_PARAMETERS:
+                parser.error(f"--spectrogram supports --fit-model {sorted(SPECTROGRAM_PARAMETERS)}")
+            spec = analyzer.compute_spectrogram(
+                trace.current,
+                args.spectrogram,
+                args.step,
+                nperseg=args.nperseg,
+                noverlap=args.noverlap,
+                window=args.window,
+                scaling=args.scaling,
+            )
+            table = fit_spectrogram(
+                spec,
+                model=args.fit_model,
+                max_frequency=args.max_frequency,
+                warm_start=not args.no_warm_start,
+                n_jobs=args.n_jobs,
+                log_bins=args.log_bins,
+            )
+            if args.output:
+                table.to_csv(args.output, index=False)
+                print(f"Wrote {len(table)} windows to {args.output}")
+            else:
+                print(table.to_string(index=False))
+            return 0
+        if args.stream:
+            n = len(trace.current)
+            frequencies, power_spectrum = analyzer.compute_psd_chunks(
+                (trace.current[s : s + _PSD_STREAM_BLOCK] for s in range(0, n, _PSD_STREAM_BLOCK)),
+                nperseg=args.nperseg,
+                noverlap=args.noverlap,
+                window=args.window,
+                scaling=args.scaling,
+            )
+        else:
+            frequencies, power_spectrum = analyzer.compute_psd(
+                trace.current,
+                nperseg=args.nperseg,
+                noverlap=args.noverlap,
+                window=args.window,
+                scaling=args.scaling,
+            )
         psd_result: dict = {
             "n_frequencies": len(frequencies),
             "fs": fs,
@@ -195,12 +456,18 @@ def main(argv: list[str] | None = None) -> int:
             )
             if args.fit_model == "composite":
                 fitter = CompositePSDFitter(
-                    frequencies, power_spectrum, max_frequency=args.max_frequency
+                    frequencies,
+                    power_spectrum,
+                    max_frequency=args.max_frequency,
+                    log_bins=args.log_bins,
                 )
                 psd_result.update(fitter.fit())
             elif args.fit_model == "lorentzian_white":
                 fitter = LorentzianWhiteFitter(
-                    frequencies, power_spectrum, max_frequency=args.max_frequency
+                    frequencies,
+                    power_spectrum,
+                    max_frequency=args.max_frequency,
+                    log_bins=args.log_bins,
                 )
                 psd_result.update(fitter.fit())
             elif args.fit_model == "double_lorentzian":
@@ -210,11 +477,15 @@ def main(argv: list[str] | None = None) -> int:
                     n_components=2,
                     include_white=True,
                     max_frequency=args.max_frequency,
+                    log_bins=args.log_bins,
                 )
                 psd_result.update(fitter.fit())
             else:
                 fitter = LorentzianFitter(
-                    frequencies, power_spectrum, max_frequency=args.max_frequency
+                    frequencies,
+                    power_spectrum,
+                    max_frequency=args.max_frequency,
+                    log_bins=args.log_bins,
                 )
                 s0, fc = fitter.fit_lorentzian()
                 psd_result["S0"] = s0
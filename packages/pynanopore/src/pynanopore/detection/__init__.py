@@ -6,16 +6,28 @@ from pynanopore.detection.baseline import (
     MedianBaseline,
     NoneBaseline,
     PercentileBaseline,
+    estimate_trace_baseline,
 )
 from pynanopore.detection.chunking import ChunkGenerator, CreatingChunks
-from pynanopore.detection.events import Event, EventDetection, EventDetector
+from pynanopore.detection.events import (
+    Event,
+    EventDetection,
+    EventDetector,
+    EventRow,
+    EventTable,
+)
+from pynanopore.detection.idealized import IdealizedTrace
 from pynanopore.detection.levels import (
     LevelAssignment,
+    LevelBatch,
     LevelFeatures,
     analyze_event_levels,
+    assign_levels_batch,
     idealize_multilevel,
 )
 from pynanopore.detection.pulse_shape import PulseShapeIdealizer, PulseShapeResult
+from pynanopore.detection.streaming import StreamingEventDetector
+from pynanopore.detection.sweep import sweep_thresholds
 
 __all__ = [
     "BaselineEstimator",
@@ -23,15 +35,23 @@ __all__ = [
     "ConstantBaseline",
     "MedianBaseline",
     "PercentileBaseline",
+    "estimate_trace_baseline",
     "ChunkGenerator",
     "CreatingChunks",
     "Event",
     "EventDetector",
     "EventDetection",
+    "EventTable",
+    "EventRow",
+    "StreamingEventDetector",
+    "sweep_thresholds",
     "LevelFeatures",
     "LevelAssignment",
+    "LevelBatch",
     "analyze_event_levels",
+    "assign_levels_batch",
     "idealize_multilevel",
+    "IdealizedTrace",
     "PulseShapeIdealizer",
     "PulseShapeResult",
 ]
@@ -25,7 +25,12 @@ class ChunkGenerator:
     def generate(
         self, current: NDArray[np.floating], time: NDArray[np.floating]
     ) -> Iterator[tuple[NDArray[np.floating], NDArray[np.floating]]]:
-        """Yield ``(current_chunk, time_chunk)`` pairs."""
+        """Yield ``(current_chunk, time_chunk)`` pairs.
+
+        ``current`` / ``time`` may be lazy array-likes (e.g. from
+        :class:`~pynanopore.io.abf_mmap.MemmapABFReader`); only one window is
+        materialized at a time.
+        """
         step = self.points_per_interval
         for start in range(0, len(current), step):
             end = start + step
@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, fields
-from typing import Literal
+from typing import Any, Literal, overload
 
 import numpy as np
 from numpy.typing import NDArray
 
-from pynanopore.detection.baseline import BaselineEstimator, NoneBaseline, residual_current
-from pynanopore.detection.levels import analyze_event_levels
-from pynanopore.io.trace import Trace
+from pynanopore._dtypes import WorkingDType, as_working_array
+from pynanopore.detection.baseline import (
+    BaselineEstimator,
+    NoneBaseline,
+    estimate_trace_baseline,
+    residual_current,
+)
+from pynanopore.detection.levels import (
+    LEVEL_FIELDS,
+    LevelBatch,
+    _levels_from_segments,
+    analyze_event_levels,
+)
+from pynanopore.detection.parallel import detect_chunks_parallel, resolve_n_jobs
+from pynanopore.io.trace import Trace, UniformTime
 
 EventDirection = Literal["down", "up"]
+DetectionEngine = Literal["numpy", "python"]
+BaselineScope = Literal["chunk", "trace"]
+
+# Open events longer than this are dropped by streaming detection (clogs, baseline drift)
+DEFAULT_MAX_EVENT_S = 60.0
 
 
 @dataclass
@@ -61,6 +79,144 @@ class Event:
         return out
 
 
+EVENT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Event))
+_INT_FIELDS = frozenset({"start_idx", "end_idx"})
+_FIELD_DEFAULTS: dict[str, Any] = {f.name: f.default for f in fields(Event)}
+
+
+def _field_dtype(name: str) -> type:
+    return np.int64 if name in _INT_FIELDS else np.float64
+
+
+class EventRow:
+    """Row view into an :class:`EventTable` that reads and writes through like an ``Event``."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: EventTable, index: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, name: str) -> Any:
+        columns = self._table.columns
+        if name in columns:
+            return columns[name][self._index].item()
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._table.columns:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        self._table.columns[name][self._index] = value
+
+    def __repr__(self) -> str:
+        body = ", ".join(f"{name}={getattr(self, name)!r}" for name in EVENT_FIELDS)
+        return f"EventRow({body})"
+
+    def to_dict(self) -> dict[str, float]:
+        return {name: float(col[self._index]) for name, col in self._table.columns.items()}
+
+    def to_event(self) -> Event:
+        """Materialize this row as a standalone :class:`Event`."""
+        return Event(**{name: col[self._index].item() for name, col in self._table.columns.items()})
+
+
+@dataclass
+class EventTable:
+    """Struct-of-arrays event container: one NumPy array per :class:`Event` field.
+
+    Avoids per-event object churn for large detections. ``to_pandas()`` wraps the
+    arrays without copying; iterating or indexing by ``int`` yields :class:`EventRow`
+    views that expose the same attributes and ``to_dict()`` as ``Event``.
+
+    ``levels`` caches the per-sample level labels computed during detection, so
+    :func:`~pynanopore.detection.levels.idealize_multilevel` does not cluster the
+    events again. It follows slicing and concatenation and is dropped whenever it
+    cannot be kept consistent with the rows.
+    """
+
+    columns: dict[str, NDArray[Any]]
+    levels: LevelBatch | None = None
+
+    def __post_init__(self) -> None:
+        missing = [name for name in EVENT_FIELDS if name not in self.columns]
+        if missing:
+            raise ValueError(f"EventTable is missing columns: {missing}")
+        lengths = {len(self.columns[name]) for name in EVENT_FIELDS}
+        if len(lengths) > 1:
+            raise ValueError("EventTable columns must all have the same length")
+        self.columns = {
+            name: np.asarray(self.columns[name], dtype=_field_dtype(name)) for name in EVENT_FIELDS
+        }
+        if self.levels is not None and len(self.levels) != lengths.pop():
+            raise ValueError("EventTable levels must have one entry per event")
+
+    @classmethod
+    def empty(cls) -> EventTable:
+        return cls({name: np.empty(0, dtype=_field_dtype(name)) for name in EVENT_FIELDS})
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event | EventRow]) -> EventTable:
+        items = list(events)
+        return cls(
+            {
+                name: np.fromiter(
+                    (getattr(e, name) for e in items), dtype=_field_dtype(name), count=len(items)
+                )
+                for name in EVENT_FIELDS
+            }
+        )
+
+    @classmethod
+    def concat(cls, tables: Sequence[EventTable]) -> EventTable:
+        if not tables:
+            return cls.empty()
+        # Empty tables carry no labels; any other table without them drops the cache
+        filled = [t.levels for t in tables if len(t)]
+        levels = None
+        if filled and all(b is not None for b in filled):
+            levels = LevelBatch.concat(filled)  # type: ignore[arg-type]
+        return cls(
+            {name: np.concatenate([t.columns[name] for t in tables]) for name in EVENT_FIELDS},
+            levels=levels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.columns["start_idx"])
+
+    def __iter__(self) -> Iterator[EventRow]:
+        return (EventRow(self, i) for i in range(len(self)))
+
+    @overload
+    def __getitem__(self, key: int) -> EventRow: ...
+
+    @overload
+    def __getitem__(self, key: slice | NDArray[Any]) -> EventTable: ...
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            idx = int(key) + n if key < 0 else int(key)
+            if not 0 <= idx < n:
+                raise IndexError("EventTable index out of range")
+            return EventRow(self, idx)
+        return EventTable(
+            {name: col[key] for name, col in self.columns.items()},
+            levels=None if self.levels is None else self.levels.take(key),
+        )
+
+    def to_events(self) -> list[Event]:
+        return [row.to_event() for row in self]
+
+    def to_dicts(self) -> list[dict[str, float]]:
+        return [row.to_dict() for row in self]
+
+    def to_pandas(self):
+        """Return a DataFrame whose columns share memory with this table."""
+        import pandas as pd
+
+        return pd.DataFrame(self.columns, copy=False)
+
+
 def _transition_times(
     segment: NDArray[np.floating],
     time_segment: NDArray[np.floating],
@@ -110,7 +266,7 @@ def _build_event(
     baseline_value: float,
     analyze_levels: bool = True,
 ) -> Event:
-    segment = current[start_idx : end_idx + 1]
+    segment = np.asarray(current[start_idx : end_idx + 1], dtype=float)
     time_segment = time[start_idx : end_idx + 1]
     start_time = float(time[start_idx])
     end_time = float(time[end_idx])
@@ -167,6 +323,244 @@ def _build_event(
     )
 
 
+def _segment_reduce(
+    ufunc: np.ufunc, values: NDArray[Any], offsets: NDArray[np.intp]
+) -> NDArray[Any]:
+    """Apply ``ufunc.reduceat`` over contiguous, non-empty segments starting at ``offsets``."""
+    return ufunc.reduceat(values, offsets) if len(offsets) else values[:0]
+
+
+def _build_event_table(
+    *,
+    current: NDArray[np.floating],
+    time: NDArray[np.floating],
+    starts: NDArray[np.intp],
+    ends: NDArray[np.intp],
+    direction: EventDirection,
+    sample_rate: float,
+    baseline_values: NDArray[np.floating],
+    analyze_levels: bool = True,
+    index_offset: int = 0,
+) -> EventTable:
+    """Vectorized :func:`_build_event` over all ``(start, end)`` pairs of one chunk.
+
+    Event samples are gathered into one flat array and every per-event feature is a
+    segment reduction (``reduceat``) over it, including the first/last 10–90%
+    crossing indices used for rise and fall times.
+    """
+    n_events = len(starts)
+    if n_events == 0:
+        return EventTable.empty()
+    starts = np.asarray(starts, dtype=np.intp)
+    ends = np.asarray(ends, dtype=np.intp)
+    lengths = ends - starts + 1
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.intp)
+    total = int(lengths.sum())
+    event_id = np.repeat(np.arange(n_events), lengths)
+    flat_idx = np.arange(total, dtype=np.intp) + np.repeat(starts - offsets, lengths)
+    # Gather in the working dtype, accumulate features in float64
+    values = np.asarray(current)[flat_idx].astype(float)
+
+    start_time = time[starts]
+    end_time = time[ends]
+    dwell = end_time - start_time
+
+    i0 = np.asarray(baseline_values, dtype=float)
+    blockade_mean = _segment_reduce(np.add, values, offsets) / lengths
+    blockade_min = _segment_reduce(np.minimum, values, offsets)
+    blockade_max = _segment_reduce(np.maximum, values, offsets)
+    amplitude = blockade_min if direction == "down" else blockade_max
+    delta_i = np.abs(i0 - blockade_mean)
+    abs_i0 = np.abs(i0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta_i_over_i0 = np.where(abs_i0 > 1e-12, delta_i / abs_i0, np.nan)
+
+    abs_dev = _segment_reduce(np.add, np.abs(i0[event_id] - values), offsets)
+    if sample_rate > 0:
+        area = abs_dev * (1.0 / sample_rate)
+    else:
+        dts = np.array(
+            [
+                float(np.median(np.diff(time[s : e + 1]))) if e > s else 0.0
+                for s, e in zip(starts, ends, strict=True)
+            ]
+        )
+        area = abs_dev * dts
+
+    # 10–90% transitions: same rules as _transition_times, as segment min/max of indices
+    depth = blockade_mean - i0
+    valid = (lengths >= 3) & (np.abs(depth) >= 1e-12)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frac = (values - i0[event_id]) / depth[event_id]
+    pos = np.arange(total, dtype=np.intp)
+    none_first = np.intp(total)
+    first_lo = _segment_reduce(np.minimum, np.where(frac >= 0.1, pos, none_first), offsets)
+    first_hi = _segment_reduce(np.minimum, np.where(frac >= 0.9, pos, none_first), offsets)
+    last_hi = _segment_reduce(np.maximum, np.where(frac >= 0.9, pos, -1), offsets)
+    fall_lo_mask = (frac <= 0.1) & (pos <= last_hi[event_id])
+    last_lo = _segment_reduce(np.maximum, np.where(fall_lo_mask, pos, -1), offsets)
+
+    has_rise = valid & (first_lo < total) & (first_hi < total) & (first_hi >= first_lo)
+    has_fall = valid & (last_hi >= 0) & (last_lo >= 0)
+    rise = np.zeros(n_events, dtype=float)
+    fall = np.zeros(n_events, dtype=float)
+    rise[has_rise] = time[flat_idx[first_hi[has_rise]]] - time[flat_idx[first_lo[has_rise]]]
+    fall[has_fall] = np.abs(time[flat_idx[last_lo[has_fall]]] - time[flat_idx[last_hi[has_fall]]])
+
+    columns: dict[str, NDArray[Any]] = {
+        "start_time": start_time,
+        "end_time": end_time,
+        "difference": dwell,
+        "amplitude": amplitude,
+        "dwell_time": dwell,
+        "i0": i0,
+        "blockade_mean": blockade_mean,
+        "blockade_min": blockade_min,
+        "blockade_max": blockade_max,
+        "delta_i": delta_i,
+        "delta_i_over_i0": delta_i_over_i0,
+        "area": area,
+        "rise_time": np.maximum(0.0, rise),
+        "fall_time": np.maximum(0.0, fall),
+        "start_idx": starts + index_offset,
+        "end_idx": ends + index_offset,
+    }
+
+    levels = None
+    if analyze_levels:
+        levels = _levels_from_segments(values, lengths, i0)
+        columns.update(levels.features)
+    else:
+        for name in LEVEL_FIELDS:
+            columns[name] = np.full(n_events, _FIELD_DEFAULTS[name], dtype=float)
+        columns["n_levels"] = np.ones(n_events, dtype=float)
+        columns["level1_current"] = blockade_mean
+        columns["level1_fraction"] = np.ones(n_events, dtype=float)
+
+    return EventTable(columns, levels=levels)
+
+
+def _find_event_bounds_python(
+    work: NDArray[np.floating],
+    entry: float,
+    deep: float,
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Reference sample-by-sample state machine; returns confirmed ``(starts, ends)``."""
+    bounds: list[tuple[int, int]] = []
+    start_idx: int | None = None
+    crossed_deep = False
+
+    for i in range(1, len(work)):
+        if work[i] < entry and work[i - 1] >= entry:
+            start_idx = i
+            crossed_deep = False
+
+        if start_idx is not None and work[i] < deep:
+            crossed_deep = True
+
+        if start_idx is not None and work[i] >= entry and work[i - 1] < entry:
+            if crossed_deep:
+                bounds.append((start_idx, i))
+            start_idx = None
+            crossed_deep = False
+
+    if not bounds:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    starts, ends = zip(*bounds, strict=True)
+    return np.asarray(starts, dtype=np.intp), np.asarray(ends, dtype=np.intp)
+
+
+def _find_event_bounds_numpy(
+    work: NDArray[np.floating],
+    entry: float,
+    deep: float,
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Vectorized equivalent of :func:`_find_event_bounds_python`.
+
+    Entry/exit crossings are found from sign changes of ``work - entry``; each exit
+    is paired with the latest entry that has not already been closed, and the
+    deep-threshold confirmation over ``[start, end]`` uses a cumulative count.
+    """
+    starts, ends, _ = _scan_event_bounds(work, entry, deep, _CrossingState())
+    return starts, ends
+
+
+@dataclass
+class _CrossingState:
+    """State machine position carried from one chunk of a stream to the next."""
+
+    prev_work: float | None = None  # last work sample of the previous chunk
+    open_start: int | None = None  # absolute index of an event that has not closed yet
+    crossed_deep: bool = False
+
+
+def _scan_event_bounds(
+    work: NDArray[np.floating],
+    entry: float,
+    deep: float,
+    state: _CrossingState,
+    offset: int = 0,
+) -> tuple[NDArray[np.intp], NDArray[np.intp], _CrossingState]:
+    """Find confirmed ``(starts, ends)`` in ``work`` continuing from ``state``.
+
+    Indices are absolute (``offset`` is the index of ``work[0]``). A carried open
+    event is represented by a virtual start before the chunk so its exit pairs with
+    it exactly as the sample loop would.
+    """
+    work = np.asarray(work)
+    none = np.empty(0, dtype=np.intp)
+    shift = 0 if state.prev_work is None else 1
+    ext = work if shift == 0 else np.concatenate(([state.prev_work], work))
+    carried = state.open_start is not None
+    if len(work) == 0 or len(ext) < 2:
+        prev = state.prev_work if len(work) == 0 else float(work[-1])
+        return none, none, _CrossingState(prev, state.open_start, state.crossed_deep)
+
+    below = ext < entry
+    above = ext >= entry
+    starts = np.flatnonzero(below[1:] & above[:-1]) + 1
+    ends = np.flatnonzero(above[1:] & below[:-1]) + 1
+    if carried:
+        starts = np.concatenate(([-1], starts))
+
+    # Deep-threshold visits; the carried sample was already checked in its own chunk
+    deep_mask = ext < deep
+    if shift:
+        deep_mask[0] = False
+    deep_count = np.concatenate(([0], np.cumsum(deep_mask)))
+
+    pair_starts, pair_ends = none, none
+    if len(starts) and len(ends):
+        # Latest start strictly before each end; it is still open only if the previous
+        # end came before it (otherwise that start was already closed or superseded).
+        j = np.searchsorted(starts, ends, side="left") - 1
+        prev_end = np.concatenate(([-2], ends[:-1]))
+        valid = j >= 0
+        j_safe = np.where(valid, j, 0)
+        valid &= prev_end < starts[j_safe]
+        pair_starts = starts[j_safe[valid]]
+        pair_ends = ends[valid]
+
+    # Deep-threshold visit anywhere in [start, end] (inclusive, as in the loop)
+    virtual = pair_starts < 0
+    confirmed = deep_count[pair_ends + 1] - deep_count[np.maximum(pair_starts, 0)] > 0
+    confirmed |= virtual & state.crossed_deep
+
+    # Whatever start follows the last end is still open at the end of this chunk
+    next_state = _CrossingState(prev_work=float(ext[-1]))
+    if len(starts) and (not len(ends) or starts[-1] > ends[-1]):
+        last = int(starts[-1])
+        deep_tail = deep_count[-1] - deep_count[max(last, 0)] > 0
+        next_state.crossed_deep = bool(deep_tail or (last < 0 and state.crossed_deep))
+        next_state.open_start = state.open_start if last < 0 else offset + last - shift
+
+    abs_starts = (pair_starts + offset - shift).astype(np.intp)
+    if carried:
+        abs_starts[virtual] = state.open_start
+    abs_ends = (pair_ends + offset - shift).astype(np.intp)
+    return abs_starts[confirmed], abs_ends[confirmed], next_state
+
+
 class EventDetector:
     """
     Dual-threshold event detector with optional baseline correction and polarity.
@@ -174,6 +568,14 @@ class EventDetector:
     Detection runs on a canonical residual where events are **downward**. For
     ``direction='up'`` (pulses above baseline, as in many Axon recordings with
     negative open-pore current), the residual is sign-flipped before thresholding.
+
+    ``engine='numpy'`` (default) finds threshold crossings with vectorized NumPy;
+    ``engine='python'`` keeps the original sample-by-sample loop as a reference.
+
+    ``dtype`` is the working dtype of raw current, baseline and residual: ``'auto'``
+    keeps float32 input (e.g. from :func:`load_trace` on a large recording) as
+    float32, ``'float32'`` / ``'float64'`` force it. Thresholds and event features
+    are always accumulated in float64.
     """
 
     def __init__(
@@ -186,11 +588,17 @@ class EventDetector:
         baseline: BaselineEstimator | None = None,
         sample_rate: float | None = None,
         analyze_levels: bool = True,
+        engine: DetectionEngine = "numpy",
+        dtype: WorkingDType = "auto",
     ):
         if std_multiplier < 0 or threshold_multiplier < 0:
             raise ValueError("multipliers must be non-negative")
         if min_duration < 0:
             raise ValueError("min_duration must be non-negative")
+        if engine not in ("numpy", "python"):
+            raise ValueError("engine must be 'numpy' or 'python'")
+        if dtype not in ("auto", "float32", "float64"):
+            raise ValueError("dtype must be 'auto', 'float32' or 'float64'")
         self.std_multiplier = float(std_multiplier)
         self.threshold_multiplier = float(threshold_multiplier)
         self.min_duration = float(min_duration)
@@ -198,24 +606,56 @@ class EventDetector:
         self.baseline: BaselineEstimator = baseline if baseline is not None else NoneBaseline()
         self.sample_rate = sample_rate
         self.analyze_levels = bool(analyze_levels)
+        self.engine: DetectionEngine = engine
+        self.dtype: WorkingDType = dtype
 
     def _prepare_signal(
         self,
         current: NDArray[np.floating],
         sample_rate: float,
+        baseline: NDArray[np.floating] | None = None,
     ) -> tuple[NDArray[np.floating], NDArray[np.floating], NDArray[np.floating]]:
-        """Return ``(work_signal, baseline, raw_current)`` with events downward on work_signal."""
-        raw = np.asarray(current, dtype=float)
-        if isinstance(self.baseline, NoneBaseline):
-            baseline = np.full_like(raw, float(np.mean(raw)))
+        """Return ``(work_signal, baseline, raw_current)`` with events downward on work_signal.
+
+        A precomputed ``baseline`` (e.g. a slice of a whole-trace baseline) is used as is
+        instead of estimating one for this chunk.
+        """
+        raw = as_working_array(current, self.dtype)
+        if baseline is not None:
+            if len(baseline) != len(raw):
+                raise ValueError("baseline and current must have the same length")
+            baseline = np.asarray(baseline).astype(raw.dtype, copy=False)
+            residual = residual_current(raw, baseline)
+        elif isinstance(self.baseline, NoneBaseline):
+            baseline = np.full_like(raw, float(np.mean(raw, dtype=np.float64)))
             residual = raw - baseline
         else:
-            baseline = np.asarray(self.baseline.estimate(raw, sample_rate), dtype=float)
+            baseline = np.asarray(self.baseline.estimate(raw, sample_rate)).astype(
+                raw.dtype, copy=False
+            )
             residual = residual_current(raw, baseline)
 
         work = residual if self.direction == "down" else -residual
         return work, baseline, raw
 
+    def stream(
+        self,
+        sample_rate: float | None = None,
+        *,
+        t0: float = 0.0,
+        baseline_context_s: float | None = None,
+        max_event_s: float | None = DEFAULT_MAX_EVENT_S,
+    ):
+        """Return a :class:`StreamingEventDetector` sharing this detector's settings."""
+        from pynanopore.detection.streaming import StreamingEventDetector
+
+        fs = sample_rate or self.sample_rate
+        if fs is None:
+            raise ValueError("sample_rate is required for streaming detection")
+        return StreamingEventDetector(
+            self, fs, t0=t0, baseline_context_s=baseline_context_s, max_event_s=max_event_s
+        )
+
     def detect_events(
         self,
         data_chunk: NDArray[np.floating],
@@ -225,72 +665,84 @@ class EventDetector:
         index_offset: int = 0,
     ) -> list[Event]:
         """Detect events in a single chunk; returns Event objects with rich features."""
+        return self._detect_chunk(
+            data_chunk, data_time, sample_rate=sample_rate, index_offset=index_offset
+        ).to_events()
+
+    def _detect_chunk(
+        self,
+        data_chunk: NDArray[np.floating],
+        data_time: NDArray[np.floating],
+        *,
+        sample_rate: float | None = None,
+        index_offset: int = 0,
+        baseline: NDArray[np.floating] | None = None,
+    ) -> EventTable:
         if len(data_chunk) < 2:
-            return []
+            return EventTable.empty()
         if len(data_chunk) != len(data_time):
             raise ValueError("data_chunk and data_time must have the same length")
 
         fs = sample_rate or self.sample_rate
+        if fs is None and isinstance(data_time, UniformTime):
+            fs = 1.0 / data_time.dt
         if fs is None:
             diffs = np.diff(np.asarray(data_time, dtype=float))
             fs = float(1.0 / np.median(diffs)) if len(diffs) and np.median(diffs) > 0 else 1.0
 
-        work, baseline, raw = self._prepare_signal(data_chunk, fs)
-        mean = float(np.mean(work))
-        std_dev = float(np.std(work))
+        work, baseline, raw = self._prepare_signal(data_chunk, fs, baseline)
+        mean = float(np.mean(work, dtype=np.float64))
+        std_dev = float(np.std(work, dtype=np.float64))
         if std_dev == 0:
-            return []
+            return EventTable.empty()
 
         # On the canonical (downward) work signal, thresholds are below the mean
         entry = mean - self.std_multiplier * std_dev
         deep = mean - self.threshold_multiplier * std_dev
 
-        events: list[Event] = []
-        start_time: float | None = None
-        start_idx: int | None = None
-        crossed_deep = False
-
-        for i in range(1, len(work)):
-            if work[i] < entry and work[i - 1] >= entry:
-                start_time = float(data_time[i])
-                start_idx = i
-                crossed_deep = False
-
-            if start_time is not None and work[i] < deep:
-                crossed_deep = True
-
-            if (
-                start_time is not None
-                and start_idx is not None
-                and work[i] >= entry
-                and work[i - 1] < entry
-            ):
-                if crossed_deep:
-                    end_idx = i
-                    duration = float(data_time[end_idx]) - start_time
-                    if duration >= self.min_duration:
-                        # Local open-pore estimate: baseline at event start (or mean of nearby baseline)
-                        i0_local = float(baseline[start_idx])
-                        events.append(
-                            _build_event(
-                                current=raw,
-                                time=np.asarray(data_time, dtype=float),
-                                start_idx=start_idx,
-                                end_idx=end_idx,
-                                direction=self.direction,
-                                sample_rate=fs,
-                                baseline_value=i0_local,
-                                analyze_levels=self.analyze_levels,
-                            )
-                        )
-                        # Adjust absolute indices if chunked
-                        events[-1].start_idx = index_offset + start_idx
-                        events[-1].end_idx = index_offset + end_idx
-                start_time = None
-                start_idx = None
-                crossed_deep = False
-
-        return events
+        if self.engine == "python":
+            starts, ends = _find_event_bounds_python(work, entry, deep)
+        else:
+            starts, ends = _find_event_bounds_numpy(work, entry, deep)
+
+        # Uniform time axes stay implicit: only event sample times are ever computed
+        time_arr = data_time if isinstance(data_time, UniformTime) else np.asarray(data_time, float)
+        keep = (time_arr[ends] - time_arr[starts]) >= self.min_duration
+        starts, ends = starts[keep], ends[keep]
+        # Local open-pore estimate: baseline at event start
+        i0_local = baseline[starts]
+
+        if self.engine == "python":
+            events = [
+                _build_event(
+                    current=raw,
+                    time=time_arr,
+                    start_idx=int(s),
+                    end_idx=int(e),
+                    direction=self.direction,
+                    sample_rate=fs,
+                    baseline_value=float(i0),
+                    analyze_levels=self.analyze_levels,
+                )
+                for s, e, i0 in zip(starts, ends, i0_local, strict=True)
+            ]
+            for ev in events:
+                # Adjust absolute indices if chunked
+                ev.start_idx += index_offset
+                ev.end_idx += index_offset
+            return EventTable.from_events(events)
+
+        return _build_event_table(
+            current=raw,
+            time=time_arr,
+            starts=starts,
+            ends=ends,
+            direction=self.direction,
+            sample_rate=fs,
+            baseline_values=i0_local,
+            analyze_levels=self.analyze_levels,
+            index_offset=index_offset,
+        )
 
     def detect_events_dicts(
         self,
@@ -301,13 +753,43 @@ class EventDetector:
         """Backward-compatible list-of-dicts API."""
         return [e.to_dict() for e in self.detect_events(data_chunk, data_time, **kwargs)]
 
+    @overload
+    def detect_trace(
+        self,
+        trace: Trace,
+        *,
+        interval_length: float = ...,
+        overlap: float = ...,
+        streaming: bool = ...,
+        baseline_scope: BaselineScope = ...,
+        n_jobs: int = ...,
+        as_table: Literal[False] = ...,
+    ) -> list[Event]: ...
+
+    @overload
+    def detect_trace(
+        self,
+        trace: Trace,
+        *,
+        interval_length: float = ...,
+        overlap: float = ...,
+        streaming: bool = ...,
+        baseline_scope: BaselineScope = ...,
+        n_jobs: int = ...,
+        as_table: Literal[True],
+    ) -> EventTable: ...
+
     def detect_trace(
         self,
         trace: Trace,
         *,
         interval_length: float = 5.0,
         overlap: float = 0.0,
-    ) -> list[Event]:
+        streaming: bool = False,
+        baseline_scope: BaselineScope = "chunk",
+        n_jobs: int = 1,
+        as_table: bool = False,
+    ) -> list[Event] | EventTable:
         """Run detection over an entire Trace using fixed-length chunks.
 
         Parameters
@@ -316,41 +798,124 @@ class EventDetector:
             Overlap between consecutive chunks in seconds (reduces edge misses).
             Events whose start falls in the overlap tail of the previous chunk
             are skipped to avoid duplicates.
+        streaming:
+            Feed non-overlapping windows through a :class:`StreamingEventDetector`
+            so events spanning window boundaries are detected whole. Thresholds then
+            follow running statistics instead of per-window ones.
+        baseline_scope:
+            ``'chunk'`` estimates the baseline separately for every chunk. ``'trace'``
+            estimates it once over the whole trace (block-wise with window context,
+            see :func:`~pynanopore.detection.baseline.estimate_trace_baseline`) and
+            every chunk reads its slice, so overlapping samples are not re-estimated
+            and moving-window baselines have no chunk-edge artifacts. Thresholds
+            stay per chunk.
+        n_jobs:
+            Detect chunks in this many worker processes (``-1``: all CPUs). The
+            working-dtype current (and a non-uniform time axis or trace baseline) is
+            copied once into shared memory instead of pickling chunks; results are
+            stitched in chunk order, so the output equals ``n_jobs=1`` exactly.
+        as_table:
+            Return an :class:`EventTable` (columnar) instead of ``list[Event]``.
         """
         if overlap < 0:
             raise ValueError("overlap must be non-negative")
         if overlap >= interval_length:
             raise ValueError("overlap must be smaller than interval_length")
 
+        if streaming and overlap > 0:
+            raise ValueError("overlap must be 0 when streaming=True")
+        if baseline_scope not in ("chunk", "trace"):
+            raise ValueError("baseline_scope must be 'chunk' or 'trace'")
+        if streaming and n_jobs != 1:
+            raise ValueError("n_jobs must be 1 when streaming=True")
+        if streaming and baseline_scope == "trace":
+            raise ValueError(
+                "baseline_scope='trace' does not apply to streaming=True "
+                "(the stream already carries baseline context between windows)"
+            )
+
         fs = trace.sample_rate
         self.sample_rate = fs
         step = max(1, int((interval_length - overlap) * fs))
         win = max(1, int(interval_length * fs))
         n = len(trace.current)
-        all_events: list[Event] = []
-        seen_starts: set[int] = set()
 
+        if streaming:
+            stream = self.stream(fs, t0=float(trace.time[0]))
+            table = stream.detect_chunks(
+                (trace.current[start : start + win], _time_window(trace, start, start + win))
+                for start in range(0, n, win)
+            )
+            _bind_levels(table, trace)
+            return table if as_table else table.to_events()
+
+        full_baseline = None
+        if baseline_scope == "trace":
+            full_baseline = estimate_trace_baseline(
+                self.baseline, trace.current, fs, dtype=self.dtype
+            )
+
+        bounds: list[tuple[int, int]] = []
         for start in range(0, n, step):
             end = min(start + win, n)
             if end - start < 2:
                 break
-            chunk_events = self.detect_events(
-                trace.current[start:end],
-                trace.time[start:end],
-                sample_rate=fs,
-                index_offset=start,
-            )
-            for ev in chunk_events:
-                # Deduplicate by absolute start index
-                key = ev.start_idx
-                if key in seen_starts:
-                    continue
-                seen_starts.add(key)
-                all_events.append(ev)
+            bounds.append((start, end))
             if end >= n:
                 break
 
-        return all_events
+        jobs = resolve_n_jobs(n_jobs)
+        chunks: Iterable[EventTable]
+        if jobs > 1 and len(bounds) > 1:
+            chunks = detect_chunks_parallel(
+                self,
+                trace.current,
+                trace.time,
+                bounds,
+                sample_rate=fs,
+                baseline=full_baseline,
+                n_jobs=jobs,
+            )
+        else:
+            chunks = (
+                self._detect_chunk(
+                    trace.current[start:end],
+                    _time_window(trace, start, end),
+                    sample_rate=fs,
+                    index_offset=start,
+                    baseline=None if full_baseline is None else full_baseline[start:end],
+                )
+                for start, end in bounds
+            )
+
+        tables: list[EventTable] = []
+        seen_starts = np.empty(0, dtype=np.int64)
+        for chunk in chunks:
+            if len(chunk):
+                # Deduplicate by absolute start index, earlier chunks first
+                chunk_starts = chunk.columns["start_idx"]
+                fresh = ~np.isin(chunk_starts, seen_starts)
+                if not fresh.all():
+                    chunk = chunk[fresh]
+                seen_starts = np.concatenate([seen_starts, chunk.columns["start_idx"]])
+                tables.append(chunk)
+
+        table = EventTable.concat(tables)
+        _bind_levels(table, trace)
+        return table if as_table else table.to_events()
+
+
+def _bind_levels(table: EventTable, trace: Trace) -> None:
+    """Tie a table's cached level labels to the samples of ``trace`` they came from."""
+    if table.levels is not None and len(table):
+        table.levels.bind(trace.current, table.columns["start_idx"])
+
+
+def _time_window(trace: Trace, start: int, end: int) -> NDArray[np.floating]:
+    """Time samples ``[start, end)``: a lazy sub-axis for uniform traces, else a slice."""
+    if isinstance(trace.time, UniformTime):
+        return trace.time.window(start, end)  # type: ignore[return-value]
+    return trace.time[start:end]
 
 
 # Backward-compatible alias
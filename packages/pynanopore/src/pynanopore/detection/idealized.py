@@ -0,0 +1,183 @@
+"""Run-length-encoded idealized traces built from detected events."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+@dataclass
+class IdealizedTrace:
+    """
+    Piecewise-constant signal over ``n_samples`` samples, stored as runs.
+
+    Run ``k`` covers samples ``starts[k]`` up to the next run start (the last run
+    ends at ``n_samples``) with value ``values[k]`` and level code ``codes[k]``
+    (0 = open pore). Only transitions are kept, so an idealization of a very long
+    trace costs memory per event, not per sample; :meth:`to_array` and
+    :meth:`codes_array` materialize a window on request.
+    """
+
+    n_samples: int
+    starts: NDArray[np.int64]
+    values: NDArray[np.float64]
+    codes: NDArray[np.int8]
+
+    def __post_init__(self) -> None:
+        self.starts = np.asarray(self.starts, dtype=np.int64)
+        self.values = np.asarray(self.values, dtype=np.float64)
+        self.codes = np.asarray(self.codes, dtype=np.int8)
+        if not len(self.starts) == len(self.values) == len(self.codes):
+            raise ValueError("starts, values and codes must have the same length")
+        if self.n_samples and (not len(self.starts) or self.starts[0] != 0):
+            raise ValueError("the first run must start at sample 0")
+        if np.any(np.diff(self.starts) <= 0):
+            raise ValueError("run starts must be strictly increasing")
+
+    @classmethod
+    def constant(cls, n_samples: int, value: float, code: int = 0) -> IdealizedTrace:
+        runs = 1 if n_samples else 0
+        return cls(n_samples, np.zeros(runs, np.int64), np.full(runs, value), np.full(runs, code))
+
+    @classmethod
+    def from_array(
+        cls,
+        values: NDArray[np.floating],
+        codes: NDArray[np.integer] | int = 0,
+    ) -> IdealizedTrace:
+        """Run-length encode dense per-sample ``values`` (and level ``codes``)."""
+        values = np.asarray(values, dtype=np.float64)
+        codes = np.broadcast_to(np.asarray(codes, dtype=np.int8), values.shape)
+        changed = np.ones(len(values), dtype=bool)
+        changed[1:] = (values[1:] != values[:-1]) | (codes[1:] != codes[:-1])
+        starts = np.flatnonzero(changed)
+        return cls(len(values), starts, values[starts], codes[starts])
+
+    @classmethod
+    def from_segments(
+        cls,
+        n_samples: int,
+        seg_starts: NDArray[np.integer],
+        seg_ends: NDArray[np.integer],
+        seg_values: NDArray[np.floating],
+        seg_codes: NDArray[np.integer] | int,
+        *,
+        fill_value: float,
+        fill_code: int = 0,
+    ) -> IdealizedTrace:
+        """
+        Paint inclusive ``[start, end]`` segments over a ``fill_value`` background.
+
+        Segments are ordered by start; where two overlap, the later one starts at its
+        own start and the earlier one is cut there. Adjacent runs with equal value and
+        code are merged.
+        """
+        seg_starts = np.asarray(seg_starts, dtype=np.int64)
+        seg_ends = np.asarray(seg_ends, dtype=np.int64)
+        seg_values = np.asarray(seg_values, dtype=np.float64)
+        seg_codes = np.broadcast_to(np.asarray(seg_codes, dtype=np.int8), seg_starts.shape)
+        if n_samples == 0:
+            return cls(0, np.empty(0, np.int64), np.empty(0), np.empty(0, np.int8))
+
+        order = np.argsort(seg_starts, kind="stable")
+        starts = np.clip(seg_starts[order], 0, n_samples - 1)
+        ends = np.minimum(seg_ends[order], n_samples - 1)
+        ends[:-1] = np.minimum(ends[:-1], starts[1:] - 1)
+        keep = ends >= starts
+        starts, ends = starts[keep], ends[keep]
+        values, codes = seg_values[order][keep], seg_codes[order][keep]
+
+        # Background run at 0, then each segment followed by a background run after it
+        m = len(starts)
+        pos = np.empty(2 * m + 1, dtype=np.int64)
+        val = np.empty(2 * m + 1, dtype=np.float64)
+        code = np.empty(2 * m + 1, dtype=np.int8)
+        pos[0], val[0], code[0] = 0, fill_value, fill_code
+        pos[1::2], val[1::2], code[1::2] = starts, values, codes
+        pos[2::2], val[2::2], code[2::2] = ends + 1, fill_value, fill_code
+
+        # A run that starts where the next one starts is empty; drop it and runs past the end
+        last_at_pos = np.ones(len(pos), dtype=bool)
+        last_at_pos[:-1] = pos[1:] != pos[:-1]
+        keep = last_at_pos & (pos < n_samples)
+        pos, val, code = pos[keep], val[keep], code[keep]
+        changed = np.ones(len(pos), dtype=bool)
+        changed[1:] = (val[1:] != val[:-1]) | (code[1:] != code[:-1])
+        return cls(n_samples, pos[changed], val[changed], code[changed])
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    @property
+    def n_runs(self) -> int:
+        return len(self.starts)
+
+    @property
+    def lengths(self) -> NDArray[np.int64]:
+        return np.diff(self.starts, append=self.n_samples)
+
+    @property
+    def transitions(self) -> NDArray[np.int64]:
+        """Sample indices where the level changes."""
+        return self.starts[1:]
+
+    def _window(self, start: int, stop: int | None) -> tuple[slice, NDArray[np.int64]]:
+        stop = self.n_samples if stop is None else min(int(stop), self.n_samples)
+        start = max(0, int(start))
+        if stop <= start:
+            return slice(0, 0), np.empty(0, dtype=np.int64)
+        first = int(np.searchsorted(self.starts, start, side="right")) - 1
+        last = int(np.searchsorted(self.starts, stop, side="left"))
+        bounds = np.clip(np.append(self.starts[first:last], stop), start, stop)
+        return slice(first, last), np.diff(bounds)
+
+    def to_array(self, start: int = 0, stop: int | None = None) -> NDArray[np.float64]:
+        """Idealized samples ``[start, stop)`` as a dense array."""
+        runs, counts = self._window(start, stop)
+        return np.repeat(self.values[runs], counts)
+
+    def codes_array(self, start: int = 0, stop: int | None = None) -> NDArray[np.int8]:
+        """Level codes of samples ``[start, stop)`` as a dense array."""
+        runs, counts = self._window(start, stop)
+        return np.repeat(self.codes[runs], counts)
+
+    def steps(self, time: Any) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+        """``(x, y)`` vertices of the step plot (``line_shape='hv'``) on ``time``.
+
+        One point per run plus the last sample, instead of one per sample.
+        """
+        if not self.n_samples:
+            return np.empty(0), np.empty(0)
+        idx = np.append(self.starts, self.n_samples - 1)
+        x = np.asarray(time[idx], dtype=float)
+        return x, np.append(self.values, self.values[-1])
+
+
+def event_columns(events: Any, *names: str) -> list[NDArray[Any]]:
+    """Columns ``names`` of an ``EventTable`` (no copy) or a sequence of Event-like objects."""
+    columns = getattr(events, "columns", None)
+    if columns is not None:
+        return [np.asarray(columns[name]) for name in names]
+    n = len(events)
+    return [np.fromiter((getattr(e, name) for e in events), dtype=float, count=n) for name in names]
+
+
+def event_sample_bounds(
+    events: Any, n_samples: int, sample_rate: float
+) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """Inclusive ``(starts, ends)`` sample indices of events, clipped to the trace.
+
+    Negative ``start_idx`` / ``end_idx`` (events without indices) fall back to
+    ``time * sample_rate``.
+    """
+    start_idx, end_idx, start_time, end_time = event_columns(
+        events, "start_idx", "end_idx", "start_time", "end_time"
+    )
+    starts = np.where(start_idx >= 0, start_idx, (start_time * sample_rate).astype(np.int64))
+    ends = np.where(end_idx >= 0, end_idx, (end_time * sample_rate).astype(np.int64))
+    starts = np.clip(starts, 0, n_samples - 1).astype(np.intp)
+    ends = np.maximum(starts, np.minimum(ends, n_samples - 1)).astype(np.intp)
+    return starts, ends
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import weakref
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
 
+from pynanopore.detection.idealized import IdealizedTrace, event_columns, event_sample_bounds
 from pynanopore.io.trace import Trace
 
 
@@ -45,12 +50,45 @@ class LevelAssignment:
 
 @dataclass
 class MultiLevelIdealization:
-    """Trace-length idealization with open / level1 / level2 codes."""
+    """Trace-length idealization with open / level1 / level2 codes.
 
-    time: NDArray[np.floating]
-    idealized: NDArray[np.floating]
-    level_code: NDArray[np.integer]  # 0=open, 1=level1, 2=level2
-    events: list  # Event-like objects with i0 / start_idx / end_idx
+    Stored run-length encoded in ``runs`` (codes 0=open, 1=level1, 2=level2);
+    ``time``, ``idealized`` and ``level_code`` are materialized on first access.
+    :meth:`from_arrays` takes the dense arrays in the 2.7.x field order
+    ``(time, idealized, level_code, events)``.
+    """
+
+    runs: IdealizedTrace
+    time_axis: Any
+    events: Any  # Event-like objects or an EventTable, with i0 / start_idx / end_idx
+
+    @classmethod
+    def from_arrays(
+        cls,
+        time: NDArray[np.floating],
+        idealized: NDArray[np.floating],
+        level_code: NDArray[np.integer],
+        events: Any,
+    ) -> MultiLevelIdealization:
+        """Build an idealization from dense per-sample arrays."""
+        idealized, level_code = np.asarray(idealized), np.asarray(level_code)
+        result = cls(
+            runs=IdealizedTrace.from_array(idealized, level_code), time_axis=time, events=events
+        )
+        result.__dict__.update(time=time, idealized=idealized, level_code=level_code)
+        return result
+
+    @cached_property
+    def time(self) -> NDArray[np.floating]:
+        return np.asarray(self.time_axis, dtype=float)
+
+    @cached_property
+    def idealized(self) -> NDArray[np.floating]:
+        return self.runs.to_array()
+
+    @cached_property
+    def level_code(self) -> NDArray[np.integer]:
+        return self.runs.codes_array().astype(int)
 
 
 def _kmeans_1d(x: NDArray[np.floating], k: int, *, n_iter: int = 25) -> tuple[NDArray, NDArray]:
@@ -76,6 +114,32 @@ def _kmeans_1d(x: NDArray[np.floating], k: int, *, n_iter: int = 25) -> tuple[ND
     return labels, centers
 
 
+def _split_1d(x: NDArray[np.floating]) -> tuple[NDArray, NDArray]:
+    """Exact least-squares two-cluster split of 1-D data. Returns ``(labels, centers)``.
+
+    In 1-D the optimal k=2 clusters are a threshold on the sorted values, so the split
+    maximizing the between-cluster sum of squares is found from prefix sums of the
+    centred, sorted samples in O(n log n) — the global optimum that Lloyd iterations
+    (:func:`_kmeans_1d`) converge to from the min/max initialisation on separable data.
+    Label 0 is the lower cluster. Constant input yields one label and equal centers.
+    """
+    x = np.asarray(x, dtype=float)
+    n = len(x)
+    mean = float(np.mean(x)) if n else float("nan")
+    xs = np.sort(x)
+    if n < 2 or xs[0] == xs[-1]:
+        return np.zeros(n, dtype=int), np.array([mean, mean])
+
+    left = np.cumsum(xs[:-1] - mean)  # centred sum of the lower cluster for each cut
+    sizes = np.arange(1, n, dtype=float)
+    between = left * left * n / (sizes * (n - sizes))
+    between[xs[1:] == xs[:-1]] = -1.0  # cut only between distinct values
+    cut = int(np.argmax(between)) + 1
+    labels = (x >= xs[cut]).astype(int)
+    low, high = xs[:cut], xs[cut:]
+    return labels, np.array([float(np.mean(low)), float(np.mean(high))])
+
+
 def _bic_1d(x: NDArray[np.floating], labels: NDArray, centers: NDArray) -> float:
     """Gaussian BIC for 1-D mixture with equal variance (rough model-order score)."""
     n = len(x)
@@ -112,7 +176,7 @@ def assign_event_levels(
     best_centers: NDArray | None = None
     k_max = min(int(max_levels), 2, len(seg))
     for k in range(1, k_max + 1):
-        labels, centers = _kmeans_1d(seg, k)
+        labels, centers = _split_1d(seg) if k == 2 else _kmeans_1d(seg, k)
         bic = _bic_1d(seg, labels, centers)
         if bic < best_bic:
             best_bic = bic
@@ -122,11 +186,12 @@ def assign_event_levels(
     assert best_labels is not None and best_centers is not None
     order = np.argsort(np.abs(best_centers - i0))[::-1]
     centers_sorted = best_centers[order]
-    remap = {int(order[i]): i for i in range(len(order))}
-    labels_sorted = np.array([remap[int(lb)] for lb in best_labels], dtype=int)
+    remap = np.empty(len(order), dtype=int)
+    remap[order] = np.arange(len(order))
+    labels_sorted = remap[best_labels]
 
     n_lev = len(centers_sorted)
-    fracs = np.array([(labels_sorted == j).mean() for j in range(n_lev)], dtype=float)
+    fracs = np.bincount(labels_sorted, minlength=n_lev) / len(seg)
     resid = seg - centers_sorted[labels_sorted]
     rms = float(np.sqrt(np.mean(resid**2)))
 
@@ -148,6 +213,274 @@ def assign_event_levels(
     return LevelAssignment(features=feats, labels=labels_sorted, centers=centers_sorted)
 
 
+LEVEL_FIELDS: tuple[str, ...] = tuple(LevelFeatures.__dataclass_fields__)
+
+
+@dataclass
+class LevelBatch:
+    """Level assignment of many events: feature columns plus cached per-sample labels.
+
+    ``labels`` holds every event's labels back to back (0 = level1, 1 = level2);
+    event ``i`` owns ``labels[offsets[i]:offsets[i + 1]]``. ``centers`` is
+    ``(n_events, 2)`` with NaN for a missing second level. ``features`` has one
+    array per :class:`LevelFeatures` field.
+
+    ``starts`` (each event's first sample index) and ``source`` (a weak reference to
+    the sample array) are set by :meth:`bind` once the samples the labels came from
+    are known; :meth:`covers` only trusts the cache for those exact samples.
+    """
+
+    offsets: NDArray[np.intp]
+    labels: NDArray[np.int8]
+    centers: NDArray[np.floating]
+    features: dict[str, NDArray[np.floating]]
+    max_levels: int = 2
+    starts: NDArray[np.intp] | None = None
+    source: weakref.ReferenceType | None = None
+
+    def bind(self, current: Any, starts: NDArray[np.integer]) -> None:
+        """Record that event ``i`` was clustered from ``current`` starting at ``starts[i]``."""
+        try:
+            self.source = weakref.ref(current)
+        except TypeError:  # no weak references (e.g. a list): never reused
+            self.source = None
+        self.starts = np.asarray(starts, dtype=np.intp)
+
+    def covers(
+        self,
+        current: Any,
+        starts: NDArray[np.integer],
+        lengths: NDArray[np.integer],
+        max_levels: int,
+    ) -> bool:
+        """True if these labels were computed from ``current[starts[i]:][:lengths[i]]``."""
+        return (
+            self.source is not None
+            and self.source() is current
+            and self.starts is not None
+            and self.max_levels == max_levels
+            and np.array_equal(self.starts, starts)
+            and np.array_equal(np.diff(self.offsets), lengths)
+        )
+
+    @classmethod
+    def empty(cls, max_levels: int = 2) -> LevelBatch:
+        return cls(
+            offsets=np.zeros(1, dtype=np.intp),
+            labels=np.empty(0, dtype=np.int8),
+            centers=np.empty((0, 2), dtype=float),
+            features={name: np.empty(0, dtype=float) for name in LEVEL_FIELDS},
+            max_levels=max_levels,
+        )
+
+    def __len__(self) -> int:
+        return len(self.centers)
+
+    def assignment(self, i: int) -> LevelAssignment:
+        """The :class:`LevelAssignment` of event ``i`` (same as :func:`assign_event_levels`)."""
+        feats = LevelFeatures(**{name: float(col[i]) for name, col in self.features.items()})
+        n_lev = int(feats.n_levels)
+        return LevelAssignment(
+            features=feats,
+            labels=self.labels[self.offsets[i] : self.offsets[i + 1]].astype(int),
+            centers=self.centers[i, :n_lev].copy(),
+        )
+
+    def take(self, index: slice | NDArray[Any]) -> LevelBatch:
+        """Subset of events (slice, integer indices or boolean mask), labels included."""
+        picked = np.arange(len(self))[index]
+        lengths = np.diff(self.offsets)[picked]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.intp)
+        flat = np.arange(int(offsets[-1]), dtype=np.intp) + np.repeat(
+            self.offsets[picked] - offsets[:-1], lengths
+        )
+        return LevelBatch(
+            offsets=offsets,
+            labels=self.labels[flat],
+            centers=self.centers[picked],
+            features={name: col[picked] for name, col in self.features.items()},
+            max_levels=self.max_levels,
+            starts=None if self.starts is None else self.starts[picked],
+            source=self.source,
+        )
+
+    @classmethod
+    def concat(cls, batches: Sequence[LevelBatch]) -> LevelBatch:
+        if not batches:
+            return cls.empty()
+        shifts = np.cumsum([0] + [int(b.offsets[-1]) for b in batches[:-1]])
+        return cls(
+            offsets=np.concatenate(
+                [[0]] + [b.offsets[1:] + shift for b, shift in zip(batches, shifts, strict=True)]
+            ).astype(np.intp),
+            labels=np.concatenate([b.labels for b in batches]),
+            centers=np.concatenate([b.centers for b in batches]),
+            features={
+                name: np.concatenate([b.features[name] for b in batches]) for name in LEVEL_FIELDS
+            },
+            max_levels=batches[0].max_levels,
+            **_concat_binding(batches),
+        )
+
+
+def _concat_binding(batches: Sequence[LevelBatch]) -> dict[str, Any]:
+    """``starts`` / ``source`` of concatenated batches, kept only if all share one source."""
+    first = batches[0].source
+    referent = None if first is None else first()
+    if referent is None or any(
+        b.starts is None or b.source is None or b.source() is not referent for b in batches
+    ):
+        return {}
+    return {"starts": np.concatenate([b.starts for b in batches]), "source": first}
+
+
+def _bic_columns(sse: NDArray, n: NDArray, k: int) -> NDArray:
+    """Vectorized :func:`_bic_1d` from per-event residual sums of squares."""
+    var = sse / n + 1e-18
+    return -2.0 * (-0.5 * n * (np.log(2 * np.pi * var) + 1.0)) + (k + 1) * np.log(n)
+
+
+def _segment_sort(
+    values: NDArray[np.floating], event_id: NDArray[np.intp], first: NDArray[np.intp]
+) -> NDArray[np.floating]:
+    """Sort ``values`` within each segment (segments given by sorted ``event_id``).
+
+    One ``argsort`` of ``event_id + rescaled value`` (each segment mapped into [0, 1))
+    is several times faster than ``lexsort``; if rounding in the key misorders any
+    pair, fall back to the exact ``lexsort``.
+    """
+    lo = np.minimum.reduceat(values, first)
+    span = np.maximum.reduceat(values, first) - lo
+    scale = np.where(span > 0, 0.5 / np.where(span > 0, span, 1.0), 0.0)
+    order = np.argsort(event_id + (values - lo[event_id]) * scale[event_id])
+    xs = values[order]
+    same = event_id[1:] == event_id[:-1]
+    if np.any(same & (xs[1:] < xs[:-1])):
+        xs = values[np.lexsort((values, event_id))]
+    return xs
+
+
+def _levels_from_segments(
+    values: NDArray[np.floating],
+    lengths: NDArray[np.integer],
+    i0: NDArray[np.floating],
+    *,
+    max_levels: int = 2,
+    min_samples: int = 12,
+) -> LevelBatch:
+    """
+    :func:`assign_event_levels` for all events at once.
+
+    ``values`` are the event samples back to back (event ``i`` has ``lengths[i]``
+    samples) and ``i0`` the open-pore reference of each event. One sort orders
+    every segment; the exact two-level cut of :func:`_split_1d` is then a segmented
+    argmax over centred prefix sums, and BIC, ordering by distance from ``i0``,
+    fractions and RMS are segment reductions. Results agree with the per-event
+    functions up to floating-point rounding.
+    """
+    values = np.asarray(values, dtype=float)
+    lengths = np.asarray(lengths, dtype=np.intp)
+    i0 = np.asarray(i0, dtype=float)
+    n_events = len(lengths)
+    if n_events == 0:
+        return LevelBatch.empty(max_levels)
+    if np.any(lengths < 1):
+        raise ValueError("every event must have at least one sample")
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.intp)
+    first = offsets[:-1]
+    total = int(offsets[-1])
+    event_id = np.repeat(np.arange(n_events), lengths)
+    n = lengths.astype(float)
+
+    mean = np.add.reduceat(values, first) / n
+    dev = values - mean[event_id]
+    sse1 = np.add.reduceat(dev * dev, first)
+
+    # Exact k=2 split: sort within each event, best cut between distinct sorted values
+    xs = _segment_sort(values, event_id, first)
+    csum = np.cumsum(xs - mean[event_id])
+    before = np.concatenate(([0.0], csum))[first]
+    left = csum - before[event_id]
+    pos = np.arange(total)
+    size = (pos - first[event_id] + 1).astype(float)
+    size_n = n[event_id]
+    valid = np.zeros(total, dtype=bool)
+    valid[:-1] = (xs[1:] != xs[:-1]) & (event_id[1:] == event_id[:-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = np.where(valid, left * left * size_n / (size * (size_n - size)), -1.0)
+    best = np.maximum.reduceat(between, first)
+    best_pos = np.minimum.reduceat(np.where(between == best[event_id], pos, total), first)
+    has_split = best >= 0.0
+    cut = np.where(has_split, best_pos + 1, first)
+    threshold = np.where(has_split, xs[np.minimum(cut, total - 1)], np.inf)
+    high = values >= threshold[event_id]
+
+    n_high = np.add.reduceat(high.astype(float), first)
+    n_low = n - n_high
+    sum_high = np.add.reduceat(np.where(high, values, 0.0), first)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        high_mean = np.where(n_high > 0, sum_high / n_high, np.nan)
+        low_mean = np.where(n_low > 0, (mean * n - sum_high) / n_low, np.nan)
+    fitted = np.where(high, high_mean[event_id], low_mean[event_id])
+    sse2 = np.add.reduceat((values - fitted) ** 2, first)
+
+    small = (lengths < min_samples) | (max_levels < 1)
+    bic1 = np.where(lengths >= 2, _bic_columns(sse1, n, 1), np.inf)
+    two = ~small & has_split & (max_levels >= 2) & (_bic_columns(sse2, n, 2) < bic1)
+
+    # Level 1 is the center farther from i0 (ties keep the upper one, as argsort does)
+    low_first = np.abs(low_mean - i0) > np.abs(high_mean - i0)
+    level1 = np.where(two, np.where(low_first, low_mean, high_mean), mean)
+    level2 = np.where(two, np.where(low_first, high_mean, low_mean), np.nan)
+    frac_high = n_high / n
+    level1_fraction = np.where(two, np.where(low_first, 1.0 - frac_high, frac_high), 1.0)
+    level2_fraction = np.where(two, 1.0 - level1_fraction, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sep = np.where(two & (np.abs(i0) > 1e-12), np.abs(level2 - level1) / np.abs(i0), np.nan)
+    rms = np.where(small, 0.0, np.sqrt(np.where(two, sse2, sse1) / n))
+
+    # Per-sample labels: 0 = level1 cluster
+    in_level1 = np.where(low_first[event_id], ~high, high)
+    labels = np.where(two[event_id] & ~in_level1, 1, 0).astype(np.int8)
+
+    return LevelBatch(
+        offsets=offsets,
+        labels=labels,
+        centers=np.column_stack([level1, level2]),
+        features={
+            "n_levels": np.where(two, 2.0, 1.0),
+            "level1_current": level1,
+            "level2_current": level2,
+            "level1_fraction": level1_fraction,
+            "level2_fraction": level2_fraction,
+            "level_sep": sep,
+            "level_rms": rms,
+        },
+        max_levels=max_levels,
+    )
+
+
+def assign_levels_batch(
+    current: NDArray[np.floating],
+    starts: NDArray[np.integer],
+    ends: NDArray[np.integer],
+    i0: NDArray[np.floating],
+    *,
+    max_levels: int = 2,
+    min_samples: int = 12,
+) -> LevelBatch:
+    """Level assignment of the events ``current[start:end + 1]`` in one vectorized pass."""
+    starts = np.asarray(starts, dtype=np.intp)
+    ends = np.asarray(ends, dtype=np.intp)
+    lengths = ends - starts + 1
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.intp)
+    flat = np.arange(int(lengths.sum()), dtype=np.intp) + np.repeat(starts - offsets, lengths)
+    values = np.asarray(current)[flat] if len(flat) else np.empty(0)
+    return _levels_from_segments(
+        values, lengths, i0, max_levels=max_levels, min_samples=min_samples
+    )
+
+
 def analyze_event_levels(
     segment: NDArray[np.floating],
     i0: float,
@@ -158,7 +491,8 @@ def analyze_event_levels(
     """
     Estimate 1–2 blocked current levels inside an event segment.
 
-    Uses 1-D k-means with BIC to choose ``k ∈ {1, 2}`` (capped by ``max_levels``).
+    Uses an exact 1-D two-cluster split (:func:`_split_1d`) with BIC to choose
+    ``k ∈ {1, 2}`` (capped by ``max_levels``).
     Levels are ordered by increasing distance from the open-pore ``i0``.
     """
     return assign_event_levels(segment, i0, max_levels=max_levels, min_samples=min_samples).features
@@ -166,37 +500,56 @@ def analyze_event_levels(
 
 def idealize_multilevel(
     trace: Trace,
-    events: list,
+    events: Any,
     *,
     max_levels: int = 2,
 ) -> MultiLevelIdealization:
     """
     Build a stepwise idealization using open pore + up to two blocked levels per event.
+
+    ``events`` is a list of Event-like objects or an ``EventTable``. A table whose
+    cached :class:`LevelBatch` was computed with the same ``max_levels`` from this
+    trace's sample array at the same event positions (:meth:`LevelBatch.covers`) is
+    reused as is; otherwise all events are clustered in one
+    :func:`assign_levels_batch` pass. Level runs are found from label changes and
+    encoded as an :class:`IdealizedTrace`, without a per-sample loop.
     """
     n = len(trace.current)
-    if events:
-        open_fill = float(np.median([e.i0 for e in events]))
-    else:
-        open_fill = float(np.median(trace.current))
-
-    idealized: NDArray[np.floating] = np.full(n, open_fill, dtype=float)
-    level_code: NDArray[np.integer] = np.zeros(n, dtype=int)
-
-    for ev in events:
-        start = ev.start_idx if ev.start_idx >= 0 else int(ev.start_time * trace.sample_rate)
-        end = ev.end_idx if ev.end_idx >= 0 else int(ev.end_time * trace.sample_rate)
-        start = max(0, min(start, n - 1))
-        end = max(start, min(end, n - 1))
-        segment = trace.current[start : end + 1]
-        assignment = assign_event_levels(segment, float(ev.i0), max_levels=max_levels)
-        for i, lab in enumerate(assignment.labels):
-            idx = start + i
-            idealized[idx] = float(assignment.centers[int(lab)])
-            level_code[idx] = int(lab) + 1  # 1 or 2
-
-    return MultiLevelIdealization(
-        time=np.asarray(trace.time, dtype=float),
-        idealized=idealized,
-        level_code=level_code,
-        events=list(events),
+    if not hasattr(events, "columns"):
+        events = list(events)
+    n_events = len(events)
+    (i0,) = event_columns(events, "i0")
+    open_fill = float(np.median(i0)) if n_events else float(np.median(trace.current))
+    if not n_events or n == 0:
+        return MultiLevelIdealization(
+            runs=IdealizedTrace.constant(n, open_fill), time_axis=trace.time, events=events
+        )
+
+    starts, ends = event_sample_bounds(events, n, trace.sample_rate)
+    lengths = ends - starts + 1
+    cached: LevelBatch | None = getattr(events, "levels", None)
+    if cached is None or not cached.covers(trace.current, starts, lengths, max_levels):
+        cached = assign_levels_batch(
+            trace.current, starts, ends, np.asarray(i0, dtype=float), max_levels=max_levels
+        )
+
+    # One run per event start or label change inside an event
+    offsets = cached.offsets[:-1]
+    labels = cached.labels
+    change = np.ones(len(labels), dtype=bool)
+    change[1:] = labels[1:] != labels[:-1]
+    change[offsets] = True
+    run_pos = np.flatnonzero(change)
+    run_end = np.append(run_pos[1:], len(labels)) - 1
+    event_id = np.searchsorted(offsets, run_pos, side="right") - 1
+    shift = starts - offsets
+    run_labels = labels[run_pos].astype(np.intp)
+    runs = IdealizedTrace.from_segments(
+        n,
+        run_pos + shift[event_id],
+        run_end + shift[event_id],
+        cached.centers[event_id, run_labels],
+        run_labels + 1,  # 1 or 2
+        fill_value=open_fill,
     )
+    return MultiLevelIdealization(runs=runs, time_axis=trace.time, events=events)
@@ -0,0 +1,132 @@
+"""Process-parallel chunk detection over one trace held in shared memory."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore._dtypes import as_working_array
+from pynanopore.io.trace import UniformTime
+
+if TYPE_CHECKING:
+    from pynanopore.detection.events import EventDetector, EventTable
+
+_COPY_BLOCK = 1 << 22  # samples per block when filling shared memory
+_TASKS_PER_WORKER = 4  # contiguous chunk groups per worker, for load balance
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """``-1`` means all CPUs; anything below 1 is treated as 1."""
+    if n_jobs == -1:
+        return max(1, os.cpu_count() or 1)
+    return max(1, int(n_jobs))
+
+
+def _share(values: Any, dtype: np.dtype[Any]) -> tuple[SharedMemory, dict[str, Any]]:
+    """Copy ``values`` (array or lazy array-like) block by block into a new shared segment."""
+    n = len(values)
+    shm = SharedMemory(create=True, size=max(1, n * dtype.itemsize))
+    out: NDArray[Any] = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+    for start in range(0, n, _COPY_BLOCK):
+        out[start : start + _COPY_BLOCK] = values[start : start + _COPY_BLOCK]
+    del out
+    return shm, {"name": shm.name, "dtype": dtype.str, "n": n}
+
+
+def _attach(spec: dict[str, Any]) -> tuple[SharedMemory, NDArray[Any]]:
+    shm = SharedMemory(name=spec["name"])
+    return shm, np.ndarray((spec["n"],), dtype=np.dtype(spec["dtype"]), buffer=shm.buf)
+
+
+def _detect_chunk_group(payload: dict[str, Any]) -> list[EventTable]:
+    """Worker: detect a contiguous group of chunks (top-level for ProcessPool pickling)."""
+    detector: EventDetector = payload["detector"]
+    handles: list[SharedMemory] = []
+    current: Any = None
+    time: Any = payload["time"]
+    baseline: NDArray[Any] | None = None
+    try:
+        shm, current = _attach(payload["current"])
+        handles.append(shm)
+        if isinstance(time, dict):
+            shm, time = _attach(time)
+            handles.append(shm)
+        if payload["baseline"] is not None:
+            shm, baseline = _attach(payload["baseline"])
+            handles.append(shm)
+
+        tables = []
+        for start, end in payload["bounds"]:
+            window = time.window(start, end) if isinstance(time, UniformTime) else time[start:end]
+            tables.append(
+                detector._detect_chunk(
+                    current[start:end],
+                    window,
+                    sample_rate=payload["sample_rate"],
+                    index_offset=start,
+                    baseline=None if baseline is None else baseline[start:end],
+                )
+            )
+        return tables
+    finally:
+        del current, time, baseline
+        for shm in handles:
+            shm.close()
+
+
+def detect_chunks_parallel(
+    detector: EventDetector,
+    current: Any,
+    time: Any,
+    bounds: list[tuple[int, int]],
+    *,
+    sample_rate: float,
+    baseline: NDArray[np.floating] | None,
+    n_jobs: int,
+) -> list[EventTable]:
+    """Run :meth:`EventDetector._detect_chunk` for every ``(start, end)`` in ``bounds``.
+
+    The current (in the detector's working dtype), a non-uniform time axis and a
+    precomputed baseline are copied once into shared memory; workers receive only
+    segment names and chunk bounds. Results come back in ``bounds`` order, so the
+    caller can stitch them exactly as in the serial loop.
+    """
+    dtype = as_working_array(current[:1], detector.dtype).dtype
+    segments: list[SharedMemory] = []
+    try:
+        shm, current_spec = _share(current, dtype)
+        segments.append(shm)
+        time_spec: Any = time
+        if not isinstance(time, UniformTime):
+            shm, time_spec = _share(time, np.dtype(np.float64))
+            segments.append(shm)
+        baseline_spec = None
+        if baseline is not None:
+            shm, baseline_spec = _share(baseline, np.dtype(baseline.dtype))
+            segments.append(shm)
+
+        n_tasks = min(len(bounds), n_jobs * _TASKS_PER_WORKER)
+        groups = [list(g) for g in np.array_split(np.asarray(bounds), n_tasks) if len(g)]
+        payloads = [
+            {
+                "detector": detector,
+                "current": current_spec,
+                "time": time_spec,
+                "baseline": baseline_spec,
+                "bounds": [(int(s), int(e)) for s, e in group],
+                "sample_rate": sample_rate,
+            }
+            for group in groups
+        ]
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(payloads))) as pool:
+            results = list(pool.map(_detect_chunk_group, payloads))
+        return [table for group in results for table in group]
+    finally:
+        for shm in segments:
+            shm.close()
+            shm.unlink()
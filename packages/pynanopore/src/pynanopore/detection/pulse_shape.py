@@ -3,40 +3,78 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
 
-from pynanopore.detection.events import Event
+from pynanopore.detection.events import Event, EventTable
+from pynanopore.detection.idealized import IdealizedTrace, event_columns, event_sample_bounds
 from pynanopore.io.trace import Trace
 
 
 @dataclass
 class PulseShapeResult:
-    """Idealized stepwise current matching detected events."""
+    """Idealized stepwise current matching detected events.
 
-    time: NDArray[np.floating]
-    idealized: NDArray[np.floating]
-    open_level: NDArray[np.floating]
-    events: list[Event]
+    The idealization is kept run-length encoded (``runs``, ``open_runs``); the
+    sample-by-sample ``time``, ``idealized`` and ``open_level`` arrays are built on
+    first access. :meth:`from_arrays` takes the dense arrays in the 2.7.x field
+    order ``(time, idealized, open_level, events)``.
+    """
+
+    runs: IdealizedTrace
+    open_runs: IdealizedTrace
+    time_axis: Any
+    events: list[Event] | EventTable
+
+    @classmethod
+    def from_arrays(
+        cls,
+        time: NDArray[np.floating],
+        idealized: NDArray[np.floating],
+        open_level: NDArray[np.floating],
+        events: list[Event] | EventTable,
+    ) -> PulseShapeResult:
+        """Build a result from dense per-sample arrays (samples off ``open_level`` get code 1)."""
+        idealized, open_level = np.asarray(idealized), np.asarray(open_level)
+        result = cls(
+            runs=IdealizedTrace.from_array(idealized, idealized != open_level),
+            open_runs=IdealizedTrace.from_array(open_level),
+            time_axis=time,
+            events=events,
+        )
+        result.__dict__.update(time=time, idealized=idealized, open_level=open_level)
+        return result
+
+    @cached_property
+    def time(self) -> NDArray[np.floating]:
+        return np.asarray(self.time_axis, dtype=float)
+
+    @cached_property
+    def idealized(self) -> NDArray[np.floating]:
+        return self.runs.to_array()
+
+    @cached_property
+    def open_level(self) -> NDArray[np.floating]:
+        return self.open_runs.to_array()
 
     @property
     def rising_edges(self) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
         """Times and currents at event starts (rising into the blocked state)."""
-        if not self.events:
+        if not len(self.events):
             return np.array([]), np.array([])
-        t = np.array([e.start_time for e in self.events], dtype=float)
-        y = np.array([e.blockade_mean for e in self.events], dtype=float)
-        return t, y
+        t, y = event_columns(self.events, "start_time", "blockade_mean")
+        return t.astype(float), y.astype(float)
 
     @property
     def falling_edges(self) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
         """Times and currents at event ends (return to open pore)."""
-        if not self.events:
+        if not len(self.events):
             return np.array([]), np.array([])
-        t = np.array([e.end_time for e in self.events], dtype=float)
-        y = np.array([e.i0 for e in self.events], dtype=float)
-        return t, y
+        t, y = event_columns(self.events, "end_time", "i0")
+        return t.astype(float), y.astype(float)
 
 
 class PulseShapeIdealizer:
@@ -56,7 +94,7 @@ class PulseShapeIdealizer:
     def from_events(
         cls,
         trace: Trace,
-        events: list[Event],
+        events: list[Event] | EventTable,
         *,
         use_event_i0: bool = True,
         global_open_level: float | None = None,
@@ -65,33 +103,40 @@ class PulseShapeIdealizer:
             trace, events
         )
 
-    def idealize(self, trace: Trace, events: list[Event]) -> PulseShapeResult:
+    def idealize(self, trace: Trace, events: list[Event] | EventTable) -> PulseShapeResult:
+        """Idealize ``trace`` from ``events`` (a list of events or an ``EventTable``).
+
+        Events are painted in start order with index arrays; where events overlap the
+        later one wins from its start on.
+        """
         n = len(trace.current)
+        if not isinstance(events, EventTable):
+            events = list(events)
+        i0, blockade_mean = event_columns(events, "i0", "blockade_mean")
         if self.global_open_level is not None:
             open_fill = float(self.global_open_level)
-        elif events:
-            open_fill = float(np.median([e.i0 for e in events]))
+        elif len(events):
+            open_fill = float(np.median(i0))
         else:
             open_fill = float(np.median(trace.current))
 
-        idealized: NDArray[np.floating] = np.full(n, open_fill, dtype=float)
-        open_level: NDArray[np.floating] = np.full(n, open_fill, dtype=float)
-
-        for ev in events:
-            start = ev.start_idx if ev.start_idx >= 0 else int(ev.start_time * trace.sample_rate)
-            end = ev.end_idx if ev.end_idx >= 0 else int(ev.end_time * trace.sample_rate)
-            start = max(0, min(start, n - 1))
-            end = max(start, min(end, n - 1))
-
+        if len(events) and n:
+            starts, ends = event_sample_bounds(events, n, trace.sample_rate)
+            runs = IdealizedTrace.from_segments(
+                n, starts, ends, blockade_mean, 1, fill_value=open_fill
+            )
             if self.use_event_i0:
-                open_level[start : end + 1] = ev.i0
-                # Fill open regions between events with each event's i0 near edges
-                # Keep global fill elsewhere; optionally paint local i0 in a small halo
-            idealized[start : end + 1] = ev.blockade_mean
+                open_runs = IdealizedTrace.from_segments(
+                    n, starts, ends, i0, 0, fill_value=open_fill
+                )
+            else:
+                open_runs = IdealizedTrace.constant(n, open_fill)
+        else:
+            runs = open_runs = IdealizedTrace.constant(n, open_fill)
 
         return PulseShapeResult(
-            time=np.asarray(trace.time, dtype=float),
-            idealized=idealized,
-            open_level=open_level,
-            events=list(events),
+            runs=runs,
+            open_runs=open_runs,
+            time_axis=trace.time,
+            events=events,
         )
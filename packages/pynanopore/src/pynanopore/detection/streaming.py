@@ -0,0 +1,332 @@
+"""Stateful chunk-by-chunk event detection for long or chunked recordings."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore._dtypes import as_working_array
+from pynanopore.detection.baseline import NoneBaseline
+from pynanopore.detection.events import (
+    DEFAULT_MAX_EVENT_S,
+    EventDetector,
+    EventTable,
+    _build_event_table,
+    _CrossingState,
+    _scan_event_bounds,
+)
+from pynanopore.io.trace import UniformTime
+
+
+@dataclass
+class _RunningMoments:
+    """Count / mean / sum of squared deviations merged chunk by chunk (Chan et al.)."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, x: NDArray[np.floating]) -> None:
+        n_b = len(x)
+        if n_b == 0:
+            return
+        mean_b = float(np.mean(x, dtype=np.float64))
+        m2_b = float(np.var(x, dtype=np.float64)) * n_b
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.count * n_b / n
+        self.count = n
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.count)) if self.count else 0.0
+
+
+class StreamingEventDetector:
+    """
+    Feed a recording chunk by chunk; events spanning chunk boundaries are kept whole.
+
+    Wraps an :class:`EventDetector` configuration. Between calls to :meth:`feed` it
+    carries the threshold state machine (last work sample, open event and whether it
+    has reached the deep threshold), running mean/std of the work signal used for the
+    thresholds, the raw samples of the open event, and ``baseline_context`` raw samples
+    on each side of the samples being processed: the last ones already processed, and
+    the newest ones fed, which are held back until the next :meth:`feed` (or
+    :meth:`flush`) supplies their right-hand context. A centered moving-window
+    baseline therefore sees the same neighbourhood as a one-shot estimate over the
+    whole recording, however the stream is chunked. No sample is processed twice.
+
+    Thresholds follow the running statistics of everything processed so far, so
+    without a moving-window baseline, feeding the whole trace in one call matches
+    :meth:`EventDetector.detect_events`, except for events longer than ``max_event_s`` (default 60 s; ``None``: no limit). Those are
+    dropped and counted in :attr:`n_dropped`. Once an open event passes that length,
+    its buffered samples are released and no more are kept, so a stuck-low signal
+    holds at most ``max_event_s * sample_rate`` samples. Events still open when the
+    stream ends are discarded, as in chunked detection.
+    """
+
+    def __init__(
+        self,
+        detector: EventDetector,
+        sample_rate: float,
+        *,
+        t0: float = 0.0,
+        baseline_context_s: float | None = None,
+        max_event_s: float | None = DEFAULT_MAX_EVENT_S,
+    ):
+        if sample_rate <= 0:
+            raise ValueError("sample_rate must be positive")
+        if max_event_s is not None and max_event_s <= 0:
+            raise ValueError("max_event_s must be positive (or None for no limit)")
+        self.detector = detector
+        self.sample_rate = float(sample_rate)
+        self.t0 = float(t0)
+        if baseline_context_s is None:
+            baseline_context_s = float(getattr(detector.baseline, "window_s", 0.0))
+        if baseline_context_s < 0:
+            raise ValueError("baseline_context_s must be non-negative")
+        self.baseline_context = int(round(baseline_context_s * self.sample_rate))
+        self.max_event_samples = (
+            None if max_event_s is None else max(1, int(round(max_event_s * self.sample_rate)))
+        )
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all carried state and start a new stream at sample 0."""
+        self._n_seen = 0
+        self._crossing = _CrossingState()
+        self._raw_moments = _RunningMoments()
+        self._work_moments = _RunningMoments()
+        self._context: NDArray[np.floating] = np.empty(0, dtype=float)
+        self._pending: NDArray[np.floating] = np.empty(0, dtype=float)
+        self._pending_time: NDArray[np.floating] | UniformTime | None = None
+        self._open_current: list[NDArray[np.floating]] = []
+        self._open_time: list[NDArray[np.floating]] = []
+        self._open_i0 = float("nan")
+        self._open_dropped = False
+        self._n_dropped = 0
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples fed since the last reset (including held-back ones)."""
+        return self._n_seen + len(self._pending)
+
+    @property
+    def n_dropped(self) -> int:
+        """Events discarded since the last reset for exceeding ``max_event_s``."""
+        return self._n_dropped
+
+    def _too_long(self, n_samples: int) -> bool:
+        return self.max_event_samples is not None and n_samples > self.max_event_samples
+
+    def _baseline(self, raw: NDArray[np.floating], ready: int) -> NDArray[np.floating]:
+        """Baseline of ``raw[:ready]``, with ``raw[ready:]`` as right-hand context."""
+        estimator = self.detector.baseline
+        if isinstance(estimator, NoneBaseline):
+            return np.full(ready, self._raw_moments.mean, dtype=raw.dtype)
+        ctx = self._context
+        full = np.concatenate([ctx.astype(raw.dtype, copy=False), raw]) if len(ctx) else raw
+        baseline = np.asarray(estimator.estimate(full, self.sample_rate))
+        baseline = baseline.astype(raw.dtype, copy=False)
+        if self.baseline_context:
+            self._context = full[: len(ctx) + ready][-self.baseline_context :].copy()
+        return baseline[len(ctx) : len(ctx) + ready]
+
+    def _hold(
+        self,
+        raw: NDArray[np.floating],
+        time: NDArray[np.floating] | UniformTime | None,
+    ) -> None:
+        """Append a fed chunk to the samples waiting for right-hand baseline context."""
+        if not len(self._pending):
+            self._pending, self._pending_time = raw, time
+            return
+        held = self._pending_time
+        if held is not None or time is not None:
+            dt, start = 1.0 / self.sample_rate, self._n_seen
+            if held is None:
+                held = UniformTime(len(self._pending), dt, self.t0, index0=start)
+            if time is None:
+                time = UniformTime(len(raw), dt, self.t0, index0=start + len(self._pending))
+            held = np.concatenate([np.asarray(held, dtype=float), np.asarray(time, dtype=float)])
+        self._pending = np.concatenate([self._pending, raw])
+        self._pending_time = held
+
+    def feed(
+        self,
+        current_chunk: NDArray[np.floating],
+        time_chunk: NDArray[np.floating] | None = None,
+    ) -> EventTable:
+        """Process the next chunk and return the events that closed so far.
+
+        ``time_chunk`` is optional; without it times are ``t0 + index / sample_rate``
+        and only the times of event samples are ever computed. The last
+        ``baseline_context`` samples are held back until more data (or
+        :meth:`flush`) arrives, so their events come out one call later.
+        """
+        raw = as_working_array(current_chunk, self.detector.dtype)
+        n = len(raw)
+        if n == 0:
+            return EventTable.empty()
+        if time_chunk is not None and not isinstance(time_chunk, UniformTime):
+            time_chunk = np.asarray(time_chunk, dtype=float)
+            if len(time_chunk) != n:
+                raise ValueError("current_chunk and time_chunk must have the same length")
+        self._hold(raw, time_chunk)
+
+        lookahead = self.baseline_context
+        ready = len(self._pending) - lookahead
+        if ready <= 0 or len(self._context) + len(self._pending) <= 2 * lookahead:
+            # Not yet a full window on both sides of any held sample; keep our own copy
+            if self._pending is raw:
+                self._pending = raw.copy()
+                if isinstance(self._pending_time, np.ndarray):
+                    self._pending_time = self._pending_time.copy()
+            return EventTable.empty()
+        return self._process(ready)
+
+    def _process(self, ready: int) -> EventTable:
+        """Run detection on the first ``ready`` held samples and keep the rest."""
+        held, held_time = self._pending, self._pending_time
+        raw = held[:ready]
+        offset = self._n_seen
+        time: NDArray[np.floating] | UniformTime
+        if held_time is None:
+            time = UniformTime(ready, 1.0 / self.sample_rate, self.t0, index0=offset)
+        elif isinstance(held_time, UniformTime):
+            time = held_time.window(0, ready)
+        else:
+            time = held_time[:ready]
+
+        det = self.detector
+        self._raw_moments.update(raw)
+        baseline = self._baseline(held, ready)
+        self._pending = held[ready:].copy()
+        if held_time is None:
+            self._pending_time = None
+        elif isinstance(held_time, UniformTime):
+            self._pending_time = held_time.window(ready, len(held))
+        else:
+            self._pending_time = held_time[ready:].copy()
+        residual = raw - baseline
+        work = residual if det.direction == "down" else -residual
+        self._work_moments.update(work)
+        self._n_seen += ready
+
+        mean, std_dev = self._work_moments.mean, self._work_moments.std
+        if std_dev == 0:
+            entry = deep = -np.inf
+        else:
+            entry = mean - det.std_multiplier * std_dev
+            deep = mean - det.threshold_multiplier * std_dev
+
+        carried_start = self._crossing.open_start
+        starts, ends, self._crossing = _scan_event_bounds(work, entry, deep, self._crossing, offset)
+
+        tables: list[EventTable] = []
+        in_chunk = starts >= offset
+        carried_closed = bool(len(starts)) and not in_chunk[0]
+        if (
+            carried_closed
+            and not self._open_dropped
+            and self._too_long(int(ends[0] - starts[0]) + 1)
+        ):
+            self._n_dropped += 1
+        elif carried_closed and not self._open_dropped:
+            # The event carried over from earlier chunks closed here (an event dropped
+            # for outgrowing max_event_s was already counted)
+            end_local = int(ends[0]) - offset
+            seg = np.concatenate([*self._open_current, raw[: end_local + 1]])
+            tseg = np.concatenate([*self._open_time, time[: end_local + 1]])
+            if tseg[-1] - tseg[0] >= det.min_duration:
+                tables.append(
+                    _build_event_table(
+                        current=seg,
+                        time=tseg,
+                        starts=np.array([0]),
+                        ends=np.array([len(seg) - 1]),
+                        direction=det.direction,
+                        sample_rate=self.sample_rate,
+                        baseline_values=np.array([self._open_i0]),
+                        analyze_levels=det.analyze_levels,
+                        index_offset=int(starts[0]),
+                    )
+                )
+
+        local_starts = starts[in_chunk] - offset
+        local_ends = ends[in_chunk] - offset
+        keep = (time[local_ends] - time[local_starts]) >= det.min_duration
+        if self.max_event_samples is not None:
+            short = local_ends - local_starts + 1 <= self.max_event_samples
+            self._n_dropped += int(np.count_nonzero(keep & ~short))
+            keep &= short
+        local_starts, local_ends = local_starts[keep], local_ends[keep]
+        if len(local_starts):
+            tables.append(
+                _build_event_table(
+                    current=raw,
+                    time=time,
+                    starts=local_starts,
+                    ends=local_ends,
+                    direction=det.direction,
+                    sample_rate=self.sample_rate,
+                    baseline_values=baseline[local_starts],
+                    analyze_levels=det.analyze_levels,
+                    index_offset=offset,
+                )
+            )
+
+        # Buffer the samples of whatever event is still open for the next chunk
+        open_start = self._crossing.open_start
+        if open_start is None:
+            self._open_current, self._open_time = [], []
+            self._open_dropped = False
+        elif open_start == carried_start:
+            if not self._open_dropped:
+                self._open_current.append(raw.copy())
+                self._open_time.append(np.array(time[:], dtype=float))
+        else:
+            local = open_start - offset
+            self._open_current = [raw[local:].copy()]
+            self._open_time = [np.array(time[local:], dtype=float)]
+            self._open_i0 = float(baseline[local])
+            self._open_dropped = False
+        if (
+            open_start is not None
+            and not self._open_dropped
+            and self._too_long(self._n_seen - open_start)
+        ):
+            self._open_current, self._open_time = [], []
+            self._open_dropped = True
+            self._n_dropped += 1
+
+        return EventTable.concat(tables)
+
+    def flush(self) -> EventTable:
+        """End the stream and reset state for reuse.
+
+        Processes the held-back samples (the recording's true end is their right-hand
+        context) and returns the events that close in them. Events still open at the
+        end are discarded (their end is unknown).
+        """
+        table = self._process(len(self._pending)) if len(self._pending) else EventTable.empty()
+        self.reset()
+        return table
+
+    def detect_chunks(
+        self,
+        chunks: Iterable[NDArray[np.floating] | tuple[NDArray[np.floating], NDArray[np.floating]]],
+    ) -> EventTable:
+        """Feed every chunk (arrays or ``(current, time)`` pairs) and return all events."""
+        tables: list[EventTable] = []
+        for chunk in chunks:
+            if isinstance(chunk, tuple):
+                tables.append(self.feed(chunk[0], chunk[1]))
+            else:
+                tables.append(self.feed(chunk))
+        tables.append(self.flush())
+        return EventTable.concat(tables)
@@ -0,0 +1,193 @@
+"""Threshold grid search that reuses the baseline and work signal of every chunk."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore.detection.baseline import estimate_trace_baseline
+from pynanopore.detection.events import (
+    BaselineScope,
+    EventDetector,
+    _find_event_bounds_numpy,
+    _find_event_bounds_python,
+    _time_window,
+)
+from pynanopore.io.trace import Trace
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SWEEP_PARAMETERS = ("std_multiplier", "threshold_multiplier", "min_duration")
+SWEEP_COLUMNS = (
+    *SWEEP_PARAMETERS,
+    "n_events",
+    "event_rate_hz",
+    "dwell_median",
+    "dwell_mean",
+    "delta_i_median",
+    "delta_i_mean",
+    "delta_i_over_i0_median",
+)
+
+
+def _grid_points(
+    grid: Mapping[str, Sequence[float]] | Iterable[Mapping[str, float]],
+    detector: EventDetector,
+) -> list[tuple[float, float, float]]:
+    """Expand a grid into ``(std_multiplier, threshold_multiplier, min_duration)`` points.
+
+    A mapping of parameter -> values is expanded as a Cartesian product; an iterable
+    of mappings lists the points explicitly. Missing parameters take the detector's.
+    """
+    defaults = {name: getattr(detector, name) for name in SWEEP_PARAMETERS}
+    if isinstance(grid, Mapping):
+        unknown = set(grid) - set(SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+        axes = [list(grid.get(name, [defaults[name]])) for name in SWEEP_PARAMETERS]
+        points = [tuple(float(v) for v in p) for p in itertools.product(*axes)]
+    else:
+        points = []
+        for item in grid:
+            unknown = set(item) - set(SWEEP_PARAMETERS)
+            if unknown:
+                raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+            points.append(tuple(float(item.get(n, defaults[n])) for n in SWEEP_PARAMETERS))
+    if not points:
+        raise ValueError("grid is empty")
+    for std_mult, thr_mult, min_duration in points:
+        if std_mult < 0 or thr_mult < 0:
+            raise ValueError("multipliers must be non-negative")
+        if min_duration < 0:
+            raise ValueError("min_duration must be non-negative")
+    return points  # type: ignore[return-value]
+
+
+def sweep_thresholds(
+    trace: Trace,
+    grid: Mapping[str, Sequence[float]] | Iterable[Mapping[str, float]],
+    *,
+    detector: EventDetector | None = None,
+    interval_length: float = 5.0,
+    overlap: float = 0.0,
+    baseline_scope: BaselineScope = "chunk",
+) -> pd.DataFrame:
+    """
+    Event counts and dwell / ΔI summaries for every threshold combination in ``grid``.
+
+    Equivalent to running :meth:`EventDetector.detect_trace` once per grid point with
+    ``detector``'s other settings (direction, baseline, dtype, engine), but the
+    baseline, work signal and chunk mean/std are computed once per chunk, bounds once
+    per ``(std_multiplier, threshold_multiplier)`` pair, and ``min_duration`` only
+    filters. ΔI uses the event mean from a prefix sum of the raw current, so it agrees
+    with ``Event.delta_i`` to floating-point rounding.
+
+    Parameters
+    ----------
+    grid:
+        ``{"std_multiplier": [...], "threshold_multiplier": [...], "min_duration": [...]}``
+        (Cartesian product) or an iterable of ``{param: value}`` points.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per grid point with columns :data:`SWEEP_COLUMNS`.
+    """
+    import pandas as pd
+
+    detector = detector if detector is not None else EventDetector()
+    if overlap < 0:
+        raise ValueError("overlap must be non-negative")
+    if overlap >= interval_length:
+        raise ValueError("overlap must be smaller than interval_length")
+    if baseline_scope not in ("chunk", "trace"):
+        raise ValueError("baseline_scope must be 'chunk' or 'trace'")
+    points = _grid_points(grid, detector)
+    pairs = sorted({(s, t) for s, t, _ in points})
+    find_bounds = (
+        _find_event_bounds_python if detector.engine == "python" else _find_event_bounds_numpy
+    )
+
+    fs = trace.sample_rate
+    step = max(1, int((interval_length - overlap) * fs))
+    win = max(1, int(interval_length * fs))
+    n = len(trace.current)
+    full_baseline = None
+    if baseline_scope == "trace":
+        full_baseline = estimate_trace_baseline(
+            detector.baseline, trace.current, fs, dtype=detector.dtype
+        )
+
+    # Per (std, thr) pair: one (starts, dwell, delta_i, delta_i_over_i0) tuple per chunk
+    found: dict[tuple[float, float], list[tuple[NDArray[Any], ...]]] = {p: [] for p in pairs}
+    for start in range(0, n, step):
+        end = min(start + win, n)
+        if end - start < 2:
+            break
+        baseline = None if full_baseline is None else full_baseline[start:end]
+        work, base, raw = detector._prepare_signal(trace.current[start:end], fs, baseline)
+        mean = float(np.mean(work, dtype=np.float64))
+        std_dev = float(np.std(work, dtype=np.float64))
+        time = _time_window(trace, start, end)
+        cumulative = np.concatenate(([0.0], np.cumsum(raw, dtype=np.float64)))
+        for std_mult, thr_mult in pairs:
+            if std_dev == 0:
+                continue
+            entry = mean - std_mult * std_dev
+            deep = mean - thr_mult * std_dev
+            starts, ends = find_bounds(work, entry, deep)
+            if not len(starts):
+                continue
+            dwell = np.asarray(time[ends], dtype=float) - np.asarray(time[starts], dtype=float)
+            i0 = np.asarray(base[starts], dtype=float)
+            blockade_mean = (cumulative[ends + 1] - cumulative[starts]) / (ends - starts + 1)
+            delta_i = np.abs(i0 - blockade_mean)
+            abs_i0 = np.abs(i0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(abs_i0 > 1e-12, delta_i / abs_i0, np.nan)
+            found[(std_mult, thr_mult)].append((starts + start, dwell, delta_i, ratio))
+        if end >= n:
+            break
+
+    duration = float(trace.duration)
+    rows = []
+    for std_mult, thr_mult, min_duration in points:
+        # Filter per chunk, then deduplicate by start index in chunk order (as detect_trace)
+        seen_starts = np.empty(0, dtype=np.int64)
+        dwell_parts, delta_parts, ratio_parts = [], [], []
+        for starts, dwell, delta_i, ratio in found[(std_mult, thr_mult)]:
+            keep = dwell >= min_duration
+            kept_starts = np.asarray(starts[keep], dtype=np.int64)
+            fresh = ~np.isin(kept_starts, seen_starts)
+            seen_starts = np.concatenate([seen_starts, kept_starts[fresh]])
+            dwell_parts.append(dwell[keep][fresh])
+            delta_parts.append(delta_i[keep][fresh])
+            ratio_parts.append(ratio[keep][fresh])
+        dwell_all = np.concatenate(dwell_parts) if dwell_parts else np.empty(0)
+        delta_all = np.concatenate(delta_parts) if delta_parts else np.empty(0)
+        ratio_all = np.concatenate(ratio_parts) if ratio_parts else np.empty(0)
+        count = len(dwell_all)
+        rows.append(
+            {
+                "std_multiplier": std_mult,
+                "threshold_multiplier": thr_mult,
+                "min_duration": min_duration,
+                "n_events": count,
+                "event_rate_hz": count / duration if duration > 0 else float("nan"),
+                "dwell_median": float(np.median(dwell_all)) if count else float("nan"),
+                "dwell_mean": float(np.mean(dwell_all)) if count else float("nan"),
+                "delta_i_median": float(np.median(delta_all)) if count else float("nan"),
+                "delta_i_mean": float(np.mean(delta_all)) if count else float("nan"),
+                "delta_i_over_i0_median": (
+                    float(np.nanmedian(ratio_all))
+                    if count and not np.isnan(ratio_all).all()
+                    else float("nan")
+                ),
+            }
+        )
+    return pd.DataFrame(rows, columns=list(SWEEP_COLUMNS))
@@ -1,5 +1,24 @@
 """Dwell-time histogram and exponential fitting."""
 
-from pynanopore.dwelltime.fit import DwellTimeExponentialFit, DwellTimeFitResult
+from pynanopore.dwelltime.bootstrap import BootstrapResult, bootstrap_dwell_fit
+from pynanopore.dwelltime.fit import (
+    DwellTimeExponentialFit,
+    DwellTimeFitResult,
+    ExponentialMixture,
+    clear_fit_cache,
+    fit_cache_info,
+    fit_exponential_mixture,
+    set_fit_cache_size,
+)
 
-__all__ = ["DwellTimeExponentialFit", "DwellTimeFitResult"]
+__all__ = [
+    "BootstrapResult",
+    "bootstrap_dwell_fit",
+    "DwellTimeExponentialFit",
+    "DwellTimeFitResult",
+    "ExponentialMixture",
+    "fit_exponential_mixture",
+    "clear_fit_cache",
+    "fit_cache_info",
+    "set_fit_cache_size",
+]
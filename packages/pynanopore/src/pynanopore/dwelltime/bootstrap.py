@@ -0,0 +1,144 @@
+"""Bootstrap confidence intervals for dwell-time lifetime fits."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore.dwelltime.fit import EM_MAX_ITER, EM_TOL, _em_mixture, fit_exponential_mixture
+
+_INDEX_BLOCK = 1 << 22  # resampled indices per block of closed-form single fits
+_REFIT_BLOCK = 32  # resamples per seeded block of mixture refits
+_MIN_COMPRESSION = 4  # draw counts over distinct dwells when they are this much fewer
+
+
+@dataclass
+class BootstrapResult:
+    """Bootstrap estimates of each fit parameter (one entry per resample)."""
+
+    samples: dict[str, NDArray[np.floating]]
+    n_boot: int
+    n_unconverged: int = 0  # mixture refits that hit ``max_iter``
+
+    def intervals(self, ci: float = 0.95) -> dict[str, list[float]]:
+        """Percentile ``ci`` interval ``[lo, hi]`` of every parameter."""
+        if not 0 < ci < 1:
+            raise ValueError("ci must be in (0, 1)")
+        q = [(1.0 - ci) / 2, (1.0 + ci) / 2]
+        return {
+            name: [float(v) for v in np.quantile(values, q)]
+            for name, values in self.samples.items()
+        }
+
+
+def _refit_block(payload: dict[str, Any]) -> tuple[dict[str, NDArray[np.floating]], int]:
+    """Worker: EM refits of ``payload['size']`` multinomial resamples of the distinct dwells."""
+    rng = np.random.default_rng(payload["seed"])
+    values = payload["values"]
+    rows: dict[str, list[float]] = {}
+    unconverged = 0
+    for _ in range(payload["size"]):
+        counts = rng.multinomial(payload["n"], payload["probabilities"]).astype(float)
+        drawn = counts > 0
+        mixture = _em_mixture(
+            values[drawn],
+            counts[drawn],
+            payload["weights"],
+            payload["taus"],
+            tol=payload["tol"],
+            max_iter=payload["max_iter"],
+            accelerate=True,
+        )
+        unconverged += not mixture.converged
+        for name, value in mixture.parameters().items():
+            rows.setdefault(name, []).append(value)
+    return {name: np.asarray(v) for name, v in rows.items()}, unconverged
+
+
+def bootstrap_dwell_fit(
+    dwells: NDArray[np.floating],
+    n_components: int = 1,
+    *,
+    n_boot: int = 1000,
+    seed: int | None = None,
+    n_jobs: int = 1,
+    start: tuple[NDArray[np.floating], NDArray[np.floating]] | None = None,
+    tol: float = EM_TOL,
+    max_iter: int = EM_MAX_ITER,
+) -> BootstrapResult:
+    """
+    Nonparametric bootstrap of the exponential-mixture MLE on ``dwells``.
+
+    A single exponential (``n_components=1``) has the closed-form MLE ``tau = mean(t)``.
+    Resample indices are drawn as one ``(n_boot, n)`` matrix (in row blocks of at most
+    4M entries), and ``tau`` for every resample is a row mean of the gathered dwells.
+    When the distinct dwell values are at least 4x fewer than the events (durations are
+    multiples of the sampling interval), the matrix holds multinomial counts per
+    distinct value instead, and the means are a single matrix-vector product.
+
+    Mixtures are refitted by EM. Each resample is a multinomial draw of counts over the
+    distinct dwell values, equivalent to resampling the events, and is warm-started from
+    ``start = (weights, taus)`` (default: the fit to ``dwells``). Resamples are split
+    into fixed blocks of 32, each with its own child seed of ``seed``, and the blocks
+    run in a process pool with ``n_jobs > 1`` (``-1``: all CPUs). The estimates are the
+    same for any ``n_jobs``.
+    """
+    from pynanopore.detection.parallel import resolve_n_jobs
+
+    t = np.asarray(dwells, dtype=float)
+    if n_boot < 2:
+        raise ValueError("n_boot must be at least 2")
+    if n_components < 1:
+        raise ValueError("n_components must be >= 1")
+    if not len(t) or np.any(~np.isfinite(t)) or np.any(t <= 0):
+        raise ValueError("dwell times must be non-empty, positive and finite")
+    n = len(t)
+
+    values, counts = np.unique(t, return_counts=True)
+    if n_components == 1:
+        rng = np.random.default_rng(seed)
+        taus = np.empty(n_boot)
+        compressed = len(values) * _MIN_COMPRESSION <= n
+        rows = max(1, _INDEX_BLOCK // (len(values) if compressed else n))
+        for first in range(0, n_boot, rows):
+            m = min(rows, n_boot - first)
+            if compressed:
+                taus[first : first + m] = rng.multinomial(n, counts / n, size=m) @ values / n
+            else:
+                taus[first : first + m] = t[rng.integers(0, n, size=(m, n))].mean(axis=1)
+        return BootstrapResult(samples={"tau": taus}, n_boot=n_boot)
+
+    if start is None:
+        point = fit_exponential_mixture(t, n_components, tol=tol, max_iter=max_iter)
+        start = (point.weights, point.taus)
+    weights, start_taus = (np.asarray(x, dtype=float) for x in start)
+    if weights.shape != (n_components,) or start_taus.shape != (n_components,):
+        raise ValueError(f"start must hold {n_components} weights and taus")
+    sizes = [min(_REFIT_BLOCK, n_boot - first) for first in range(0, n_boot, _REFIT_BLOCK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    payloads = [
+        {
+            "values": values,
+            "probabilities": counts / n,
+            "n": n,
+            "size": size,
+            "seed": block_seed,
+            "weights": weights,
+            "taus": start_taus,
+            "tol": tol,
+            "max_iter": max_iter,
+        }
+        for size, block_seed in zip(sizes, seeds, strict=True)
+    ]
+    n_jobs = min(resolve_n_jobs(n_jobs), len(payloads))
+    if n_jobs == 1:
+        blocks = [_refit_block(payload) for payload in payloads]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = list(pool.map(_refit_block, payloads))
+    samples = {name: np.concatenate([b[0][name] for b in blocks]) for name in blocks[0][0]}
+    return BootstrapResult(samples=samples, n_boot=n_boot, n_unconverged=sum(b[1] for b in blocks))
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import asdict, dataclass, replace
+from functools import cached_property
 from typing import Literal
 
 import numpy as np
@@ -13,6 +19,11 @@ from scipy.optimize import curve_fit, minimize
 FitType = Literal["single", "double"]
 Binning = Literal["linear", "log"]
 FitMethod = Literal["mle", "histogram"]
+DoubleSolver = Literal["em", "nelder-mead"]
+
+EM_TOL = 1e-9
+EM_MAX_ITER = 1000
+DEFAULT_FIT_CACHE_SIZE = 256
 
 
 @dataclass
@@ -29,11 +40,245 @@ class DwellTimeFitResult:
     bin_centers: list[float]
     hist: list[float]
     fitted: list[float]
+    n_iter: int | None = None  # solver iterations (mixture fits)
+    converged: bool | None = None
+    ci: float | None = None
+    n_boot: int | None = None
+    confidence_intervals: dict[str, list[float]] | None = None  # parameter -> [lo, hi]
 
     def to_dict(self) -> dict:
         return asdict(self)
 
 
+@dataclass
+class ExponentialMixture:
+    """Maximum-likelihood mixture of exponentials, components ordered by increasing ``tau``."""
+
+    weights: NDArray[np.floating]
+    taus: NDArray[np.floating]
+    log_likelihood: float
+    n_iter: int
+    converged: bool
+
+    @property
+    def n_components(self) -> int:
+        return len(self.taus)
+
+    def pdf(self, t: NDArray[np.floating]) -> NDArray[np.floating]:
+        t = np.asarray(t, dtype=float)
+        return np.sum(
+            self.weights[:, None] / self.taus[:, None] * np.exp(-t[None, :] / self.taus[:, None]),
+            axis=0,
+        )
+
+    def parameters(self) -> dict[str, float]:
+        """``{"tau": ...}``, ``{"w", "tau1", "tau2"}`` or ``{"w1".., "tau1"..}`` by component count."""
+        if self.n_components == 1:
+            return {"tau": float(self.taus[0])}
+        if self.n_components == 2:
+            return {
+                "w": float(self.weights[0]),
+                "tau1": float(self.taus[0]),
+                "tau2": float(self.taus[1]),
+            }
+        params = {f"w{k + 1}": float(w) for k, w in enumerate(self.weights)}
+        params.update({f"tau{k + 1}": float(tau) for k, tau in enumerate(self.taus)})
+        return params
+
+
+def _em_step(
+    t: NDArray[np.floating],
+    counts: NDArray[np.floating],
+    weights: NDArray[np.floating],
+    taus: NDArray[np.floating],
+    buffer: NDArray[np.floating],
+) -> tuple[NDArray[np.floating], NDArray[np.floating], float]:
+    """One EM update over distinct dwells ``t`` seen ``counts`` times.
+
+    Returns the new ``(weights, taus)`` and the log-likelihood of the old ones. Densities
+    are scaled by ``exp(t / tau_max)`` so the slowest component never underflows.
+    """
+    rates = 1.0 / taus
+    slowest = float(rates.min())
+    np.multiply.outer(slowest - rates, t, out=buffer)
+    np.exp(buffer, out=buffer)
+    buffer *= (weights * rates)[:, None]
+    total = buffer.sum(axis=0)
+    log_likelihood = float(counts @ (np.log(total) - slowest * t))
+    buffer /= total  # responsibilities
+    occupancy = buffer @ counts
+    occupied = occupancy > 0
+    new_taus = np.where(
+        occupied, (buffer @ (counts * t)) / np.where(occupied, occupancy, 1.0), taus
+    )
+    return occupancy / counts.sum(), new_taus, log_likelihood
+
+
+def fit_exponential_mixture(
+    dwells: NDArray[np.floating],
+    n_components: int = 2,
+    *,
+    tol: float = EM_TOL,
+    max_iter: int = EM_MAX_ITER,
+    accelerate: bool = True,
+) -> ExponentialMixture:
+    """
+    Maximum-likelihood ``sum_k w_k / tau_k * exp(-t / tau_k)`` by expectation-maximization.
+
+    Each M-step is closed form (``w_k`` = mean responsibility, ``tau_k`` = responsibility-
+    weighted mean dwell), so an update costs a few passes over the dwells. Components
+    start at the means of equal-count quantile groups. Identical dwells (durations are
+    multiples of the sampling interval) are visited once with their count. With
+    ``accelerate`` the updates are extrapolated (SQUAREM) in ``(w, log tau)`` and an
+    extrapolation that lowers the likelihood is discarded, so the likelihood still never
+    decreases. The fit stops once a plain EM update improves the log-likelihood by less
+    than ``tol`` relative to it; ``n_iter`` counts EM updates.
+    """
+    t = np.asarray(dwells, dtype=float)
+    if n_components < 1:
+        raise ValueError("n_components must be >= 1")
+    if len(t) < n_components:
+        raise ValueError("need at least one dwell time per component")
+    if np.any(~np.isfinite(t)) or np.any(t <= 0):
+        raise ValueError("dwell times must be positive and finite")
+    if tol <= 0 or max_iter < 1:
+        raise ValueError("tol must be positive and max_iter >= 1")
+
+    k = int(n_components)
+    bounds = np.linspace(0, len(t), k + 1).astype(int)
+    groups = np.split(np.partition(t, bounds[1:-1]), bounds[1:-1]) if k > 1 else [t]
+    taus = np.array([float(np.mean(g)) for g in groups])
+    values, counts = np.unique(t, return_counts=True)
+    return _em_mixture(
+        values,
+        counts.astype(float),
+        np.full(k, 1.0 / k),
+        taus,
+        tol=tol,
+        max_iter=max_iter,
+        accelerate=accelerate,
+    )
+
+
+def _em_mixture(
+    values: NDArray[np.floating],
+    counts: NDArray[np.floating],
+    weights: NDArray[np.floating],
+    taus: NDArray[np.floating],
+    *,
+    tol: float,
+    max_iter: int,
+    accelerate: bool,
+) -> ExponentialMixture:
+    """EM loop of :func:`fit_exponential_mixture` from a given start, on weighted dwells."""
+    k = len(taus)
+    buffer = np.empty((k, len(values)))
+
+    def step(w: NDArray, tau: NDArray) -> tuple[NDArray, NDArray, float]:
+        return _em_step(values, counts, w, tau, buffer)
+
+    # Invariant: (w1, tau1) is the EM update of (weights, taus), whose log-likelihood is known
+    w1, tau1, log_likelihood = step(weights, taus)
+    n_iter, converged = 1, False
+    while n_iter < max_iter:
+        w2, tau2, ll1 = step(w1, tau1)
+        n_iter += 1
+        if ll1 - log_likelihood <= tol * abs(ll1):
+            weights, taus, log_likelihood, converged = w1, tau1, ll1, True
+            break
+        if accelerate and n_iter < max_iter:
+            # SQUAREM extrapolation through the last two updates, kept only if it helps
+            x0, x1, x2 = (
+                np.r_[w, np.log(tau)] for w, tau in ((weights, taus), (w1, tau1), (w2, tau2))
+            )
+            r, v = x1 - x0, x2 - 2 * x1 + x0
+            v_norm = float(np.linalg.norm(v))
+            alpha = min(-float(np.linalg.norm(r)) / v_norm, -1.0) if v_norm > 0 else -1.0
+            x = x0 - 2 * alpha * r + alpha**2 * v
+            w_x, tau_x = x[:k], np.exp(x[k:])
+            if np.all(w_x > 0) and np.all(np.isfinite(tau_x)) and np.all(tau_x > 0):
+                w_x = w_x / w_x.sum()
+                w_next, tau_next, ll_x = step(w_x, tau_x)
+                n_iter += 1
+                if ll_x >= ll1:
+                    weights, taus, log_likelihood, w1, tau1 = w_x, tau_x, ll_x, w_next, tau_next
+                    continue
+        weights, taus, log_likelihood, w1, tau1 = w1, tau1, ll1, w2, tau2
+
+    order = np.argsort(taus)
+    return ExponentialMixture(
+        weights=weights[order],
+        taus=taus[order],
+        log_likelihood=log_likelihood,
+        n_iter=n_iter,
+        converged=converged,
+    )
+
+
+class _FitCache:
+    """Thread-safe LRU of fit results shared by all :class:`DwellTimeExponentialFit` objects."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[Hashable, DwellTimeFitResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> DwellTimeFitResult | None:
+        with self._lock:
+            result = self._items.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Hashable, result: DwellTimeFitResult) -> None:
+        with self._lock:
+            self._items[key] = result
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._items) > maxsize:
+                self._items.popitem(last=False)
+
+
+_FIT_CACHE = _FitCache(DEFAULT_FIT_CACHE_SIZE)
+
+
+def clear_fit_cache() -> None:
+    """Drop all results from the process-wide dwell-time fit cache."""
+    _FIT_CACHE.clear()
+
+
+def set_fit_cache_size(maxsize: int) -> None:
+    """Keep at most ``maxsize`` results in the process-wide fit cache (0 disables it)."""
+    if maxsize < 0:
+        raise ValueError("maxsize must be >= 0")
+    _FIT_CACHE.resize(int(maxsize))
+
+
+def fit_cache_info() -> dict[str, int]:
+    """``hits``, ``misses``, ``size`` and ``maxsize`` of the process-wide fit cache."""
+    return {
+        "hits": _FIT_CACHE.hits,
+        "misses": _FIT_CACHE.misses,
+        "size": len(_FIT_CACHE._items),
+        "maxsize": _FIT_CACHE.maxsize,
+    }
+
+
 def _extract_dwells(events_df: pd.DataFrame) -> NDArray[np.floating]:
     if "difference" in events_df.columns:
         col = "difference"
@@ -74,6 +319,12 @@ class DwellTimeExponentialFit:
 
     Preferred path: :meth:`fit` with ``method='mle'`` returning physical lifetimes ``τ``.
     Legacy histogram ``a * exp(b * x)`` curve_fit remains available via ``fit_data``.
+
+    Results are memoized per model (fit type, method, solver settings), so ``fit``,
+    ``compare_models`` and ``fitted_curve`` never fit the same model twice. With
+    ``shared_cache`` they are also kept in a process-wide LRU keyed by a hash of the
+    dwell times, ``bins`` and ``binning`` (see :func:`set_fit_cache_size`), so another
+    instance over identical data reuses them. Treat returned results as read-only.
     """
 
     def __init__(
@@ -82,6 +333,7 @@ class DwellTimeExponentialFit:
         bins: int = 250,
         *,
         binning: Binning = "linear",
+        shared_cache: bool = True,
     ) -> None:
         if bins < 1:
             raise ValueError("bins must be >= 1")
@@ -93,6 +345,33 @@ class DwellTimeExponentialFit:
         self.params_single: NDArray[np.floating] | None = None
         self.params_double: NDArray[np.floating] | None = None
         self.last_result: DwellTimeFitResult | None = None
+        self.shared_cache = bool(shared_cache)
+        self._results: dict[tuple[Hashable, ...], DwellTimeFitResult] = {}
+
+    @cached_property
+    def _data_key(self) -> tuple[Hashable, ...]:
+        digest = hashlib.blake2b(np.ascontiguousarray(self.dwells).tobytes(), digest_size=16)
+        return (digest.hexdigest(), len(self.dwells), self.bins, self.binning)
+
+    def _recall(self, key: tuple[Hashable, ...]) -> DwellTimeFitResult | None:
+        """Memoized result for ``key`` (this instance first, then the shared cache)."""
+        result = self._results.get(key)
+        if result is None and self.shared_cache and _FIT_CACHE.maxsize:
+            shared = _FIT_CACHE.get((*self._data_key, *key))
+            if shared is not None:
+                result = self._results[key] = copy.deepcopy(shared)
+        if result is not None:
+            self.last_result = result
+        return result
+
+    def _remember(
+        self, key: tuple[Hashable, ...], result: DwellTimeFitResult
+    ) -> DwellTimeFitResult:
+        self._results[key] = result
+        if self.shared_cache and _FIT_CACHE.maxsize:
+            _FIT_CACHE.put((*self._data_key, *key), copy.deepcopy(result))
+        self.last_result = result
+        return result
 
     def _prepare_histogram(self) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
         dwells = self.dwells
@@ -170,6 +449,9 @@ class DwellTimeExponentialFit:
     # --- Modern MLE / physical lifetimes ----------------------------------------
     def fit_mle_single(self) -> DwellTimeFitResult:
         """MLE for Exponential(τ): τ̂ = mean(t)."""
+        key = ("mle", "single")
+        if (cached := self._recall(key)) is not None:
+            return cached
         dwells = self.dwells
         tau = float(np.mean(dwells))
         ll = float(np.sum(np.log(_single_pdf(dwells, tau))))
@@ -186,11 +468,56 @@ class DwellTimeExponentialFit:
             hist=self.hist.tolist(),
             fitted=fitted.tolist(),
         )
-        self.last_result = result
-        return result
+        return self._remember(key, result)
+
+    def fit_mle_mixture(
+        self,
+        n_components: int,
+        *,
+        tol: float = EM_TOL,
+        max_iter: int = EM_MAX_ITER,
+    ) -> DwellTimeFitResult:
+        """MLE for a mixture of ``n_components`` exponentials by accelerated EM.
+
+        See :func:`fit_exponential_mixture`; ``n_iter`` / ``converged`` are reported on
+        the result.
+        """
+        key = ("mle", "mixture", int(n_components), float(tol), int(max_iter))
+        if (cached := self._recall(key)) is not None:
+            return cached
+        mixture = fit_exponential_mixture(self.dwells, n_components, tol=tol, max_iter=max_iter)
+        k = 2 * n_components - 1  # taus and free weights
+        ll = mixture.log_likelihood
+        fit_type = {1: "single", 2: "double"}.get(n_components, f"mixture{n_components}")
+        result = DwellTimeFitResult(
+            fit_type=fit_type,
+            method="mle",
+            parameters=mixture.parameters(),
+            log_likelihood=ll,
+            aic=_aic(k, ll),
+            bic=_bic(k, len(self.dwells), ll),
+            n_events=len(self.dwells),
+            bin_centers=self.bin_centers.tolist(),
+            hist=self.hist.tolist(),
+            fitted=mixture.pdf(self.bin_centers).tolist(),
+            n_iter=mixture.n_iter,
+            converged=mixture.converged,
+        )
+        return self._remember(key, result)
 
-    def fit_mle_double(self) -> DwellTimeFitResult:
-        """MLE for mixture w/τ1 * exp + (1-w)/τ2 * exp."""
+    def fit_mle_double(self, *, solver: DoubleSolver = "em") -> DwellTimeFitResult:
+        """MLE for mixture w/τ1 * exp + (1-w)/τ2 * exp.
+
+        ``solver='em'`` (default) uses :meth:`fit_mle_mixture`; ``'nelder-mead'`` minimizes
+        the negative log-likelihood directly and is kept as a reference.
+        """
+        if solver == "em":
+            return self.fit_mle_mixture(2)
+        if solver != "nelder-mead":
+            raise ValueError("solver must be 'em' or 'nelder-mead'")
+        key = ("mle", "double", solver)
+        if (cached := self._recall(key)) is not None:
+            return cached
         dwells = self.dwells
         mean = float(np.mean(dwells))
 
@@ -226,29 +553,64 @@ class DwellTimeExponentialFit:
             bin_centers=self.bin_centers.tolist(),
             hist=self.hist.tolist(),
             fitted=fitted.tolist(),
+            n_iter=int(opt.nit),
+            converged=bool(opt.success),
         )
-        self.last_result = result
-        return result
+        return self._remember(key, result)
 
     def fit(
         self,
         fit_type: FitType | Literal["auto"] = "single",
         *,
         method: FitMethod = "mle",
+        ci: float | None = None,
+        n_boot: int = 1000,
+        seed: int | None = None,
+        n_jobs: int = 1,
     ) -> DwellTimeFitResult:
         """
         Fit dwell times.
 
-        ``fit_type='auto'`` (MLE only) picks single vs double by lower AIC.
+        ``fit_type='auto'`` (MLE only) picks single vs double by lower AIC. With ``ci``
+        (e.g. ``0.95``, MLE only) the chosen model is refitted on ``n_boot`` bootstrap
+        resamples (:func:`~pynanopore.dwelltime.bootstrap.bootstrap_dwell_fit`; ``n_jobs``
+        processes for double fits) and percentile intervals are set on
+        ``confidence_intervals``.
         """
+        if ci is not None:
+            if method != "mle":
+                raise ValueError("confidence intervals require method='mle'")
+            if not 0 < ci < 1:
+                raise ValueError("ci must be in (0, 1)")
+            point = self.fit(fit_type, method=method)
+            # Seeded bootstraps are reproducible, so they are memoized like point fits
+            key = ("mle", point.fit_type, "bootstrap", float(ci), int(n_boot), seed)
+            if seed is not None and (cached := self._recall(key)) is not None:
+                return cached
+            result = replace(point)
+            self._attach_bootstrap(result, ci, n_boot=n_boot, seed=seed, n_jobs=n_jobs)
+            if seed is not None:
+                return self._remember(key, result)
+            self.last_result = result
+            return result
         if method == "histogram":
             chosen: FitType = "single" if fit_type == "auto" else fit_type
+            key = ("histogram", chosen)
+            if (cached := self._recall(key)) is not None:
+                legacy = np.array(
+                    [cached.parameters[name] for name in "abcd" if name in cached.parameters]
+                )
+                if chosen == "single":
+                    self.params_single = legacy
+                else:
+                    self.params_double = legacy
+                return cached
             self.fit_data(chosen)
             # Map legacy params to approximate tau = -1/b when b < 0
             if chosen == "single":
                 a, b = self.get_parameters("single")
                 tau = (-1.0 / b) if b < 0 else float("nan")
-                fitted = self.fitted_curve("single")
+                fitted = self.single_exponential(self.bin_centers, a, b)
                 # Pseudo LL from density at events (rough)
                 pdf = np.clip(a * np.exp(b * self.dwells), 1e-300, None)
                 ll = float(np.sum(np.log(pdf)))
@@ -266,7 +628,7 @@ class DwellTimeExponentialFit:
                 )
             else:
                 a, b, c, d = self.get_parameters("double")
-                fitted = self.fitted_curve("double")
+                fitted = self.double_exponential(self.bin_centers, a, b, c, d)
                 pdf = np.clip(
                     a * np.exp(b * self.dwells) + c * np.exp(d * self.dwells),
                     1e-300,
@@ -292,8 +654,7 @@ class DwellTimeExponentialFit:
                     hist=self.hist.tolist(),
                     fitted=fitted.tolist(),
                 )
-            self.last_result = result
-            return result
+            return self._remember(key, result)
 
         # MLE
         if fit_type == "auto":
@@ -308,6 +669,26 @@ class DwellTimeExponentialFit:
             return self.fit_mle_double()
         raise ValueError("fit_type must be 'single', 'double', or 'auto'")
 
+    def _attach_bootstrap(
+        self, result: DwellTimeFitResult, ci: float, *, n_boot: int, seed: int | None, n_jobs: int
+    ) -> None:
+        from pynanopore.dwelltime.bootstrap import bootstrap_dwell_fit
+
+        params = result.parameters
+        if result.fit_type == "single":
+            boot = bootstrap_dwell_fit(self.dwells, 1, n_boot=n_boot, seed=seed)
+        else:
+            start = (
+                np.array([params["w"], 1.0 - params["w"]]),
+                np.array([params["tau1"], params["tau2"]]),
+            )
+            boot = bootstrap_dwell_fit(
+                self.dwells, 2, n_boot=n_boot, seed=seed, n_jobs=n_jobs, start=start
+            )
+        result.confidence_intervals = boot.intervals(ci)
+        result.ci = ci
+        result.n_boot = n_boot
+
     def compare_models(self) -> dict[str, DwellTimeFitResult]:
         """Return MLE fits for single and double with AIC/BIC."""
         return {
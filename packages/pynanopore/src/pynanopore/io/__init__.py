@@ -1,6 +1,17 @@
 """I/O helpers for electrophysiology recordings."""
 
+from pynanopore.io.abf_mmap import MemmapABFReader
+from pynanopore.io.npt import convert_to_npt, load_npt, write_npt
 from pynanopore.io.readers import ReadingData, load_trace
-from pynanopore.io.trace import Trace
+from pynanopore.io.trace import Trace, UniformTime
 
-__all__ = ["Trace", "load_trace", "ReadingData"]
+__all__ = [
+    "Trace",
+    "load_trace",
+    "ReadingData",
+    "MemmapABFReader",
+    "UniformTime",
+    "convert_to_npt",
+    "load_npt",
+    "write_npt",
+]
@@ -0,0 +1,162 @@
+"""Memory-mapped ABF access with lazily scaled sample windows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pyabf
+from numpy.typing import DTypeLike, NDArray
+
+from pynanopore._dtypes import WorkingDType, load_dtype
+from pynanopore.io.trace import Trace, UniformTime
+
+_MEAN_BLOCK = 1 << 22  # samples per block when scanning the file for its mean
+
+
+class ScaledSamples:
+    """Read-only 1-D array-like over raw ADC samples, scaled to physical units on access.
+
+    Slicing returns a new float array for just that window (``raw * gain + offset``),
+    so memory use follows the window size rather than the recording length.
+    ``np.asarray`` on the whole object materializes every sample.
+    """
+
+    ndim = 1
+
+    def __init__(
+        self,
+        raw: NDArray[Any],
+        gain: float = 1.0,
+        offset: float = 0.0,
+        *,
+        dtype: DTypeLike = np.float64,
+    ):
+        if raw.ndim != 1:
+            raise ValueError("raw samples must be one-dimensional")
+        self.raw = raw
+        self.gain = float(gain)
+        self.offset = float(offset)
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (len(self.raw),)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __getitem__(self, key):
+        values = np.asarray(self.raw[key], dtype=self.dtype)
+        if self.gain != 1.0:
+            values = values * self.dtype.type(self.gain)
+        if self.offset != 0.0:
+            values = values + self.dtype.type(self.offset)
+        return values if np.ndim(values) else self.dtype.type(values)
+
+    def __array__(self, dtype: DTypeLike | None = None, copy: bool | None = None) -> NDArray[Any]:
+        out = self[:]
+        return out if dtype is None else out.astype(dtype, copy=False)
+
+    def mean(self) -> float:
+        """Mean of the scaled signal, accumulated block-wise over the raw samples."""
+        n = len(self.raw)
+        if n == 0:
+            return float("nan")
+        total = 0.0
+        for start in range(0, n, _MEAN_BLOCK):
+            total += float(np.sum(self.raw[start : start + _MEAN_BLOCK], dtype=np.float64))
+        return total / n * self.gain + self.offset
+
+
+class MemmapABFReader:
+    """
+    Open one sweep/channel of an ABF file without loading its data section.
+
+    The header is parsed by ``pyabf`` (``loadData=False``); the data section is then
+    memory-mapped as raw int16 (or float32) samples and scaled to pA per window, in
+    ``dtype`` (``'auto'``: float32 for large recordings, see :func:`load_trace`).
+    :meth:`to_trace` returns a :class:`Trace` backed by these lazy arrays, which
+    :class:`ChunkGenerator` and :meth:`EventDetector.detect_trace` slice chunk by chunk.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        sweep: int = 0,
+        channel: int = 0,
+        invert_negative: bool = True,
+        dtype: WorkingDType = "auto",
+    ):
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {path}")
+        abf = pyabf.ABF(str(path), loadData=False)
+        if sweep not in abf.sweepList:
+            raise ValueError(f"Sweep {sweep} not in ABF sweepList {list(abf.sweepList)}")
+        if channel not in abf.channelList:
+            raise ValueError(f"Channel {channel} not in ABF channelList {list(abf.channelList)}")
+
+        n_channels = int(abf.channelCount)
+        data = np.memmap(
+            path,
+            dtype=abf._dtype,
+            mode="r",
+            offset=int(abf.dataByteStart),
+            shape=(int(abf.dataPointCount) // n_channels, n_channels),
+        )
+        point_start, point_count = _sweep_bounds(abf, sweep)
+        raw = data[point_start : point_start + point_count, channel]
+
+        scaled = np.dtype(abf._dtype) == np.int16
+        gain = float(abf._dataGain[channel]) if scaled else 1.0
+        offset = float(abf._dataOffset[channel]) if scaled else 0.0
+        work_dtype = load_dtype(dtype, point_count)
+        current = ScaledSamples(raw, gain, offset, dtype=work_dtype)
+        if invert_negative and current.mean() < 0:
+            current = ScaledSamples(raw, -gain, -offset, dtype=work_dtype)
+
+        self.path = path
+        self.sweep = sweep
+        self.channel = channel
+        self.sample_rate = float(abf.dataRate)
+        self.current = current
+        self.time = UniformTime(point_count, float(abf.dataSecPerPoint))
+
+    @property
+    def n_samples(self) -> int:
+        return len(self.current)
+
+    def window(self, start: int, end: int) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+        """Return scaled ``(current, time)`` for samples ``[start, end)``."""
+        return self.current[start:end], self.time[start:end]
+
+    def iter_chunks(
+        self, interval_length: float = 5.0
+    ) -> Iterator[tuple[NDArray[np.floating], NDArray[np.floating]]]:
+        """Yield consecutive ``(current, time)`` windows of ``interval_length`` seconds."""
+        step = max(1, int(self.sample_rate * interval_length))
+        for start in range(0, self.n_samples, step):
+            yield self.window(start, start + step)
+
+    def to_trace(self) -> Trace:
+        """A :class:`Trace` whose arrays are scaled lazily, window by window."""
+        return Trace(
+            time=self.time,
+            current=self.current,  # type: ignore[arg-type]
+            sample_rate=self.sample_rate,
+            source=str(self.path),
+        )
+
+
+def _sweep_bounds(abf: pyabf.ABF, sweep: int) -> tuple[int, int]:
+    """First sample and sample count of ``sweep`` (mirrors ``pyabf.ABF.setSweep``)."""
+    n_channels = int(abf.channelCount)
+    synch = getattr(abf, "_synchArraySection", None)
+    if abf.sweepCount > 1 and synch is not None and len(set(synch.lLength)) > 1:
+        start = sum(int(length) // n_channels for length in synch.lLength[:sweep])
+        return start, int(synch.lLength[sweep]) // n_channels
+    return int(abf.sweepPointCount) * sweep, int(abf.sweepPointCount)
@@ -0,0 +1,257 @@
+"""Native ``.npt`` trace cache: raw samples + scaling metadata, memory-mappable.
+
+Layout (little-endian)::
+
+    8 bytes   magic  b"PYNPT\\x01\\x00\\x00"
+    8 bytes   uint64 length of the JSON header
+    N bytes   JSON header (utf-8)
+    padding   to a multiple of 64 bytes
+    samples   n_samples x dtype (int16 / float32 / float64), scaled as raw * gain + offset
+    padding   to a multiple of 64 bytes
+    time      n_samples x float64, only when the time axis is not uniform
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore._dtypes import WorkingDType, load_dtype
+from pynanopore._version import __version__
+from pynanopore.io.abf_mmap import MemmapABFReader, ScaledSamples
+from pynanopore.io.trace import Trace, UniformTime
+
+NPT_SUFFIX = ".npt"
+NPT_MAGIC = b"PYNPT\x01\x00\x00"
+NPT_FORMAT_VERSION = 1
+_ALIGN = 64
+_WRITE_BLOCK = 1 << 22  # samples per write when streaming from a memmap
+_SUPPORTED_DTYPES = {"int16", "float32", "float64"}
+
+
+def _aligned(n: int) -> int:
+    return -(-n // _ALIGN) * _ALIGN
+
+
+def _uniform_axis(time: NDArray[np.floating], sample_rate: float) -> UniformTime | None:
+    """Return an equivalent :class:`UniformTime` if ``time`` is evenly spaced, else None."""
+    n = len(time)
+    if n < 2:
+        return UniformTime(n, 1.0 / sample_rate, float(time[0]) if n else 0.0)
+    dt = (float(time[-1]) - float(time[0])) / (n - 1)
+    if dt <= 0:
+        return None
+    axis = UniformTime(n, dt, float(time[0]))
+    deviation = float(np.max(np.abs(np.asarray(axis) - time)))
+    return axis if deviation <= 1e-6 * dt else None
+
+
+def write_npt(
+    path: str | Path,
+    current: NDArray[Any],
+    *,
+    sample_rate: float,
+    time: NDArray[np.floating] | UniformTime | None = None,
+    gain: float = 1.0,
+    offset: float = 0.0,
+    source: dict[str, Any] | None = None,
+) -> Path:
+    """Write raw samples (physical value = ``raw * gain + offset``) to an ``.npt`` file.
+
+    ``current`` may be a memmap; it is written block by block. ``time`` defaults to a
+    uniform axis starting at 0; evenly spaced arrays are stored as ``t0`` / ``dt``.
+    """
+    if sample_rate <= 0:
+        raise ValueError("sample_rate must be positive")
+    dtype = np.dtype(current.dtype)
+    if dtype.name not in _SUPPORTED_DTYPES:
+        raise ValueError(
+            f"Unsupported sample dtype {dtype}; use one of {sorted(_SUPPORTED_DTYPES)}"
+        )
+    n = len(current)
+
+    explicit_time: NDArray[np.floating] | None = None
+    if time is None:
+        axis: UniformTime | None = UniformTime(n, 1.0 / sample_rate)
+    elif isinstance(time, UniformTime):
+        axis = time
+    else:
+        time_arr = np.asarray(time, dtype=float)
+        if len(time_arr) != n:
+            raise ValueError("time and current must have the same length")
+        axis = _uniform_axis(time_arr, sample_rate)
+        if axis is None:
+            explicit_time = time_arr
+
+    header = {
+        "format_version": NPT_FORMAT_VERSION,
+        "pynanopore_version": __version__,
+        "dtype": dtype.newbyteorder("<").str,
+        "n_samples": n,
+        "sample_rate": float(sample_rate),
+        "gain": float(gain),
+        "offset": float(offset),
+        "time": (
+            {"kind": "explicit"}
+            if axis is None
+            else {"kind": "uniform", "t0": axis.t0 + axis.index0 * axis.dt, "dt": axis.dt}
+        ),
+        "source": source or {},
+    }
+    payload = json.dumps(header).encode("utf-8")
+    data_offset = _aligned(16 + len(payload))
+
+    out = Path(path)
+    with out.open("wb") as fh:
+        fh.write(NPT_MAGIC)
+        fh.write(struct.pack("<Q", len(payload)))
+        fh.write(payload)
+        fh.write(b"\0" * (data_offset - 16 - len(payload)))
+        for start in range(0, n, _WRITE_BLOCK):
+            block = np.asarray(current[start : start + _WRITE_BLOCK])
+            fh.write(np.ascontiguousarray(block, dtype=header["dtype"]).tobytes())
+        if explicit_time is not None:
+            written = data_offset + n * dtype.itemsize
+            fh.write(b"\0" * (_aligned(written) - written))
+            fh.write(np.ascontiguousarray(explicit_time, dtype="<f8").tobytes())
+    return out
+
+
+def read_npt_header(path: str | Path) -> dict[str, Any]:
+    """Return the JSON header of an ``.npt`` file (plus derived ``data_offset``)."""
+    with Path(path).open("rb") as fh:
+        magic = fh.read(8)
+        if magic != NPT_MAGIC:
+            raise ValueError(f"Not a pynanopore .npt file: {path}")
+        (length,) = struct.unpack("<Q", fh.read(8))
+        header: dict[str, Any] = json.loads(fh.read(length).decode("utf-8"))
+    if header.get("format_version") != NPT_FORMAT_VERSION:
+        raise ValueError(f"Unsupported .npt format version: {header.get('format_version')}")
+    header["data_offset"] = _aligned(16 + length)
+    return header
+
+
+def load_npt(path: str | Path, *, mmap: bool = True, dtype: WorkingDType = "auto") -> Trace:
+    """Open an ``.npt`` file as a :class:`Trace`.
+
+    With ``mmap=True`` samples stay on disk and are scaled per sliced window;
+    otherwise they are read and scaled into one array. Scaled samples use ``dtype``
+    (``'auto'``: float32 for large traces, as in :func:`load_trace`).
+    """
+    path = Path(path)
+    header = read_npt_header(path)
+    sample_dtype = np.dtype(header["dtype"])
+    n = int(header["n_samples"])
+    data_offset = int(header["data_offset"])
+    gain, offset = float(header["gain"]), float(header["offset"])
+
+    raw: NDArray[Any]
+    if mmap:
+        raw = np.memmap(path, dtype=sample_dtype, mode="r", offset=data_offset, shape=(n,))
+    else:
+        raw = np.fromfile(path, dtype=sample_dtype, count=n, offset=data_offset)
+    samples = ScaledSamples(raw, gain, offset, dtype=load_dtype(dtype, n))
+    current = samples if mmap else samples[:]
+
+    time_info = header["time"]
+    time: Any
+    if time_info["kind"] == "uniform":
+        time = UniformTime(n, float(time_info["dt"]), float(time_info["t0"]))
+    else:
+        time_offset = _aligned(data_offset + n * sample_dtype.itemsize)
+        if mmap:
+            time = np.memmap(path, dtype="<f8", mode="r", offset=time_offset, shape=(n,))
+        else:
+            time = np.fromfile(path, dtype="<f8", count=n, offset=time_offset)
+
+    return Trace(
+        time=time,
+        current=current,  # type: ignore[arg-type]
+        sample_rate=float(header["sample_rate"]),
+        source=str(path),
+    )
+
+
+def convert_to_npt(
+    file_path: str | Path,
+    output_path: str | Path | None = None,
+    *,
+    sweep: int = 0,
+    channel: int = 0,
+    invert_negative: bool = True,
+    dtype: str | None = None,
+    time_column: str = "time_column",
+    data_column: str = "data_column",
+    sample_rate: float | None = None,
+) -> Path:
+    """
+    Convert an ABF or CSV recording to ``.npt`` next to it (or at ``output_path``).
+
+    ABF samples are copied as raw ADC values with their gain/offset (polarity
+    inversion folded in) without loading the sweep into memory. CSV samples are
+    stored as float64 unless ``dtype='float32'`` is requested.
+    """
+    from pynanopore.io.readers import load_trace
+
+    if dtype not in (None, "float32", "float64"):
+        raise ValueError("dtype must be 'float32' or 'float64' (None keeps raw samples)")
+    src = Path(file_path)
+    if not src.exists():
+        raise FileNotFoundError(f"File not found: {src}")
+    out = Path(output_path) if output_path is not None else src.with_suffix(NPT_SUFFIX)
+    if out.resolve() == src.resolve():
+        raise ValueError("output_path must differ from the source file")
+    stat = src.stat()
+    source: dict[str, Any] = {
+        "path": str(src.resolve()),
+        "format": src.suffix.lower().lstrip("."),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "invert_negative": invert_negative,
+    }
+
+    if src.suffix.lower() == ".abf":
+        reader = MemmapABFReader(
+            src,
+            sweep=sweep,
+            channel=channel,
+            invert_negative=invert_negative,
+            dtype=dtype or "float64",
+        )
+        source.update(sweep=sweep, channel=channel)
+        samples = reader.current
+        raw: NDArray[Any] = samples.raw
+        gain, offset = samples.gain, samples.offset
+        if dtype is not None and np.dtype(dtype) != raw.dtype:
+            raw, gain, offset = samples[:].astype(dtype), 1.0, 0.0
+        return write_npt(
+            out,
+            raw,
+            sample_rate=reader.sample_rate,
+            time=reader.time,
+            gain=gain,
+            offset=offset,
+            source=source,
+        )
+
+    trace = load_trace(
+        src,
+        invert_negative=invert_negative,
+        time_column=time_column,
+        data_column=data_column,
+        sample_rate=sample_rate,
+        dtype=dtype or "float64",  # never round through float32 before storing float64
+    )
+    current = np.asarray(trace.current, dtype=dtype or np.float64)
+    return write_npt(
+        out,
+        current,
+        sample_rate=trace.sample_rate,
+        time=trace.time,
+        source=source,
+    )
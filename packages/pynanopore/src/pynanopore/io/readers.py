@@ -9,7 +9,10 @@ import numpy as np
 import pandas as pd
 import pyabf
 
-from pynanopore.io.trace import Trace
+from pynanopore._dtypes import WorkingDType, load_dtype
+from pynanopore.io.abf_mmap import MemmapABFReader
+from pynanopore.io.npt import NPT_SUFFIX, load_npt
+from pynanopore.io.trace import Trace, UniformTime
 
 
 def load_trace(
@@ -20,14 +23,16 @@ def load_trace(
     time_column: str = "time_column",
     data_column: str = "data_column",
     sample_rate: float | None = None,
+    mmap: bool = False,
+    dtype: WorkingDType = "auto",
 ) -> Trace:
     """
-    Load an ABF or CSV recording as a Trace.
+    Load an ABF, CSV or ``.npt`` recording as a Trace.
 
     Parameters
     ----------
     file_path:
-        Path to ``.abf`` or ``.csv`` file.
+        Path to ``.abf``, ``.csv`` or ``.npt`` file (see :func:`~pynanopore.io.npt.convert_to_npt`).
     sweep:
         ABF sweep index to load (ignored for CSV).
     invert_negative:
@@ -37,6 +42,15 @@ def load_trace(
         Column names for CSV files.
     sample_rate:
         Required for CSV if not inferable from time spacing.
+    mmap:
+        For ABF and ``.npt`` files, memory-map the samples instead of loading them;
+        the returned Trace scales samples to pA only for the windows that are sliced
+        (see :class:`~pynanopore.io.abf_mmap.MemmapABFReader`). Ignored for CSV.
+        ``.npt`` files already carry the polarity chosen at conversion time.
+    dtype:
+        Floating dtype of the loaded current. ``'auto'`` uses float32 for traces of
+        at least :data:`~pynanopore._dtypes.FLOAT32_MIN_SAMPLES` samples and float64
+        otherwise; time values stay float64.
     """
     path = Path(file_path)
     if not path.exists():
@@ -44,7 +58,14 @@ def load_trace(
 
     ext = path.suffix.lower()
     if ext == ".abf":
-        return _load_abf(path, sweep=sweep, invert_negative=invert_negative)
+        if mmap:
+            reader = MemmapABFReader(
+                path, sweep=sweep, invert_negative=invert_negative, dtype=dtype
+            )
+            return reader.to_trace()
+        return _load_abf(path, sweep=sweep, invert_negative=invert_negative, dtype=dtype)
+    if ext == NPT_SUFFIX:
+        return load_npt(path, mmap=mmap, dtype=dtype)
     if ext == ".csv":
         return _load_csv(
             path,
@@ -52,19 +73,24 @@ def load_trace(
             data_column=data_column,
             sample_rate=sample_rate,
             invert_negative=invert_negative,
+            dtype=dtype,
         )
     raise ValueError(f"Unsupported file format: {ext}")
 
 
-def _load_abf(path: Path, *, sweep: int, invert_negative: bool) -> Trace:
+def _load_abf(
+    path: Path, *, sweep: int, invert_negative: bool, dtype: WorkingDType = "auto"
+) -> Trace:
     abf = pyabf.ABF(str(path))
     if sweep not in abf.sweepList:
         raise ValueError(f"Sweep {sweep} not in ABF sweepList {list(abf.sweepList)}")
     abf.setSweep(sweep)
-    current = np.asarray(abf.sweepY, dtype=float)
-    time = np.asarray(abf.sweepX, dtype=float)
-    if invert_negative and float(np.mean(current)) < 0:
-        current = np.asarray(-current, dtype=float)
+    # pyabf scales to float32 already; keep it when the working dtype is float32
+    current = np.asarray(abf.sweepY, dtype=load_dtype(dtype, len(abf.sweepY)))
+    if invert_negative and float(np.mean(current, dtype=np.float64)) < 0:
+        current = -current
+    # sweepX is arange(n) * dataSecPerPoint; keep it implicit instead of storing it
+    time = UniformTime(len(current), float(abf.dataSecPerPoint))
     return Trace(
         time=time,
         current=current,
@@ -80,6 +106,7 @@ def _load_csv(
     data_column: str,
     sample_rate: float | None,
     invert_negative: bool,
+    dtype: WorkingDType = "auto",
 ) -> Trace:
     df = pd.read_csv(path)
     if time_column not in df.columns or data_column not in df.columns:
@@ -88,9 +115,10 @@ def _load_csv(
             f"Found: {list(df.columns)}"
         )
     time = np.asarray(df[time_column].to_numpy(dtype=float), dtype=float)
-    current = np.asarray(df[data_column].to_numpy(dtype=float), dtype=float)
+    current = df[data_column].to_numpy(dtype=float)
     if invert_negative and float(np.mean(current)) < 0:
-        current = np.asarray(-current, dtype=float)
+        current = -current
+    current = current.astype(load_dtype(dtype, len(current)), copy=False)
 
     if sample_rate is None:
         if len(time) < 2:
@@ -2,17 +2,153 @@
 
 from __future__ import annotations
 
+import math
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Any
 
 import numpy as np
-from numpy.typing import NDArray
+from numpy.lib.mixins import NDArrayOperatorsMixin
+from numpy.typing import DTypeLike, NDArray
+
+_ITER_BLOCK = 1 << 16
+
+
+class UniformTime(NDArrayOperatorsMixin):
+    """Read-only 1-D time axis ``t0 + (index0 + k) * dt`` computed on access.
+
+    Stands in for a uniformly sampled ``time`` array: indexing returns ordinary
+    float arrays for just the requested samples, :meth:`window` returns a lazy
+    sub-axis, and :meth:`index_range` maps a time interval to sample indices.
+    Arithmetic, ufuncs and the ndarray API behave as on the materialized array
+    (``np.asarray(time)``): ``size``, ``min`` / ``max`` / ``mean`` and iteration
+    need no full copy, and any other ndarray attribute (``astype``, ``copy``,
+    ``std``, ...) is looked up on a materialized array.
+    """
+
+    ndim = 1
+    dtype = np.dtype(np.float64)
+
+    def __init__(self, n: int, dt: float, t0: float = 0.0, *, index0: int = 0):
+        if n < 0:
+            raise ValueError("n must be non-negative")
+        if dt <= 0:
+            raise ValueError("dt must be positive")
+        self.n = int(n)
+        self.dt = float(dt)
+        self.t0 = float(t0)
+        self.index0 = int(index0)
+
+    @property
+    def shape(self) -> tuple[int]:
+        return (self.n,)
+
+    @property
+    def size(self) -> int:
+        return self.n
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[float]:
+        for a in range(0, self.n, _ITER_BLOCK):
+            yield from self[a : a + _ITER_BLOCK].tolist()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only public ndarray API; never fake array-protocol dunders on a temporary
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(np.asarray(self), name)
+
+    def _values(self, idx: NDArray[np.integer]) -> NDArray[np.floating]:
+        values = (idx + self.index0) * self.dt if self.index0 else idx * self.dt
+        return values + self.t0 if self.t0 != 0.0 else values
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._values(np.arange(*key.indices(self.n)))
+        if np.isscalar(key):
+            k = int(key) + self.n if int(key) < 0 else int(key)
+            if not 0 <= k < self.n:
+                raise IndexError("time index out of range")
+            return float(self._values(np.asarray(k)))
+        idx = np.asarray(key)
+        if idx.dtype == bool:
+            if idx.shape != self.shape:
+                raise IndexError("boolean index must match the time axis length")
+            idx = np.flatnonzero(idx)
+        else:
+            idx = np.where(idx < 0, idx + self.n, idx)
+            if idx.size and (idx.min() < 0 or idx.max() >= self.n):
+                raise IndexError("time index out of range")
+        return self._values(idx)
+
+    def __array__(self, dtype: DTypeLike | None = None, copy: bool | None = None) -> NDArray[Any]:
+        out = self[:]
+        return out if dtype is None else out.astype(dtype, copy=False)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = tuple(np.asarray(x) if isinstance(x, UniformTime) else x for x in inputs)
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    def tolist(self) -> list[float]:
+        return self[:].tolist()
+
+    def min(self) -> float:
+        if not self.n:
+            raise ValueError("zero-size time axis has no minimum")
+        return self[0]
+
+    def max(self) -> float:
+        if not self.n:
+            raise ValueError("zero-size time axis has no maximum")
+        return self[-1]
+
+    def mean(self) -> float:
+        if not self.n:
+            return float("nan")
+        return self.t0 + (self.index0 + (self.n - 1) / 2.0) * self.dt
+
+    def astype(self, dtype: DTypeLike, copy: bool = True) -> NDArray[Any]:
+        return self[:].astype(dtype, copy=False)
+
+    def copy(self) -> NDArray[np.floating]:
+        return self[:]
+
+    def window(self, start: int, end: int) -> UniformTime:
+        """Lazy sub-axis for samples ``[start, end)`` (Python slice clamping)."""
+        lo, hi, _ = slice(start, end).indices(self.n)
+        return UniformTime(max(0, hi - lo), self.dt, self.t0, index0=self.index0 + lo)
+
+    def index_range(self, t_start: float, t_end: float) -> tuple[int, int]:
+        """Return ``[start, end)`` covering samples with ``t_start <= time <= t_end``."""
+        n = self.n
+
+        def at(k: int) -> float:
+            return float(self._values(np.asarray(k)))
+
+        lo = min(max(math.ceil((t_start - self.t0) / self.dt) - self.index0, 0), n)
+        while lo > 0 and at(lo - 1) >= t_start:
+            lo -= 1
+        while lo < n and at(lo) < t_start:
+            lo += 1
+        hi = min(max(math.floor((t_end - self.t0) / self.dt) - self.index0, -1), n - 1)
+        while hi + 1 < n and at(hi + 1) <= t_end:
+            hi += 1
+        while hi >= 0 and at(hi) > t_end:
+            hi -= 1
+        return lo, max(lo, hi + 1)
 
 
 @dataclass(frozen=True)
 class Trace:
-    """A continuous ion-current recording."""
+    """A continuous ion-current recording.
+
+    ``time`` is either an explicit array (e.g. from CSV) or a :class:`UniformTime`
+    axis for uniformly sampled data, in which case slicing uses index arithmetic.
+    """
 
-    time: NDArray[np.floating]
+    time: NDArray[np.floating] | UniformTime
     current: NDArray[np.floating]
     sample_rate: float
     source: str = ""
@@ -25,6 +161,30 @@ class Trace:
         if len(self.time) == 0:
             raise ValueError("trace must contain at least one sample")
 
+    @classmethod
+    def uniform(
+        cls,
+        current: NDArray[np.floating],
+        sample_rate: float,
+        *,
+        t0: float = 0.0,
+        source: str = "",
+    ) -> Trace:
+        """Build a uniformly sampled trace without storing a time array."""
+        if sample_rate <= 0:
+            raise ValueError("sample_rate must be positive")
+        return cls(
+            time=UniformTime(len(current), 1.0 / sample_rate, t0),
+            current=current,
+            sample_rate=float(sample_rate),
+            source=source,
+        )
+
+    @property
+    def is_uniform(self) -> bool:
+        """True when ``time`` is an implicit :class:`UniformTime` axis."""
+        return isinstance(self.time, UniformTime)
+
     @property
     def duration(self) -> float:
         """Recording duration in seconds."""
@@ -32,8 +192,9 @@ class Trace:
 
     def slice_by_index(self, start: int, end: int) -> Trace:
         """Return a sub-trace by sample indices ``[start, end)``."""
+        time = self.time.window(start, end) if isinstance(self.time, UniformTime) else None
         return Trace(
-            time=self.time[start:end],
+            time=self.time[start:end] if time is None else time,
             current=self.current[start:end],
             sample_rate=self.sample_rate,
             source=self.source,
@@ -49,6 +210,11 @@ class Trace:
         t1 = float(self.time[-1]) if t_end is None else float(t_end)
         if t1 <= t0:
             raise ValueError("t_end must be greater than t_start")
+        if isinstance(self.time, UniformTime):
+            start, end = self.time.index_range(t0, t1)
+            if end <= start:
+                raise ValueError("no samples in the requested time window")
+            return self.slice_by_index(start, end)
         mask = (self.time >= t0) & (self.time <= t1)
         if not np.any(mask):
             raise ValueError("no samples in the requested time window")
@@ -3,11 +3,15 @@
 from pynanopore.psd.analyzer import PSDAnalyzer
 from pynanopore.psd.lorentzian import (
     CompositePSDFitter,
+    LogBinnedPSD,
     LorentzianFitter,
     LorentzianWhiteFitter,
     MultiLorentzianFitter,
     PSDFitDiagnostics,
+    log_bin_psd,
 )
+from pynanopore.psd.spectrogram import Spectrogram, compute_spectrogram, fit_spectrogram
+from pynanopore.psd.streaming import WelchAccumulator
 
 __all__ = [
     "PSDAnalyzer",
@@ -15,5 +19,11 @@ __all__ = [
     "CompositePSDFitter",
     "LorentzianWhiteFitter",
     "MultiLorentzianFitter",
+    "LogBinnedPSD",
+    "log_bin_psd",
     "PSDFitDiagnostics",
+    "WelchAccumulator",
+    "Spectrogram",
+    "compute_spectrogram",
+    "fit_spectrogram",
 ]
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Literal
 
 import numpy as np
 from numpy.typing import NDArray
 from scipy.signal import welch
 
+from pynanopore._dtypes import WorkingDType, as_working_array
+
+if TYPE_CHECKING:
+    from pynanopore.psd.spectrogram import Spectrogram
+
 WindowType = Literal[
     "hamming",
     "hann",
@@ -21,12 +27,19 @@ ScalingType = Literal["density", "spectrum"]
 
 
 class PSDAnalyzer:
-    """Compute one-sided power spectral density via Welch's method."""
+    """Compute one-sided power spectral density via Welch's method.
+
+    Segments are transformed in ``dtype`` (``'auto'`` keeps float32 input as float32);
+    returned frequencies and power are float64.
+    """
 
-    def __init__(self, fs: float = 50000.0):
+    def __init__(self, fs: float = 50000.0, *, dtype: WorkingDType = "auto"):
         if fs <= 0:
             raise ValueError("fs must be positive")
+        if dtype not in ("auto", "float32", "float64"):
+            raise ValueError("dtype must be 'auto', 'float32' or 'float64'")
         self.fs = float(fs)
+        self.dtype: WorkingDType = dtype
 
     def compute_psd(
         self,
@@ -56,7 +69,7 @@ class PSDAnalyzer:
         noverlap = min(int(noverlap), nperseg - 1)
 
         frequencies, power_spectrum = welch(
-            current_data,
+            as_working_array(current_data, self.dtype),
             self.fs,
             window=window,
             nperseg=nperseg,
@@ -71,6 +84,66 @@ class PSDAnalyzer:
 
         return frequencies.astype(float), power_spectrum.astype(float)
 
+    def compute_psd_chunks(
+        self,
+        chunks: Iterable[NDArray[np.floating] | tuple[NDArray, NDArray]],
+        nperseg: int | None = None,
+        noverlap: int | None = None,
+        *,
+        window: WindowType = "hamming",
+        scaling: ScalingType = "spectrum",
+        skip_bins: int = 2,
+    ) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+        """
+        Welch PSD of a recording given as successive chunks, with bounded memory.
+
+        Chunks are arrays or ``(current, time)`` pairs, e.g. from
+        :meth:`ChunkGenerator.generate`. Same result as :meth:`compute_psd` on the
+        concatenated samples with the same ``nperseg`` / ``noverlap``; ``nperseg``
+        must be fixed up front and defaults to ``DEFAULT_STREAM_NPERSEG``.
+        """
+        from pynanopore.psd.streaming import DEFAULT_STREAM_NPERSEG, WelchAccumulator
+
+        accumulator = WelchAccumulator(
+            self.fs,
+            nperseg if nperseg is not None else DEFAULT_STREAM_NPERSEG,
+            noverlap,
+            window=window,
+            scaling=scaling,
+            dtype=self.dtype,
+        )
+        for chunk in chunks:
+            accumulator.update(chunk)
+        return accumulator.result(skip_bins=skip_bins)
+
+    def compute_spectrogram(
+        self,
+        current: NDArray[np.floating],
+        window_s: float,
+        step_s: float | None = None,
+        *,
+        nperseg: int | None = None,
+        noverlap: int | None = None,
+        window: WindowType = "hamming",
+        scaling: ScalingType = "spectrum",
+        skip_bins: int = 2,
+    ) -> Spectrogram:
+        """Welch PSD of sliding windows; see :func:`~pynanopore.psd.spectrogram.compute_spectrogram`."""
+        from pynanopore.psd.spectrogram import compute_spectrogram
+
+        return compute_spectrogram(
+            current,
+            self.fs,
+            window_s=window_s,
+            step_s=step_s,
+            nperseg=nperseg,
+            noverlap=noverlap,
+            window=window,
+            scaling=scaling,
+            skip_bins=skip_bins,
+            dtype=self.dtype,
+        )
+
     def compute_psd_with_hamming(
         self,
         current_data: NDArray[np.floating],
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
-from scipy.optimize import least_squares
+from scipy.ndimage import uniform_filter1d
+from scipy.optimize import OptimizeResult, least_squares
+
+_LN10 = float(np.log(10.0))
+_MIN_VARIANCE_COUNT = 5  # bins with fewer points use the pooled log-power variance
 
 
 @dataclass
@@ -49,8 +55,137 @@ def _log_r2(y_obs: NDArray[np.floating], y_model: NDArray[np.floating]) -> tuple
     return r2, rmse
 
 
+@dataclass
+class LogBinnedPSD:
+    """PSD averaged in log10 space over bins of equal width in log frequency.
+
+    ``frequencies`` are the geometric mean frequencies of the non-empty bins,
+    ``log_power`` the mean log10 power, ``weights`` the residual weights
+    ``sqrt(count / variance)`` of those means and ``counts`` the bins' sizes.
+    """
+
+    frequencies: NDArray[np.floating]
+    log_power: NDArray[np.floating]
+    weights: NDArray[np.floating]
+    counts: NDArray[np.int64]
+
+    def __len__(self) -> int:
+        return len(self.frequencies)
+
+
+def log_bin_psd(
+    frequencies: NDArray[np.floating],
+    power_spectrum: NDArray[np.floating],
+    *,
+    bins_per_decade: int = 20,
+) -> LogBinnedPSD:
+    """
+    Rebin a linearly spaced PSD onto ``bins_per_decade`` log-spaced bins.
+
+    Each bin holds the mean of log10 power and log10 frequency of its points, so a
+    weighted least-squares fit to the bins approximates the fit to all points at a
+    fraction of the cost. The variance of log10 power is estimated within bins of at
+    least five points and pooled over all bins for the sparse low-frequency ones.
+    """
+    if bins_per_decade < 1:
+        raise ValueError("bins_per_decade must be at least 1")
+    f = np.asarray(frequencies, dtype=float)
+    p = np.asarray(power_spectrum, dtype=float)
+    if f.shape != p.shape or not len(f):
+        raise ValueError("frequencies and power_spectrum must be non-empty and equally long")
+    if np.any(f <= 0) or np.any(p <= 0):
+        raise ValueError("log binning needs positive frequencies and power")
+    log_f, log_p = np.log10(f), np.log10(p)
+    index = np.floor((log_f - log_f.min()) * bins_per_decade).astype(np.int64)
+    _, index, counts = np.unique(index, return_inverse=True, return_counts=True)
+    mean_f = np.bincount(index, log_f) / counts
+    mean_p = np.bincount(index, log_p) / counts
+    sum_sq = np.bincount(index, (log_p - mean_p[index]) ** 2)
+    multi = counts >= 2
+    pooled = float(sum_sq[multi].sum() / (counts[multi] - 1).sum()) if multi.any() else 0.0
+    pooled = pooled if pooled > 0 else 1.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = np.where(
+            (counts >= _MIN_VARIANCE_COUNT) & (sum_sq > 0), sum_sq / (counts - 1), pooled
+        )
+    return LogBinnedPSD(
+        frequencies=10**mean_f,
+        log_power=mean_p,
+        weights=np.sqrt(counts / variance),
+        counts=counts.astype(np.int64),
+    )
+
+
+def _solve_log(
+    fitter: Any, initial: NDArray[np.floating], bounds: tuple[Sequence[float], Sequence[float]]
+) -> OptimizeResult:
+    """Least squares of ``fitter.residuals_log`` on its filtered PSD (log-binned if requested)."""
+    f, p = fitter.filtered_frequencies, fitter.filtered_power_spectrum
+    options: dict[str, Any] = {"method": "trf", "bounds": bounds, "max_nfev": 100000}
+    if fitter.log_bins is None:
+        fitter.binned = None
+        return least_squares(
+            fitter.residuals_log,
+            initial,
+            jac=fitter.jacobian_log,
+            args=(np.log10(f), np.log10(p)),
+            **options,
+        )
+    binned = log_bin_psd(f, p, bins_per_decade=fitter.log_bins)
+    fitter.binned = binned
+    f_log, y, w = np.log10(binned.frequencies), binned.log_power, binned.weights
+    return least_squares(
+        lambda theta: w * fitter.residuals_log(theta, f_log, y),
+        initial,
+        jac=lambda theta: w[:, None] * fitter.jacobian_log(theta, f_log, y),
+        **options,
+    )
+
+
+def _check_log_bins(log_bins: int | None) -> int | None:
+    if log_bins is None:
+        return None
+    if log_bins < 1:
+        raise ValueError("log_bins must be at least 1 bin per decade")
+    return int(log_bins)
+
+
+def _initial_lorentzian(
+    frequencies: NDArray[np.floating], power: NDArray[np.floating], floor: float = 0.0
+) -> tuple[float, float]:
+    """Data-driven ``(S0, fc)`` guess: low-frequency plateau and its half-power frequency.
+
+    The plateau is the median of the lowest tenth of the bins (minus a white ``floor``);
+    ``fc`` is the first frequency where the log-smoothed spectrum falls to half of it.
+    """
+    plateau = float(np.median(power[: max(3, len(power) // 10)]))
+    s0 = max(plateau - floor, 1e-3 * plateau)
+    smooth = 10 ** uniform_filter1d(np.log10(power), max(1, len(power) // 50), mode="nearest")
+    below = np.flatnonzero(smooth <= floor + 0.5 * s0)
+    fc = float(frequencies[below[0]]) if len(below) else float(frequencies[-1])
+    return s0, fc
+
+
+def _clip_x0(
+    x0: Sequence[float], bounds: tuple[Sequence[float], Sequence[float]]
+) -> NDArray[np.floating]:
+    """Warm-start parameters clipped into ``bounds`` (``least_squares`` rejects infeasible x0)."""
+    lo, hi = np.asarray(bounds[0], dtype=float), np.asarray(bounds[1], dtype=float)
+    x = np.asarray(x0, dtype=float)
+    if x.shape != lo.shape:
+        raise ValueError(f"x0 must have {len(lo)} parameters")
+    if not np.all(np.isfinite(x)):
+        raise ValueError("x0 must be finite")
+    return np.clip(x, lo, hi)
+
+
 class LorentzianFitter:
-    """Fit a Lorentzian S0 / (1 + (f/fc)^2) model on a log-log scale."""
+    """
+    Fit a Lorentzian S0 / (1 + (f/fc)^2) model on a log-log scale.
+
+    With ``log_bins`` (bins per decade) the fit runs on :func:`log_bin_psd` averages
+    instead of every frequency bin; diagnostics always use the full-resolution PSD.
+    """
 
     def __init__(
         self,
@@ -58,10 +193,13 @@ class LorentzianFitter:
         power_spectrum: NDArray[np.floating],
         *,
         max_frequency: float = 10000.0,
+        log_bins: int | None = None,
     ):
         self.frequencies = np.asarray(frequencies, dtype=float)
         self.power_spectrum = np.asarray(power_spectrum, dtype=float)
         self.max_frequency = float(max_frequency)
+        self.log_bins = _check_log_bins(log_bins)
+        self.binned: LogBinnedPSD | None = None
         self.S_0_opt: float | None = None
         self.f_c_opt: float | None = None
         self.filtered_frequencies: NDArray[np.floating] | None = None
@@ -82,24 +220,34 @@ class LorentzianFitter:
         y_model = np.log10(self.lorentzian_power1(10**f_log, S_0, f_c))
         return y_observed - y_model
 
-    def fit_lorentzian(self) -> tuple[float, float]:
-        """Fit and return ``(S_0, f_c)``."""
+    def jacobian_log(
+        self,
+        params: list[float] | NDArray[np.floating],
+        f_log: NDArray[np.floating],
+        y_observed: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Closed-form Jacobian of :meth:`residuals_log` with respect to ``(S_0, f_c)``."""
+        S_0, f_c = float(params[0]), float(params[1])
+        u = (10**f_log / f_c) ** 2
+        jac = np.empty((len(f_log), 2))
+        jac[:, 0] = -1.0 / (S_0 * _LN10)
+        jac[:, 1] = -2.0 * u / ((1.0 + u) * f_c * _LN10)
+        return jac
+
+    def fit_lorentzian(self, *, x0: Sequence[float] | None = None) -> tuple[float, float]:
+        """Fit and return ``(S_0, f_c)``; ``x0`` warm-starts from earlier parameters.
+
+        Without ``x0`` the fit starts from the spectrum's plateau and half-power frequency.
+        """
         self.filtered_frequencies, self.filtered_power_spectrum = _filter_psd(
             self.frequencies, self.power_spectrum, max_frequency=self.max_frequency
         )
 
-        initial_guess = [1e-3, 1e3]
-        result = least_squares(
-            self.residuals_log,
-            initial_guess,
-            args=(
-                np.log10(self.filtered_frequencies),
-                np.log10(self.filtered_power_spectrum),
-            ),
-            method="trf",
-            bounds=([1e-10, 1e-10], [1e7, 1e4]),
-            max_nfev=100000,
-        )
+        bounds = ([1e-10, 1e-10], [1e7, 1e4])
+        if x0 is None:
+            x0 = _initial_lorentzian(self.filtered_frequencies, self.filtered_power_spectrum)
+        initial_guess = _clip_x0(x0, bounds)
+        result = _solve_log(self, initial_guess, bounds)
         self.S_0_opt = float(result.x[0])
         self.f_c_opt = float(result.x[1])
         y_obs = np.log10(self.filtered_power_spectrum)
@@ -123,6 +271,9 @@ class CompositePSDFitter:
     Fit Lorentzian + power-law (1/f^α) composite model:
 
         S(f) = S0 / (1 + (f/fc)^2) + A / f^α
+
+    With ``log_bins`` (bins per decade) the fit runs on :func:`log_bin_psd` averages
+    instead of every frequency bin; diagnostics always use the full-resolution PSD.
     """
 
     def __init__(
@@ -131,10 +282,13 @@ class CompositePSDFitter:
         power_spectrum: NDArray[np.floating],
         *,
         max_frequency: float = 10000.0,
+        log_bins: int | None = None,
     ):
         self.frequencies = np.asarray(frequencies, dtype=float)
         self.power_spectrum = np.asarray(power_spectrum, dtype=float)
         self.max_frequency = float(max_frequency)
+        self.log_bins = _check_log_bins(log_bins)
+        self.binned: LogBinnedPSD | None = None
         self.S_0_opt: float | None = None
         self.f_c_opt: float | None = None
         self.A_opt: float | None = None
@@ -166,28 +320,44 @@ class CompositePSDFitter:
         y_model = np.log10(self.model(10**f_log, S_0, f_c, A, alpha))
         return y_observed - y_model
 
-    def fit(self) -> dict[str, float]:
+    def jacobian_log(
+        self,
+        params: NDArray[np.floating],
+        f_log: NDArray[np.floating],
+        y_observed: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Closed-form Jacobian of :meth:`residuals_log` with respect to ``(S0, fc, A, alpha)``."""
+        S_0, f_c, A, alpha = (float(x) for x in params)
+        f = np.clip(10**f_log, 1e-12, None)
+        u = (f / f_c) ** 2
+        lor = S_0 / (1.0 + u)
+        powerlaw = A / f**alpha
+        scale = -1.0 / ((lor + powerlaw) * _LN10)
+        jac = np.empty((len(f_log), 4))
+        jac[:, 0] = scale / (1.0 + u)
+        jac[:, 1] = scale * lor * 2.0 * u / ((1.0 + u) * f_c)
+        jac[:, 2] = scale / f**alpha
+        jac[:, 3] = -scale * powerlaw * np.log(f)
+        return jac
+
+    def fit(self, *, x0: Sequence[float] | None = None) -> dict[str, float]:
+        """Fit ``(S0, fc, A, alpha)``; ``x0`` warm-starts from earlier parameters.
+
+        Without ``x0`` the Lorentzian starts from the plateau and half-power frequency and
+        the power law from a tenth of the plateau with ``alpha = 1``.
+        """
         self.filtered_frequencies, self.filtered_power_spectrum = _filter_psd(
             self.frequencies, self.power_spectrum, max_frequency=self.max_frequency
         )
-        # Initial guesses
-        s0_guess = float(
-            np.median(
-                self.filtered_power_spectrum[: max(3, len(self.filtered_power_spectrum) // 10)]
+        bounds = ([1e-12, 1e-2, 1e-14, 0.0], [1e7, 1e5, 1e3, 3.0])
+        if x0 is None:
+            s0_guess, fc_guess = _initial_lorentzian(
+                self.filtered_frequencies, self.filtered_power_spectrum
             )
-        )
-        initial = np.array([max(s0_guess, 1e-6), 1e3, max(s0_guess * 0.1, 1e-8), 1.0])
-        result = least_squares(
-            self.residuals_log,
-            initial,
-            args=(
-                np.log10(self.filtered_frequencies),
-                np.log10(self.filtered_power_spectrum),
-            ),
-            method="trf",
-            bounds=([1e-12, 1e-2, 1e-14, 0.0], [1e7, 1e5, 1e3, 3.0]),
-            max_nfev=100000,
-        )
+            f_lo = float(self.filtered_frequencies[0])
+            x0 = [s0_guess, fc_guess, 0.1 * s0_guess * f_lo, 1.0]
+        initial = _clip_x0(x0, bounds)
+        result = _solve_log(self, initial, bounds)
         self.S_0_opt, self.f_c_opt, self.A_opt, self.alpha_opt = (float(x) for x in result.x)
         y_obs = np.log10(self.filtered_power_spectrum)
         y_model = np.log10(
@@ -228,6 +398,9 @@ class LorentzianWhiteFitter:
     Lorentzian plus white-noise floor:
 
         S(f) = S0 / (1 + (f/fc)^2) + N
+
+    With ``log_bins`` (bins per decade) the fit runs on :func:`log_bin_psd` averages
+    instead of every frequency bin; diagnostics always use the full-resolution PSD.
     """
 
     def __init__(
@@ -236,10 +409,13 @@ class LorentzianWhiteFitter:
         power_spectrum: NDArray[np.floating],
         *,
         max_frequency: float = 10000.0,
+        log_bins: int | None = None,
     ):
         self.frequencies = np.asarray(frequencies, dtype=float)
         self.power_spectrum = np.asarray(power_spectrum, dtype=float)
         self.max_frequency = float(max_frequency)
+        self.log_bins = _check_log_bins(log_bins)
+        self.binned: LogBinnedPSD | None = None
         self.S_0_opt: float | None = None
         self.f_c_opt: float | None = None
         self.N_opt: float | None = None
@@ -262,28 +438,41 @@ class LorentzianWhiteFitter:
         y_model = np.log10(np.clip(self.model(10**f_log, S_0, f_c, N), 1e-30, None))
         return y_observed - y_model
 
-    def fit(self) -> dict[str, float]:
+    def jacobian_log(
+        self,
+        params: NDArray[np.floating],
+        f_log: NDArray[np.floating],
+        y_observed: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Closed-form Jacobian of :meth:`residuals_log` with respect to ``(S0, fc, N)``."""
+        S_0, f_c, N = (float(x) for x in params)
+        u = (10**f_log / f_c) ** 2
+        lor = S_0 / (1.0 + u)
+        scale = -1.0 / (np.clip(lor + N, 1e-30, None) * _LN10)
+        jac = np.empty((len(f_log), 3))
+        jac[:, 0] = scale / (1.0 + u)
+        jac[:, 1] = scale * lor * 2.0 * u / ((1.0 + u) * f_c)
+        jac[:, 2] = scale
+        return jac
+
+    def fit(self, *, x0: Sequence[float] | None = None) -> dict[str, float]:
+        """Fit ``(S0, fc, N)``; ``x0`` warm-starts from earlier parameters.
+
+        Without ``x0`` the floor starts at the 10th power percentile and the Lorentzian
+        at the plateau above it and its half-power frequency.
+        """
         self.filtered_frequencies, self.filtered_power_spectrum = _filter_psd(
             self.frequencies, self.power_spectrum, max_frequency=self.max_frequency
         )
-        s0_guess = float(
-            np.median(
-                self.filtered_power_spectrum[: max(3, len(self.filtered_power_spectrum) // 10)]
+        bounds = ([1e-12, 1e-2, 1e-18], [1e7, 1e5, 1e3])
+        if x0 is None:
+            n_guess = float(np.percentile(self.filtered_power_spectrum, 10))
+            s0_guess, fc_guess = _initial_lorentzian(
+                self.filtered_frequencies, self.filtered_power_spectrum, floor=n_guess
             )
-        )
-        n_guess = float(np.percentile(self.filtered_power_spectrum, 10))
-        initial = np.array([max(s0_guess, 1e-6), 1e3, max(n_guess, 1e-12)])
-        result = least_squares(
-            self.residuals_log,
-            initial,
-            args=(
-                np.log10(self.filtered_frequencies),
-                np.log10(self.filtered_power_spectrum),
-            ),
-            method="trf",
-            bounds=([1e-12, 1e-2, 1e-18], [1e7, 1e5, 1e3]),
-            max_nfev=100000,
-        )
+            x0 = [s0_guess, fc_guess, n_guess]
+        initial = _clip_x0(x0, bounds)
+        result = _solve_log(self, initial, bounds)
         self.S_0_opt, self.f_c_opt, self.N_opt = (float(x) for x in result.x)
         y_obs = np.log10(self.filtered_power_spectrum)
         y_model = np.log10(
@@ -316,6 +505,9 @@ class MultiLorentzianFitter:
     Sum of ``n`` Lorentzians plus optional white floor:
 
         S(f) = Σ_i S0_i / (1 + (f/fc_i)^2) + N
+
+    With ``log_bins`` (bins per decade) the fit runs on :func:`log_bin_psd` averages
+    instead of every frequency bin; diagnostics always use the full-resolution PSD.
     """
 
     def __init__(
@@ -326,6 +518,7 @@ class MultiLorentzianFitter:
         n_components: int = 2,
         include_white: bool = True,
         max_frequency: float = 10000.0,
+        log_bins: int | None = None,
     ):
         if n_components < 1 or n_components > 3:
             raise ValueError("n_components must be in 1..3")
@@ -334,6 +527,8 @@ class MultiLorentzianFitter:
         self.frequencies = np.asarray(frequencies, dtype=float)
         self.power_spectrum = np.asarray(power_spectrum, dtype=float)
         self.max_frequency = float(max_frequency)
+        self.log_bins = _check_log_bins(log_bins)
+        self.binned: LogBinnedPSD | None = None
         self.params: dict[str, float] = {}
         self.filtered_frequencies: NDArray[np.floating] | None = None
         self.filtered_power_spectrum: NDArray[np.floating] | None = None
@@ -363,43 +558,56 @@ class MultiLorentzianFitter:
         y_model = np.log10(np.clip(self.model(10**f_log, params), 1e-30, None))
         return y_observed - y_model
 
-    def fit(self) -> dict[str, float]:
+    def jacobian_log(
+        self,
+        params: NDArray[np.floating],
+        f_log: NDArray[np.floating],
+        y_observed: NDArray[np.floating],
+    ) -> NDArray[np.floating]:
+        """Closed-form Jacobian of :meth:`residuals_log` (``S0_i, fc_i, ..., [N]``)."""
+        f = 10**f_log
+        jac = np.empty((len(f_log), len(params)))
+        for i in range(self.n_components):
+            s0, fc = float(params[2 * i]), float(params[2 * i + 1])
+            u = (f / fc) ** 2
+            jac[:, 2 * i] = 1.0 / (1.0 + u)
+            jac[:, 2 * i + 1] = s0 * 2.0 * u / ((1.0 + u) ** 2 * fc)
+        if self.include_white:
+            jac[:, -1] = 1.0
+        scale = -1.0 / (np.clip(self.model(f, params), 1e-30, None) * _LN10)
+        return jac * scale[:, None]
+
+    def fit(self, *, x0: Sequence[float] | None = None) -> dict[str, float]:
+        """Fit ``S0_i, fc_i`` (and ``N``); ``x0`` warm-starts from earlier parameters.
+
+        Without ``x0`` the first component starts at the plateau and its half-power
+        frequency, further components at smaller amplitudes and log-spaced corners
+        between it and the top of the band, and the floor at the 10th power percentile.
+        """
         self.filtered_frequencies, self.filtered_power_spectrum = _filter_psd(
             self.frequencies, self.power_spectrum, max_frequency=self.max_frequency
         )
-        s0_guess = float(
-            np.median(
-                self.filtered_power_spectrum[: max(3, len(self.filtered_power_spectrum) // 10)]
-            )
-        )
-        f_lo = float(self.filtered_frequencies[0])
         f_hi = float(self.filtered_frequencies[-1])
+        n_guess = float(np.percentile(self.filtered_power_spectrum, 10))
+        s0_guess, fc_guess = _initial_lorentzian(
+            self.filtered_frequencies,
+            self.filtered_power_spectrum,
+            floor=n_guess if self.include_white else 0.0,
+        )
         initial: list[float] = []
         lo: list[float] = []
         hi: list[float] = []
         for i in range(self.n_components):
-            frac = (i + 1) / (self.n_components + 1)
-            fc_guess = f_lo * (f_hi / max(f_lo, 1e-12)) ** frac
-            initial.extend([max(s0_guess / (i + 1), 1e-6), max(fc_guess, 1.0)])
+            frac = i / self.n_components
+            initial.extend([s0_guess / (i + 1), fc_guess * (f_hi / fc_guess) ** frac])
             lo.extend([1e-12, 1e-2])
             hi.extend([1e7, 1e5])
         if self.include_white:
-            n_guess = float(np.percentile(self.filtered_power_spectrum, 10))
-            initial.append(max(n_guess, 1e-12))
+            initial.append(n_guess)
             lo.append(1e-18)
             hi.append(1e3)
 
-        result = least_squares(
-            self.residuals_log,
-            np.array(initial),
-            args=(
-                np.log10(self.filtered_frequencies),
-                np.log10(self.filtered_power_spectrum),
-            ),
-            method="trf",
-            bounds=(lo, hi),
-            max_nfev=100000,
-        )
+        result = _solve_log(self, _clip_x0(initial if x0 is None else x0, (lo, hi)), (lo, hi))
         theta = result.x
         params: dict[str, float] = {}
         for i in range(self.n_components):
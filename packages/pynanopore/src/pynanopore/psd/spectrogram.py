@@ -0,0 +1,211 @@
+"""Time-resolved PSD: Welch spectra of sliding windows and per-window Lorentzian fits."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pynanopore._dtypes import WorkingDType
+from pynanopore.psd.analyzer import ScalingType, WindowType
+from pynanopore.psd.lorentzian import (
+    CompositePSDFitter,
+    LorentzianFitter,
+    LorentzianWhiteFitter,
+)
+from pynanopore.psd.streaming import WelchAccumulator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+SpectrogramModel = Literal["lorentzian", "lorentzian_white", "composite"]
+SPECTROGRAM_PARAMETERS: dict[str, tuple[str, ...]] = {
+    "lorentzian": ("S0", "fc"),
+    "lorentzian_white": ("S0", "fc", "N"),
+    "composite": ("S0", "fc", "A", "alpha"),
+}
+_SEGMENTS_PER_WINDOW = 8  # default nperseg = window // 8
+
+
+@dataclass
+class Spectrogram:
+    """Welch PSD of consecutive windows: ``power[i]`` belongs to the window centred at ``times[i]``."""
+
+    times: NDArray[np.floating]
+    frequencies: NDArray[np.floating]
+    power: NDArray[np.floating]  # (n_windows, n_frequencies)
+    window_s: float
+    step_s: float
+    nperseg: int
+    noverlap: int
+
+
+def compute_spectrogram(
+    current: Any,
+    fs: float,
+    *,
+    window_s: float,
+    step_s: float | None = None,
+    nperseg: int | None = None,
+    noverlap: int | None = None,
+    window: WindowType = "hamming",
+    scaling: ScalingType = "spectrum",
+    skip_bins: int = 2,
+    dtype: WorkingDType = "auto",
+    t0: float = 0.0,
+) -> Spectrogram:
+    """
+    Welch PSD of every ``window_s`` window, advancing by ``step_s`` (default: no overlap).
+
+    Each window is read on its own (memory-mapped traces stay on disk) and its
+    segments are transformed in batched ``rfft`` calls by :class:`WelchAccumulator`,
+    so a window's spectrum equals :meth:`PSDAnalyzer.compute_psd` on that slice with
+    the same ``nperseg`` / ``noverlap``. ``nperseg`` defaults to an eighth of the
+    window. A trailing partial window is dropped.
+    """
+    if fs <= 0:
+        raise ValueError("fs must be positive")
+    if window_s <= 0:
+        raise ValueError("window_s must be positive")
+    step_s = window_s if step_s is None else float(step_s)
+    if step_s <= 0:
+        raise ValueError("step_s must be positive")
+    win = int(round(window_s * fs))
+    step = max(1, int(round(step_s * fs)))
+    n = len(current)
+    if win < 4 or win > n:
+        raise ValueError("window_s must cover at least 4 samples and fit in the trace")
+    if nperseg is None:
+        nperseg = max(4, win // _SEGMENTS_PER_WINDOW)
+    nperseg = min(int(nperseg), win)
+
+    accumulator = WelchAccumulator(
+        fs, nperseg, noverlap, window=window, scaling=scaling, dtype=dtype
+    )
+    starts = np.arange(0, n - win + 1, step)
+    rows = []
+    frequencies = np.empty(0)
+    for start in starts:
+        accumulator.reset()
+        accumulator.update(current[start : start + win])
+        frequencies, power = accumulator.result(skip_bins=skip_bins)
+        rows.append(power)
+    return Spectrogram(
+        times=t0 + (starts + win / 2) / fs,
+        frequencies=frequencies,
+        power=np.vstack(rows),
+        window_s=win / fs,
+        step_s=step / fs,
+        nperseg=accumulator.nperseg,
+        noverlap=accumulator.noverlap,
+    )
+
+
+def _fit_one(
+    model: str,
+    frequencies: NDArray[np.floating],
+    power: NDArray[np.floating],
+    max_frequency: float,
+    x0: NDArray[np.floating] | None,
+    log_bins: int | None = None,
+) -> tuple[NDArray[np.floating], dict[str, Any]]:
+    fitter: LorentzianFitter | LorentzianWhiteFitter | CompositePSDFitter
+    options = {"max_frequency": max_frequency, "log_bins": log_bins}
+    if model == "lorentzian":
+        fitter = LorentzianFitter(frequencies, power, **options)
+        params = np.array(fitter.fit_lorentzian(x0=x0))
+    else:
+        fitter = (
+            LorentzianWhiteFitter(frequencies, power, **options)
+            if model == "lorentzian_white"
+            else CompositePSDFitter(frequencies, power, **options)
+        )
+        fitted = fitter.fit(x0=x0)
+        params = np.array([fitted[name] for name in SPECTROGRAM_PARAMETERS[model]])
+    assert fitter.diagnostics is not None
+    return params, fitter.diagnostics.to_dict()
+
+
+def _fit_window_block(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Worker: fit consecutive windows, each warm-started from the previous fit."""
+    model: str = payload["model"]
+    names = SPECTROGRAM_PARAMETERS[model]
+    frequencies = payload["frequencies"]
+    x0: NDArray[np.floating] | None = None
+    rows = []
+    for t, power in zip(payload["times"], payload["power"], strict=True):
+        row: dict[str, Any] = {"t": float(t)}
+        try:
+            params, diagnostics = _fit_one(
+                model, frequencies, power, payload["max_frequency"], x0, payload["log_bins"]
+            )
+        except ValueError:
+            row.update({name: float("nan") for name in names})
+            row.update(r2_log=float("nan"), rmse_log=float("nan"), n_points=0, success=False)
+            x0 = None
+        else:
+            row.update(zip(names, params.tolist(), strict=True))
+            row.update(diagnostics, success=True)
+            x0 = params if payload["warm_start"] else None
+        rows.append(row)
+    return rows
+
+
+def fit_spectrogram(
+    spectrogram: Spectrogram,
+    *,
+    model: SpectrogramModel = "lorentzian",
+    max_frequency: float = 10000.0,
+    warm_start: bool = True,
+    n_jobs: int = 1,
+    log_bins: int | None = None,
+) -> pd.DataFrame:
+    """
+    Fit ``model`` to every window of ``spectrogram``.
+
+    With ``warm_start`` each fit starts from the previous window's parameters, which
+    drift slowly over a recording. With ``n_jobs > 1`` (``-1``: all CPUs) the windows
+    are split into contiguous blocks fitted in a process pool; each block starts cold
+    and then warm-starts within itself. ``log_bins`` fits log-binned spectra (see
+    :func:`log_bin_psd`). Windows whose spectrum cannot be fitted get NaN parameters
+    and ``success=False``.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per window: ``t`` (window centre, s), the model parameters
+        (:data:`SPECTROGRAM_PARAMETERS`), ``r2_log``, ``rmse_log``, ``n_points`` and
+        ``success``.
+    """
+    import pandas as pd
+
+    from pynanopore.detection.parallel import resolve_n_jobs
+
+    if model not in SPECTROGRAM_PARAMETERS:
+        raise ValueError(f"model must be one of {sorted(SPECTROGRAM_PARAMETERS)}")
+    columns = ["t", *SPECTROGRAM_PARAMETERS[model], "r2_log", "rmse_log", "n_points", "success"]
+    n_windows = len(spectrogram.times)
+    if n_windows == 0:
+        return pd.DataFrame(columns=columns)
+    n_jobs = min(resolve_n_jobs(n_jobs), n_windows)
+    payloads = [
+        {
+            "model": model,
+            "frequencies": spectrogram.frequencies,
+            "times": spectrogram.times[block],
+            "power": spectrogram.power[block],
+            "max_frequency": float(max_frequency),
+            "warm_start": bool(warm_start),
+            "log_bins": log_bins,
+        }
+        for block in np.array_split(np.arange(n_windows), n_jobs)
+    ]
+    if n_jobs == 1:
+        blocks = [_fit_window_block(payloads[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            blocks = list(pool.map(_fit_window_block, payloads))
+    return pd.DataFrame([row for block in blocks for row in block], columns=columns)
@@ -0,0 +1,115 @@
+"""Incremental Welch PSD over chunked recordings with bounded memory."""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy.signal import get_window
+
+from pynanopore._dtypes import WorkingDType, as_working_array
+from pynanopore.psd.analyzer import ScalingType, WindowType
+
+DEFAULT_STREAM_NPERSEG = 1 << 14
+_SEGMENT_BLOCK = 256  # segments transformed per rfft call
+
+
+class WelchAccumulator:
+    """
+    Welch's method fed chunk by chunk: ``update()`` each chunk, then ``result()``.
+
+    Segments of ``nperseg`` samples every ``nperseg - noverlap`` samples are detrended
+    (mean removed), windowed and transformed as they become complete; only their
+    periodogram sum and the fewer than ``nperseg`` samples of the next, unfinished
+    segment are kept. For the same samples, window and overlap the result matches
+    ``scipy.signal.welch`` (one-sided, ``average='mean'``) regardless of how the
+    recording was split into chunks; the trailing partial segment is dropped as there.
+    """
+
+    def __init__(
+        self,
+        fs: float,
+        nperseg: int = DEFAULT_STREAM_NPERSEG,
+        noverlap: int | None = None,
+        *,
+        window: WindowType = "hamming",
+        scaling: ScalingType = "spectrum",
+        dtype: WorkingDType = "auto",
+    ):
+        if fs <= 0:
+            raise ValueError("fs must be positive")
+        if nperseg < 4:
+            raise ValueError("nperseg must be at least 4")
+        if noverlap is None:
+            noverlap = nperseg // 4
+        if not 0 <= noverlap < nperseg:
+            raise ValueError("noverlap must be in [0, nperseg)")
+        if scaling not in ("spectrum", "density"):
+            raise ValueError("scaling must be 'spectrum' or 'density'")
+        if dtype not in ("auto", "float32", "float64"):
+            raise ValueError("dtype must be 'auto', 'float32' or 'float64'")
+        self.fs = float(fs)
+        self.nperseg = int(nperseg)
+        self.noverlap = int(noverlap)
+        self.step = self.nperseg - self.noverlap
+        self.window = window
+        self.scaling: ScalingType = scaling
+        self.dtype: WorkingDType = dtype
+        self._win = get_window(window, self.nperseg).astype(float)
+        if scaling == "density":
+            self._scale = 1.0 / (self.fs * float(np.sum(self._win**2)))
+        else:
+            self._scale = 1.0 / float(np.sum(self._win)) ** 2
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all fed samples."""
+        self._sum = np.zeros(self.nperseg // 2 + 1, dtype=float)
+        self._n_segments = 0
+        self._pending: NDArray[np.floating] = np.empty(0, dtype=float)
+        self._n_seen = 0
+
+    @property
+    def n_segments(self) -> int:
+        """Number of complete segments averaged so far."""
+        return self._n_segments
+
+    @property
+    def n_samples(self) -> int:
+        """Number of samples fed since the last reset."""
+        return self._n_seen
+
+    def update(self, chunk: NDArray[np.floating] | tuple[NDArray, NDArray]) -> None:
+        """Add the next chunk (an array or a ``(current, time)`` pair from ``ChunkGenerator``)."""
+        if isinstance(chunk, tuple):
+            chunk = chunk[0]
+        x = as_working_array(chunk, self.dtype)
+        if x.ndim != 1:
+            raise ValueError("chunks must be one-dimensional")
+        self._n_seen += len(x)
+        pending = self._pending
+        buf = np.concatenate([pending.astype(x.dtype, copy=False), x]) if len(pending) else x
+        if len(buf) < self.nperseg:
+            self._pending = buf.copy()
+            return
+        n_seg = (len(buf) - self.nperseg) // self.step + 1
+        segments = np.lib.stride_tricks.sliding_window_view(buf, self.nperseg)[:: self.step]
+        win = self._win.astype(buf.dtype, copy=False)
+        for first in range(0, n_seg, _SEGMENT_BLOCK):
+            block = segments[first : first + _SEGMENT_BLOCK]
+            block = block - block.mean(axis=1, keepdims=True)
+            spectra = np.fft.rfft(block * win, axis=1)
+            self._sum += np.sum(np.abs(spectra) ** 2, axis=0, dtype=np.float64)
+        self._n_segments += n_seg
+        self._pending = buf[n_seg * self.step :].copy()
+
+    def result(self, *, skip_bins: int = 0) -> tuple[NDArray[np.floating], NDArray[np.floating]]:
+        """Return ``(frequencies, power)`` averaged over all complete segments so far."""
+        if self._n_segments == 0:
+            raise ValueError("not enough samples fed for one segment")
+        power = self._sum * (self._scale / self._n_segments)
+        if self.nperseg % 2:
+            power[1:] *= 2
+        else:
+            power[1:-1] *= 2
+        frequencies = np.fft.rfftfreq(self.nperseg, 1.0 / self.fs)
+        return frequencies[skip_bins:], power[skip_bins:]
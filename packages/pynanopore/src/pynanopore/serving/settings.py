@@ -16,6 +16,7 @@ class ServiceSettings(BaseSettings):
     request_id_header: str = "X-Request-ID"
     max_upload_mb: int = 100
     http_timeout_s: float = 120.0
+    n_jobs: int = 1  # worker processes for parallelizable requests (-1 = all CPUs)
 
 
 class GatewaySettings(ServiceSettings):
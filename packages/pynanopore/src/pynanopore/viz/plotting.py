@@ -33,6 +33,8 @@ class Plotting:
         threshold_multiplier: float = 1.5,
     ) -> Any:
         go = _require_plotly()
+        data_time = np.asarray(data_time)
+        data_chunk = np.asarray(data_chunk)
         data_time_list = data_time.tolist()
         data_chunk_list = data_chunk.tolist()
         smoothed = gaussian_filter1d(data_chunk, sigma=sigma)
@@ -94,6 +96,8 @@ class Plotting:
         threshold_multiplier: float = 1.5,
     ) -> Any:
         go = _require_plotly()
+        data_time = np.asarray(data_time)
+        data_chunk = np.asarray(data_chunk)
         data_time_list = data_time.tolist()
         data_chunk_list = data_chunk.tolist()
         smoothed = gaussian_filter1d(data_chunk, sigma=sigma)
@@ -149,8 +153,10 @@ def plot_pulse_shape(
     # Plotly/Pydantic JSON responses require plain Python lists, not ndarrays
     time_list = np.asarray(time, dtype=float).tolist()
     current_list = np.asarray(current, dtype=float).tolist()
-    pulse_time = np.asarray(pulse.time, dtype=float).tolist()
-    pulse_ideal = np.asarray(pulse.idealized, dtype=float).tolist()
+    # Step vertices at level transitions only; the "hv" line shape draws the same trace
+    step_t, step_y = pulse.runs.steps(pulse.time_axis)
+    pulse_time = step_t.tolist()
+    pulse_ideal = step_y.tolist()
 
     fig.add_trace(
         go.Scatter(
@@ -249,6 +255,7 @@ def plot_multi_level(
 
     time_list = np.asarray(time, dtype=float).tolist()
     current_list = np.asarray(current, dtype=float).tolist()
+    step_t, step_y = multilevel.runs.steps(multilevel.time_axis)
     ideal = np.asarray(multilevel.idealized, dtype=float)
     codes = np.asarray(multilevel.level_code, dtype=int)
     t = np.asarray(multilevel.time, dtype=float)
@@ -264,8 +271,8 @@ def plot_multi_level(
     )
     fig.add_trace(
         go.Scatter(
-            x=t.tolist(),
-            y=ideal.tolist(),
+            x=step_t.tolist(),
+            y=step_y.tolist(),
             mode="lines",
             name="Multi-level idealization",
             line=dict(color="black", width=2, shape="hv"),
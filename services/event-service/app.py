@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
 import pandas as pd
 from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile
 from pydantic import BaseModel
@@ -61,22 +62,21 @@ class PreviewResponse(BaseModel):
     filename: str | None = None
 
 
-def _make_baseline(kind: str, window_s: float, percentile: float = 90.0):
+def _make_baseline(kind: str, window_s: float, percentile: float = 90.0, engine: str = "exact"):
     if kind == "median":
-        return MedianBaseline(window_s=window_s)
+        return MedianBaseline(window_s=window_s, engine=engine)
     if kind == "constant":
         return ConstantBaseline()
     if kind == "percentile":
-        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5))
+        return PercentileBaseline(percentile=percentile, window_s=max(window_s, 0.5), engine=engine)
     return NoneBaseline()
 
 
 def _downsample(time, current, max_points: int):
     n = len(time)
-    if n <= max_points:
-        return time, current
-    step = max(1, n // max_points)
-    return time[::step], current[::step]
+    step = 1 if n <= max_points else max(1, n // max_points)
+    # Lazy time axes (UniformTime) and memory-mapped samples become plain arrays here
+    return np.asarray(time[::step]), np.asarray(current[::step])
 
 
 def _apply_window(trace, t_start: float | None, t_end: float | None):
@@ -99,7 +99,7 @@ async def preview_trace(
     """Load a recording and return a downsampled preview for UI threshold tuning."""
     request_id = getattr(request.state, "request_id", "unknown")
     suffix = Path(file.filename or "upload.abf").suffix.lower()
-    if suffix not in {".abf", ".csv"}:
+    if suffix not in {".abf", ".csv", ".npt"}:
         raise HTTPException(status_code=400, detail=f"Unsupported file type: {suffix}")
     try:
         raw = await file.read()
@@ -143,6 +143,8 @@ async def detect_events(
     baseline: Literal["none", "median", "constant", "percentile"] = Query("none"),
     baseline_window: float = Query(0.05, gt=0),
     baseline_percentile: float = Query(90.0, ge=0, le=100),
+    baseline_engine: Literal["exact", "decimate"] = Query("exact"),
+    baseline_scope: Literal["chunk", "trace"] = Query("chunk"),
     max_plot_points: int = Query(50000, ge=100),
     include_plot: bool = Query(False),
     include_pulse_plot: bool = Query(True),
@@ -152,7 +154,7 @@ async def detect_events(
 ) -> DetectResponse:
     request_id = getattr(request.state, "request_id", "unknown")
     suffix = Path(file.filename or "upload.abf").suffix.lower()
-    if suffix not in {".abf", ".csv"}:
+    if suffix not in {".abf", ".csv", ".npt"}:
         raise HTTPException(status_code=400, detail=f"Unsupported file type: {suffix}")
 
     try:
@@ -172,11 +174,19 @@ async def detect_events(
             threshold_multiplier=threshold_multiplier,
             min_duration=min_duration,
             direction=direction,
-            baseline=_make_baseline(baseline, baseline_window, baseline_percentile),
+            baseline=_make_baseline(
+                baseline, baseline_window, baseline_percentile, baseline_engine
+            ),
             analyze_levels=analyze_levels,
         )
-        events = detector.detect_trace(trace, interval_length=interval_length, overlap=overlap)
-        event_dicts = [e.to_dict() for e in events]
+        events = detector.detect_trace(
+            trace,
+            interval_length=interval_length,
+            overlap=overlap,
+            baseline_scope=baseline_scope,
+            as_table=True,
+        )
+        event_dicts = events.to_dicts()
 
         n = len(trace.time)
         end_idx = min(n, max_plot_points)
@@ -215,13 +225,11 @@ async def detect_events(
                 source=trace.source,
             )
             preview_events = []
-            for e in events:
-                if e.start_idx >= end_idx:
-                    continue
+            for e in events[events.columns["start_idx"] < end_idx]:
                 end_i = min(e.end_idx if e.end_idx >= 0 else end_idx - 1, end_idx - 1)
                 start_i = max(0, e.start_idx)
                 if end_i >= start_i:
-                    preview_events.append(replace(e, start_idx=start_i, end_idx=end_i))
+                    preview_events.append(replace(e.to_event(), start_idx=start_i, end_idx=end_i))
             pulse = PulseShapeIdealizer.from_events(preview_trace, preview_events)
             pulse_fig = plot_pulse_shape(preview_trace.time, preview_trace.current, pulse)
             pulse_plot = pulse_fig.to_plotly_json()
@@ -16,6 +16,7 @@ from pynanopore import (
     LorentzianWhiteFitter,
     MultiLorentzianFitter,
     PSDAnalyzer,
+    fit_spectrogram,
     load_trace,
 )
 from pynanopore.serving import ServiceSettings, configure_service
@@ -66,6 +67,32 @@ class PSDResponse(BaseModel):
     plot: dict[str, Any] | None = None
 
 
+class SpectrogramArrayRequest(BaseModel):
+    current: list[float]
+    fs: float = Field(..., gt=0)
+    window_s: float = Field(..., gt=0)
+    step_s: float | None = Field(None, gt=0)
+    fit_model: Literal["lorentzian", "lorentzian_white", "composite"] = "lorentzian"
+    warm_start: bool = True
+    max_frequency: float = Field(10000.0, gt=0)
+    nperseg: int | None = Field(None, gt=0)
+    noverlap: int | None = Field(None, ge=0)
+    window: str = "hamming"
+    scaling: Literal["density", "spectrum"] = "spectrum"
+    skip_bins: int = Field(2, ge=0)
+
+
+class SpectrogramResponse(BaseModel):
+    request_id: str
+    fs: float
+    fit_model: str
+    window_s: float
+    step_s: float
+    nperseg: int
+    n_windows: int
+    windows: list[dict[str, Any]]
+
+
 @app.get("/health")
 def health() -> dict[str, str]:
     return {"status": "ok", "service": "psd-service"}
@@ -153,6 +180,53 @@ def _analyze(
     )
 
 
+def _spectrogram(
+    current,
+    fs: float,
+    *,
+    request_id: str,
+    window_s: float,
+    step_s: float | None,
+    fit_model: str,
+    warm_start: bool,
+    max_frequency: float,
+    nperseg: int | None,
+    noverlap: int | None,
+    window: str,
+    scaling: str,
+    skip_bins: int,
+) -> SpectrogramResponse:
+    spec = PSDAnalyzer(fs=fs).compute_spectrogram(
+        current,
+        window_s,
+        step_s,
+        nperseg=nperseg,
+        noverlap=noverlap,
+        window=window,  # type: ignore[arg-type]
+        scaling=scaling,  # type: ignore[arg-type]
+        skip_bins=skip_bins,
+    )
+    table = fit_spectrogram(
+        spec,
+        model=fit_model,  # type: ignore[arg-type]
+        max_frequency=max_frequency,
+        warm_start=warm_start,
+        n_jobs=settings.n_jobs,
+    )
+    # NaN (failed window) is not valid JSON
+    windows = table.astype(object).where(table.notna(), None).to_dict(orient="records")
+    return SpectrogramResponse(
+        request_id=request_id,
+        fs=fs,
+        fit_model=fit_model,
+        window_s=spec.window_s,
+        step_s=spec.step_s,
+        nperseg=spec.nperseg,
+        n_windows=len(table),
+        windows=windows,
+    )
+
+
 @app.post("/v1/psd", response_model=PSDResponse)
 def compute_psd_from_array(request: Request, body: PSDArrayRequest) -> PSDResponse:
     request_id = getattr(request.state, "request_id", "unknown")
@@ -196,7 +270,7 @@ async def compute_psd_from_file(
 ) -> PSDResponse:
     request_id = getattr(request.state, "request_id", "unknown")
     suffix = Path(file.filename or "upload.abf").suffix.lower()
-    if suffix not in {".abf", ".csv"}:
+    if suffix not in {".abf", ".csv", ".npt"}:
         raise HTTPException(status_code=400, detail=f"Unsupported file type: {suffix}")
     try:
         raw = await file.read()
@@ -229,3 +303,79 @@ async def compute_psd_from_file(
     finally:
         if "tmp_path" in locals() and tmp_path.exists():
             tmp_path.unlink(missing_ok=True)
+
+
+@app.post("/v1/psd/spectrogram", response_model=SpectrogramResponse)
+def compute_spectrogram_from_array(
+    request: Request, body: SpectrogramArrayRequest
+) -> SpectrogramResponse:
+    request_id = getattr(request.state, "request_id", "unknown")
+    try:
+        return _spectrogram(
+            np.asarray(body.current, dtype=float),
+            body.fs,
+            request_id=request_id,
+            window_s=body.window_s,
+            step_s=body.step_s,
+            fit_model=body.fit_model,
+            warm_start=body.warm_start,
+            max_frequency=body.max_frequency,
+            nperseg=body.nperseg,
+            noverlap=body.noverlap,
+            window=body.window,
+            scaling=body.scaling,
+            skip_bins=body.skip_bins,
+        )
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.post("/v1/psd/spectrogram/upload", response_model=SpectrogramResponse)
+async def compute_spectrogram_from_file(
+    request: Request,
+    file: UploadFile = File(...),
+    window_s: float = Query(..., gt=0),
+    step_s: float | None = Query(None, gt=0),
+    fs: float | None = Query(None, gt=0),
+    fit_model: Literal["lorentzian", "lorentzian_white", "composite"] = Query("lorentzian"),
+    warm_start: bool = Query(True),
+    max_frequency: float = Query(10000.0, gt=0),
+    nperseg: int | None = Query(None, gt=0),
+    noverlap: int | None = Query(None, ge=0),
+    window: str = Query("hamming"),
+    scaling: Literal["density", "spectrum"] = Query("spectrum"),
+    skip_bins: int = Query(2, ge=0),
+) -> SpectrogramResponse:
+    request_id = getattr(request.state, "request_id", "unknown")
+    suffix = Path(file.filename or "upload.abf").suffix.lower()
+    if suffix not in {".abf", ".csv", ".npt"}:
+        raise HTTPException(status_code=400, detail=f"Unsupported file type: {suffix}")
+    try:
+        raw = await file.read()
+        enforce_upload_size(raw, settings, request_id)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(raw)
+            tmp_path = Path(tmp.name)
+        trace = load_trace(tmp_path, mmap=True)
+        return _spectrogram(
+            trace.current,
+            fs if fs is not None else trace.sample_rate,
+            request_id=request_id,
+            window_s=window_s,
+            step_s=step_s,
+            fit_model=fit_model,
+            warm_start=warm_start,
+            max_frequency=max_frequency,
+            nperseg=nperseg,
+            noverlap=noverlap,
+            window=window,
+            scaling=scaling,
+            skip_bins=skip_bins,
+        )
+    except HTTPException:
+        raise
+    except Exception as exc:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    finally:
+        if "tmp_path" in locals() and tmp_path.exists():
+            tmp_path.unlink(missing_ok=True)
@@ -29,6 +29,9 @@ class StatsRequest(BaseModel):
     method: Literal["mle", "histogram"] = "mle"
     binning: Literal["linear", "log"] = "linear"
     percentile_clip: float = Field(99.9, gt=0, le=100)
+    ci: float | None = Field(None, gt=0, lt=1)
+    n_boot: int = Field(1000, ge=2, le=100000)
+    seed: int | None = None
     include_plot: bool = False
 
 
@@ -42,6 +45,11 @@ class StatsResponse(BaseModel):
     log_likelihood: float | None = None
     aic: float | None = None
     bic: float | None = None
+    n_iter: int | None = None
+    converged: bool | None = None
+    ci: float | None = None
+    n_boot: int | None = None
+    confidence_intervals: dict[str, list[float]] | None = None
     model_comparison: dict[str, Any] | None = None
     bin_centers: list[float]
     hist: list[float]
@@ -78,7 +86,14 @@ def fit_dwelltime(request: Request, body: StatsRequest) -> StatsResponse:
             )
 
         fitter = DwellTimeExponentialFit(df, bins=body.bins, binning=body.binning)
-        result = fitter.fit(body.fit_type, method=body.method)
+        result = fitter.fit(
+            body.fit_type,
+            method=body.method,
+            ci=body.ci,
+            n_boot=body.n_boot,
+            seed=body.seed,
+            n_jobs=settings.n_jobs,
+        )
 
         comparison = None
         if body.fit_type == "auto" or body.method == "mle":
@@ -112,6 +127,11 @@ def fit_dwelltime(request: Request, body: StatsRequest) -> StatsResponse:
             log_likelihood=result.log_likelihood,
             aic=result.aic,
             bic=result.bic,
+            n_iter=result.n_iter,
+            converged=result.converged,
+            ci=result.ci,
+            n_boot=result.n_boot,
+            confidence_intervals=result.confidence_intervals,
             model_comparison=comparison,
             bin_centers=result.bin_centers,
             hist=result.hist,
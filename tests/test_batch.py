@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from pynanopore.batch import BatchDetectConfig, batch_detect, discover_recordings
 
@@ -40,3 +43,221 @@ def test_batch_detect(tmp_path: Path):
     assert (out_dir / "run_metadata.json").exists()
     assert (out_dir / "events" / "a_events.csv").exists()
     assert int(summary["n_events"].sum()) >= 1
+
+
+def test_discover_prefers_npt_cache(tmp_path: Path):
+    from pynanopore.io.npt import convert_to_npt
+
+    _write_csv(tmp_path / "a.csv")
+    _write_csv(tmp_path / "b.csv")
+    convert_to_npt(tmp_path / "a.csv")
+
+    files = discover_recordings(tmp_path)
+    assert [p.name for p in files] == ["a.npt", "b.csv"]
+
+
+def test_discover_skips_stale_npt_cache(tmp_path: Path):
+    from pynanopore.io.npt import convert_to_npt, write_npt
+
+    _write_csv(tmp_path / "a.csv")
+    convert_to_npt(tmp_path / "a.csv")
+    _write_csv(tmp_path / "a.abf")  # same stem, other format: its own recording
+    assert [p.name for p in discover_recordings(tmp_path)] == ["a.abf", "a.npt"]
+
+    # Re-recorded after conversion: the cache no longer matches its source
+    _write_csv(tmp_path / "a.csv", depth=20.0)
+    with pytest.warns(UserWarning, match="a.csv changed after it was converted"):
+        files = discover_recordings(tmp_path)
+    assert [p.name for p in files] == ["a.abf", "a.csv"]
+
+    # Same-stem recordings that are both processed keep separate events files
+    run = tmp_path / "run"
+    run.mkdir()
+    _write_csv(run / "a.csv")
+    write_npt(run / "a.npt", np.full(2000, 100.0), sample_rate=1000.0)  # not a conversion
+    summary = batch_detect(run, tmp_path / "out", BatchDetectConfig(interval_length=2.0))
+    assert sorted(summary["events_csv"]) == ["events/a_csv_events.csv", "events/a_npt_events.csv"]
+
+
+def test_batch_resumes_from_manifest(tmp_path: Path):
+    from pynanopore.batch import MANIFEST_NAME, load_manifest
+
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    for name in ("a", "b", "c"):
+        _write_csv(in_dir / f"{name}.csv")
+    cfg = BatchDetectConfig(interval_length=2.0, fit_dwelltime=False)
+
+    def run(config: BatchDetectConfig = cfg, **kwargs) -> tuple[pd.DataFrame, dict]:
+        summary = batch_detect(in_dir, out_dir, config, **kwargs)
+        meta = json.loads((out_dir / "run_metadata.json").read_text(encoding="utf-8"))
+        return summary, meta
+
+    first, meta = run()
+    assert (meta["n_processed"], meta["n_reused"]) == (3, 0)
+    assert set(load_manifest(out_dir)) == {"a.csv", "b.csv", "c.csv"}
+
+    # Unchanged inputs and settings: nothing is reprocessed, same summary
+    events_a = out_dir / "events" / "a_events.csv"
+    written = events_a.stat().st_mtime_ns
+    again, meta = run(BatchDetectConfig(interval_length=2.0, fit_dwelltime=False, n_jobs=2))
+    assert (meta["n_processed"], meta["n_reused"]) == (0, 3)
+    assert events_a.stat().st_mtime_ns == written
+    pd.testing.assert_frame_equal(again, first)
+
+    # Edited file, touched-but-identical file, deleted output, crash-truncated manifest line
+    _write_csv(in_dir / "a.csv", depth=60.0)
+    os.utime(in_dir / "b.csv", ns=(1, 1))
+    (out_dir / "events" / "c_events.csv").unlink()
+    with open(out_dir / MANIFEST_NAME, "a", encoding="utf-8") as fh:
+        fh.write('{"file": "b.csv", "size"')
+    _, meta = run()
+    assert (meta["n_processed"], meta["n_reused"]) == (2, 1)
+    assert load_manifest(out_dir)["b.csv"]["mtime_ns"] == 1
+    assert len((out_dir / MANIFEST_NAME).read_text(encoding="utf-8").splitlines()) == 3
+
+    # New detection settings or resume=False: everything again
+    _, meta = run(BatchDetectConfig(interval_length=1.0, fit_dwelltime=False))
+    assert meta["n_processed"] == 3
+    _, meta = run(BatchDetectConfig(interval_length=1.0, fit_dwelltime=False), resume=False)
+    assert meta["n_processed"] == 3
+
+
+def test_batch_memory_budget_and_resource_columns(tmp_path: Path):
+    from pynanopore.batch import estimate_peak_memory
+    from pynanopore.io.npt import convert_to_npt
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for name, n in (("small", 2000), ("large", 20000)):
+        t = np.arange(n) / 1000.0
+        current = np.full(n, 100.0)
+        current[400:450] -= 40.0
+        pd.DataFrame({"time_column": t, "data_column": current}).to_csv(
+            in_dir / f"{name}.csv", index=False
+        )
+    cfg = BatchDetectConfig(interval_length=2.0, fit_dwelltime=False)
+    small, large = (estimate_peak_memory(in_dir / f"{n}.csv", cfg) for n in ("small", "large"))
+    assert small < large
+    # Memory-mapped formats only hold chunks; a whole-trace baseline adds the trace
+    npt = convert_to_npt(in_dir / "large.csv", tmp_path / "large.npt")
+    assert estimate_peak_memory(npt, cfg) < large
+    trace_scope = BatchDetectConfig(interval_length=2.0, baseline_scope="trace")
+    assert estimate_peak_memory(npt, trace_scope) > estimate_peak_memory(npt, cfg)
+
+    # A budget below any single file: each file runs alone, all still complete
+    tight = BatchDetectConfig(
+        interval_length=2.0, fit_dwelltime=False, n_jobs=2, max_memory_gb=1e-6
+    )
+    summary = batch_detect(in_dir, tmp_path / "out", tight)
+    assert (summary["status"] == "ok").all()
+    assert (summary["wall_time_s"] > 0).all() and (summary["peak_rss_mb"] > 0).all()
+    assert summary.set_index("file")["est_memory_mb"].idxmax() == "large.csv"
+    with pytest.raises(ValueError, match="max_memory_gb"):
+        batch_detect(in_dir, tmp_path / "out", BatchDetectConfig(max_memory_gb=0))
+
+
+def test_batch_parquet_dataset(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+
+    from pynanopore.batch import open_events_dataset
+
+    in_dir = tmp_path / "in"
+    out_dir = tmp_path / "out"
+    in_dir.mkdir()
+    _write_csv(in_dir / "a.csv")
+    _write_csv(in_dir / "run 2.csv", depth=60.0)
+    cfg = BatchDetectConfig(interval_length=2.0, fit_dwelltime=False, output_format="parquet")
+    summary = batch_detect(in_dir, out_dir, cfg)
+    assert not (out_dir / "events").exists() and not (out_dir / "summary.csv").exists()
+    pd.testing.assert_frame_equal(pd.read_parquet(out_dir / "summary.parquet"), summary)
+    assert summary["events_parquet"].str.startswith("events.parquet/file=").all()
+
+    dataset = open_events_dataset(out_dir)
+    events = dataset.to_table().to_pandas()
+    assert sorted(events["file"].unique()) == ["a.csv", "run 2.csv"]
+    assert len(events) == int(summary["n_events"].sum())
+    assert events["start_idx"].dtype == np.int64
+    # The same rows as the CSV output, without re-parsing text
+    csv_out = tmp_path / "csv"
+    batch_detect(in_dir, csv_out, BatchDetectConfig(interval_length=2.0, fit_dwelltime=False))
+    from_csv = pd.read_csv(csv_out / "events" / "run 2_events.csv")
+    pushed = dataset.to_table(filter=ds.field("file") == "run 2.csv").to_pandas()
+    pd.testing.assert_frame_equal(pushed.drop(columns="file"), from_csv, check_dtype=False)
+    deep = dataset.to_table(filter=ds.field("delta_i") > 50).to_pandas()
+    assert set(deep["file"]) == {"run 2.csv"}
+
+    # Resume reuses the partitions; a removed recording drops out of the dataset
+    (in_dir / "a.csv").unlink()
+    batch_detect(in_dir, out_dir, cfg)
+    assert set(open_events_dataset(out_dir).to_table().column("file").to_pylist()) == {"run 2.csv"}
+    with pytest.raises(FileNotFoundError):
+        open_events_dataset(csv_out)
+
+
+def test_batch_records_unreadable_inputs_and_continues(tmp_path: Path, monkeypatch):
+    import pynanopore.batch as batch
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    _write_csv(in_dir / "a.csv")
+    _write_csv(in_dir / "locked.csv")
+    (in_dir / "corrupt.npt").write_bytes(b"not an npt header")
+    cfg = BatchDetectConfig(interval_length=2.0, fit_dwelltime=False)
+
+    # Corrupt header: the memory estimate and the load fail, the pool keeps going
+    pooled = batch_detect(
+        in_dir, tmp_path / "pooled", BatchDetectConfig(**{**vars(cfg), "n_jobs": 2})
+    )
+    status = dict(zip(pooled["file"], pooled["status"], strict=True))
+    assert status == {"a.csv": "ok", "corrupt.npt": "error", "locked.csv": "ok"}
+
+    # Unreadable file: hashing fails in the worker; recorded, not in the manifest
+    real_digest = batch.file_digest
+
+    def digest(path):
+        if Path(path).name == "locked.csv":
+            raise PermissionError(13, "Permission denied", str(path))
+        return real_digest(path)
+
+    monkeypatch.setattr(batch, "file_digest", digest)
+    summary = batch_detect(in_dir, tmp_path / "serial", cfg)
+    row = summary.set_index("file").loc["locked.csv"]
+    assert row["status"] == "error" and "Permission denied" in row["error"]
+    assert (summary.set_index("file").loc["a.csv", "status"]) == "ok"
+    assert set(batch.load_manifest(tmp_path / "serial")) == {"a.csv"}
+
+
+def _exit_on_crash(payload):
+    import pynanopore.batch as batch
+
+    if Path(payload["path"]).stem == "crash":
+        os._exit(1)
+    return batch._REAL_PROCESS_AND_RECORD(payload)
+
+
+def test_batch_survives_a_worker_that_dies(tmp_path: Path, monkeypatch):
+    import pynanopore.batch as batch
+
+    in_dir = tmp_path / "in"
+    in_dir.mkdir()
+    for stem in ("a", "b", "crash", "d", "e"):
+        _write_csv(in_dir / f"{stem}.csv")
+    monkeypatch.setattr(batch, "_REAL_PROCESS_AND_RECORD", batch._process_and_record, raising=False)
+    monkeypatch.setattr(batch, "_process_and_record", _exit_on_crash)
+
+    cfg = BatchDetectConfig(interval_length=2.0, fit_dwelltime=False, n_jobs=2)
+    summary = batch_detect(in_dir, tmp_path / "out", cfg)
+    status = dict(zip(summary["file"], summary["status"], strict=True))
+    # Only the file that kills its worker on its own is an error; the rest all finish
+    assert status == {
+        "a.csv": "ok",
+        "b.csv": "ok",
+        "crash.csv": "error",
+        "d.csv": "ok",
+        "e.csv": "ok",
+    }
+    assert set(batch.load_manifest(tmp_path / "out")) == {"a.csv", "b.csv", "d.csv", "e.csv"}
+    assert (tmp_path / "out" / "summary.csv").exists()
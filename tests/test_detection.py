@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pandas as pd
+import pytest
+
+from pynanopore.detection.baseline import (
+    ConstantBaseline,
+    MedianBaseline,
+    NoneBaseline,
+    PercentileBaseline,
+    estimate_trace_baseline,
+)
 from pynanopore.detection.chunking import ChunkGenerator
-from pynanopore.detection.events import EventDetector
+from pynanopore.detection.events import EVENT_FIELDS, Event, EventDetector, EventTable
+from pynanopore.detection.sweep import sweep_thresholds
 from pynanopore.io.trace import Trace
 
 
@@ -37,3 +49,269 @@ def test_detect_events_dicts(synthetic_trace: Trace):
         assert "difference" in dicts[0]
         assert "delta_i" in dicts[0]
         assert "i0" in dicts[0]
+
+
+def _assert_same_events(a, b):
+    """Identical bounds; every feature equal to float tolerance (NaN == NaN)."""
+    assert [(e.start_idx, e.end_idx) for e in a] == [(e.start_idx, e.end_idx) for e in b]
+    for ea, eb in zip(a, b, strict=True):
+        da, db = ea.to_dict(), eb.to_dict()
+        assert da.keys() == db.keys()
+        np.testing.assert_allclose(list(da.values()), list(db.values()), rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("std_mult", "thr_mult", "min_duration"),
+    [(0.5, 2.0, 0.01), (0.25, 1.5, 1e-4), (1.0, 0.5, 0.0), (0.0, 0.0, 0.0)],
+)
+def test_numpy_engine_matches_python_loop(
+    synthetic_trace: Trace, std_mult: float, thr_mult: float, min_duration: float
+):
+    kwargs = {"min_duration": min_duration}
+    fast = EventDetector(std_mult, thr_mult, engine="numpy", **kwargs)
+    ref = EventDetector(std_mult, thr_mult, engine="python", **kwargs)
+    for interval in (0.3, 1.0):
+        a = fast.detect_trace(synthetic_trace, interval_length=interval)
+        b = ref.detect_trace(synthetic_trace, interval_length=interval)
+        _assert_same_events(a, b)
+
+
+def test_numpy_engine_matches_python_loop_on_noise():
+    rng = np.random.default_rng(7)
+    current = rng.normal(0.0, 1.0, size=5000)
+    time = np.arange(len(current)) / 1000.0
+    for direction in ("down", "up"):
+        fast = EventDetector(0.3, 1.2, min_duration=0.0, direction=direction, analyze_levels=False)
+        ref = EventDetector(
+            0.3, 1.2, min_duration=0.0, direction=direction, analyze_levels=False, engine="python"
+        )
+        a = fast.detect_events(current, time, sample_rate=1000.0)
+        b = ref.detect_events(current, time, sample_rate=1000.0)
+        assert len(a) > 10
+        _assert_same_events(a, b)
+
+
+def test_invalid_engine():
+    with pytest.raises(ValueError, match="engine"):
+        EventDetector(engine="cython")  # type: ignore[arg-type]
+
+
+def test_detect_trace_as_table_matches_events(synthetic_trace: Trace):
+    detector = EventDetector(std_multiplier=0.5, threshold_multiplier=2.0, min_duration=0.01)
+    events = detector.detect_trace(synthetic_trace, interval_length=1.0)
+    table = detector.detect_trace(synthetic_trace, interval_length=1.0, as_table=True)
+    assert isinstance(table, EventTable)
+    assert len(table) == len(events)
+    assert table.to_dicts() == [e.to_dict() for e in events]
+    assert table[0].start_idx == events[0].start_idx
+    assert table[-1].to_event() == events[-1]
+
+
+def test_event_table_to_pandas_is_zero_copy(synthetic_trace: Trace):
+    table = EventDetector(0.5, 2.0).detect_trace(synthetic_trace, as_table=True)
+    df = table.to_pandas()
+    assert list(df.columns) == list(EVENT_FIELDS)
+    assert np.shares_memory(df["difference"].to_numpy(), table.columns["difference"])
+    assert df["start_idx"].dtype == np.int64
+
+
+def test_event_table_row_view_writes_through():
+    table = EventTable.empty()
+    assert len(table) == 0
+    assert table.to_pandas().empty
+    table = EventTable.from_events([Event(0.0, 0.5, 0.5, -1.0), Event(1.0, 1.2, 0.2, -2.0)])
+    row = table[1]
+    row.i0 = 100.0
+    assert table.columns["i0"][1] == 100.0
+    assert row.dwell_time == pytest.approx(0.2)
+    sub = table[table.columns["difference"] > 0.3]
+    assert len(sub) == 1
+    assert len(EventTable.concat([table, sub])) == 3
+    with pytest.raises(AttributeError):
+        _ = row.not_a_field
+
+
+@pytest.mark.parametrize(
+    "baseline",
+    [NoneBaseline(), ConstantBaseline(), MedianBaseline(0.05), PercentileBaseline(90.0, 0.5)],
+    ids=["none", "constant", "median", "percentile"],
+)
+@pytest.mark.parametrize("engine", ["numpy", "python"])
+def test_float32_working_dtype_matches_float64(synthetic_trace: Trace, baseline, engine: str):
+    kwargs = dict(min_duration=0.01, baseline=baseline, engine=engine)
+    detector32 = EventDetector(0.5, 2.0, dtype="float32", **kwargs)
+    detector64 = EventDetector(0.5, 2.0, dtype="float64", **kwargs)
+
+    work, base, raw = detector32._prepare_signal(synthetic_trace.current, 1000.0)
+    assert work.dtype == base.dtype == raw.dtype == np.float32
+
+    events32 = detector32.detect_trace(synthetic_trace, interval_length=1.0)
+    events64 = detector64.detect_trace(synthetic_trace, interval_length=1.0)
+    assert len(events64) >= 1
+    assert [(e.start_idx, e.end_idx) for e in events32] == [
+        (e.start_idx, e.end_idx) for e in events64
+    ]
+    for e32, e64 in zip(events32, events64, strict=True):
+        assert isinstance(e32.blockade_mean, float)
+        d32, d64 = e32.to_dict(), e64.to_dict()
+        np.testing.assert_allclose(list(d32.values()), list(d64.values()), rtol=1e-5, atol=1e-6)
+
+
+def test_auto_dtype_keeps_float32_input(synthetic_trace: Trace):
+    current32 = synthetic_trace.current.astype(np.float32)
+    detector = EventDetector(0.5, 2.0, min_duration=0.01, baseline=MedianBaseline(0.05))
+    work, _, _ = detector._prepare_signal(current32, 1000.0)
+    assert work.dtype == np.float32
+    work, _, _ = detector._prepare_signal(synthetic_trace.current, 1000.0)
+    assert work.dtype == np.float64
+    with pytest.raises(ValueError, match="dtype"):
+        EventDetector(dtype="float16")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "estimator",
+    [MedianBaseline(0.05), PercentileBaseline(90.0, 0.2), ConstantBaseline(), NoneBaseline()],
+    ids=["median", "percentile", "constant", "none"],
+)
+def test_trace_baseline_blockwise_matches_full(synthetic_trace: Trace, estimator):
+    fs = synthetic_trace.sample_rate
+    blocked = estimate_trace_baseline(estimator, synthetic_trace.current, fs, block_size=300)
+    if isinstance(estimator, NoneBaseline):
+        expected = np.full(len(synthetic_trace.current), synthetic_trace.current.mean())
+    else:
+        expected = estimator.estimate(synthetic_trace.current, fs)
+    np.testing.assert_allclose(blocked, expected, rtol=1e-12)
+
+
+def test_detect_trace_with_trace_baseline(synthetic_trace: Trace):
+    class CountingMedian(MedianBaseline):
+        n_estimated = 0
+
+        def estimate(self, current, sample_rate):
+            CountingMedian.n_estimated += len(current)
+            return super().estimate(current, sample_rate)
+
+    fs = synthetic_trace.sample_rate
+    detector = EventDetector(0.5, 2.0, min_duration=0.01, baseline=CountingMedian(0.2))
+    per_chunk = detector.detect_trace(synthetic_trace, interval_length=0.5, overlap=0.25)
+    chunk_cost, CountingMedian.n_estimated = CountingMedian.n_estimated, 0
+    events = detector.detect_trace(
+        synthetic_trace, interval_length=0.5, overlap=0.25, baseline_scope="trace"
+    )
+    assert CountingMedian.n_estimated == len(synthetic_trace.current) < chunk_cost
+    assert len(events) >= 1 and len(per_chunk) >= 1
+
+    full = MedianBaseline(0.2).estimate(synthetic_trace.current, fs)
+    np.testing.assert_allclose([e.i0 for e in events], full[[e.start_idx for e in events]])
+
+    with pytest.raises(ValueError, match="baseline_scope"):
+        detector.detect_trace(synthetic_trace, baseline_scope="file")  # type: ignore[call-overload]
+    with pytest.raises(ValueError, match="streaming"):
+        detector.detect_trace(synthetic_trace, streaming=True, baseline_scope="trace")
+
+
+@pytest.mark.parametrize("uniform", [True, False], ids=["uniform", "explicit"])
+@pytest.mark.parametrize("baseline_scope", ["chunk", "trace"])
+def test_parallel_detect_trace_matches_serial(
+    synthetic_trace: Trace, uniform: bool, baseline_scope: str
+):
+    trace = (
+        Trace.uniform(synthetic_trace.current, synthetic_trace.sample_rate)
+        if uniform
+        else synthetic_trace
+    )
+    detector = EventDetector(0.5, 2.0, min_duration=0.01, baseline=MedianBaseline(0.2))
+    kwargs = dict(interval_length=0.4, overlap=0.1, baseline_scope=baseline_scope, as_table=True)
+    serial = detector.detect_trace(trace, **kwargs)
+    parallel = detector.detect_trace(trace, n_jobs=2, **kwargs)
+    assert len(serial) >= 1
+    assert serial.columns.keys() == parallel.columns.keys()
+    for name, values in serial.columns.items():
+        np.testing.assert_array_equal(parallel.columns[name], values)
+
+    with pytest.raises(ValueError, match="n_jobs"):
+        detector.detect_trace(trace, streaming=True, n_jobs=2)
+
+
+def test_parallel_worker_reports_attach_errors(monkeypatch):
+    from pynanopore.detection import parallel
+
+    shm, spec = parallel._share(np.ones(100), np.dtype(np.float64))
+    attached = []
+    real_attach = parallel._attach
+
+    def attach(segment):
+        attached.append(real_attach(segment)[0])
+        return attached[-1], np.ndarray((segment["n"],), buffer=attached[-1].buf)
+
+    monkeypatch.setattr(parallel, "_attach", attach)
+    payload = {
+        "detector": EventDetector(),
+        "current": spec,
+        "time": {**spec, "name": "pynanopore-missing-segment"},
+        "baseline": None,
+        "bounds": [(0, 100)],
+        "sample_rate": 1000.0,
+    }
+    try:
+        # The real error surfaces and the segment already attached is closed
+        with pytest.raises(FileNotFoundError):
+            parallel._detect_chunk_group(payload)
+        assert len(attached) == 1 and attached[0].buf is None
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+@pytest.mark.parametrize("baseline_scope", ["chunk", "trace"])
+def test_sweep_thresholds_matches_detect_trace(synthetic_trace: Trace, baseline_scope: str):
+    base = EventDetector(baseline=MedianBaseline(0.2))
+    grid = {
+        "std_multiplier": [0.25, 0.5],
+        "threshold_multiplier": [1.0, 2.0],
+        "min_duration": [0.0, 0.01],
+    }
+    kwargs = dict(interval_length=0.4, overlap=0.1, baseline_scope=baseline_scope)
+    table = sweep_thresholds(synthetic_trace, grid, detector=base, **kwargs)
+    assert len(table) == 8
+    assert list(table.columns[:3]) == ["std_multiplier", "threshold_multiplier", "min_duration"]
+
+    for row in table.itertuples():
+        detector = EventDetector(
+            row.std_multiplier,
+            row.threshold_multiplier,
+            row.min_duration,
+            baseline=MedianBaseline(0.2),
+        )
+        events = detector.detect_trace(synthetic_trace, as_table=True, **kwargs)
+        assert row.n_events == len(events)
+        if len(events):
+            assert row.dwell_median == pytest.approx(np.median(events.columns["dwell_time"]))
+            assert row.delta_i_median == pytest.approx(np.median(events.columns["delta_i"]))
+        else:
+            assert np.isnan(row.dwell_median)
+
+
+def test_sweep_thresholds_point_list_and_validation(synthetic_trace: Trace):
+    table = sweep_thresholds(
+        synthetic_trace, [{"std_multiplier": 0.5}, {"threshold_multiplier": 3.0}]
+    )
+    assert table[["std_multiplier", "threshold_multiplier"]].values.tolist() == [
+        [0.5, 1.5],
+        [0.25, 3.0],
+    ]
+    with pytest.raises(ValueError, match="Unknown"):
+        sweep_thresholds(synthetic_trace, {"window": [1.0]})
+    with pytest.raises(ValueError, match="empty"):
+        sweep_thresholds(synthetic_trace, [])
+
+
+def test_cli_sweep(csv_trace_path, tmp_path):
+    from pynanopore.cli import main
+
+    out = tmp_path / "sweep.csv"
+    argv = ["sweep", str(csv_trace_path), "--std-multipliers", "0.25", "0.5"]
+    assert main([*argv, "--min-durations", "0", "0.01", "--interval", "1", "-o", str(out)]) == 0
+    table = pd.read_csv(out)
+    assert len(table) == 4
+    assert (table["n_events"] >= 0).all()
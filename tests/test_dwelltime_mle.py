@@ -6,7 +6,14 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pynanopore.dwelltime.fit import DwellTimeExponentialFit
+from pynanopore.dwelltime.bootstrap import bootstrap_dwell_fit
+from pynanopore.dwelltime.fit import (
+    DwellTimeExponentialFit,
+    clear_fit_cache,
+    fit_cache_info,
+    fit_exponential_mixture,
+    set_fit_cache_size,
+)
 
 
 def test_mle_single_recovers_tau():
@@ -54,3 +61,155 @@ def test_compare_models():
     both = fit.compare_models()
     assert "single" in both and "double" in both
     assert both["single"].aic <= both["double"].aic + 50  # soft check
+
+
+def test_em_double_matches_nelder_mead_likelihood():
+    rng = np.random.default_rng(5)
+    dwells = np.concatenate([rng.exponential(0.002, 3000), rng.exponential(0.03, 1000)])
+    fit = DwellTimeExponentialFit(pd.DataFrame({"difference": dwells}), bins=50)
+    em = fit.fit_mle_double()
+    reference = fit.fit_mle_double(solver="nelder-mead")
+    assert em.converged and 0 < em.n_iter < 200
+    # EM reaches the maximum Nelder-Mead finds (or a higher one)
+    assert em.log_likelihood >= reference.log_likelihood - 1e-6
+    assert em.parameters["tau1"] == pytest.approx(reference.parameters["tau1"], rel=1e-3)
+    assert em.parameters["tau2"] == pytest.approx(reference.parameters["tau2"], rel=1e-3)
+    assert em.parameters["w"] == pytest.approx(0.75, abs=0.03)
+    assert fit.last_result is reference
+    with pytest.raises(ValueError, match="solver"):
+        fit.fit_mle_double(solver="bfgs")  # type: ignore[arg-type]
+
+
+def test_em_mixture_three_components_and_acceleration():
+    rng = np.random.default_rng(6)
+    taus = [0.001, 0.01, 0.1]
+    dwells = np.concatenate([rng.exponential(tau, 4000) for tau in taus])
+    mixture = fit_exponential_mixture(dwells, 3)
+    assert mixture.converged
+    np.testing.assert_allclose(mixture.taus, taus, rtol=0.1)
+    np.testing.assert_allclose(mixture.weights, 1 / 3, atol=0.03)
+    assert float(np.sum(np.log(mixture.pdf(dwells)))) == pytest.approx(mixture.log_likelihood)
+
+    plain = fit_exponential_mixture(dwells, 3, accelerate=False)
+    assert mixture.n_iter < plain.n_iter
+    assert mixture.log_likelihood >= plain.log_likelihood - 1e-6 * abs(plain.log_likelihood)
+
+    capped = fit_exponential_mixture(dwells, 3, accelerate=False, max_iter=3)
+    assert capped.n_iter == 3 and not capped.converged
+
+    single = fit_exponential_mixture(dwells, 1)
+    assert single.taus[0] == pytest.approx(np.mean(dwells))
+
+    result = DwellTimeExponentialFit(pd.DataFrame({"difference": dwells})).fit_mle_mixture(3)
+    assert result.fit_type == "mixture3" and set(result.parameters) == {
+        "w1",
+        "w2",
+        "w3",
+        "tau1",
+        "tau2",
+        "tau3",
+    }
+    assert result.aic == pytest.approx(2 * 5 - 2 * result.log_likelihood)
+    with pytest.raises(ValueError):
+        fit_exponential_mixture(dwells, 0)
+    with pytest.raises(ValueError):
+        fit_exponential_mixture(np.r_[dwells, -1.0], 2)
+
+
+def test_bootstrap_single_closed_form_paths_agree():
+    rng = np.random.default_rng(7)
+    continuous = rng.exponential(0.01, 4000)
+    quantized = np.ceil(continuous * 1e4) / 1e4  # 100 µs sampling: ~10x fewer distinct values
+    for dwells in (continuous, quantized):
+        boot = bootstrap_dwell_fit(dwells, n_boot=2000, seed=0)
+        lo, hi = boot.intervals(0.95)["tau"]
+        se = np.std(dwells) / np.sqrt(len(dwells))
+        assert lo < np.mean(dwells) < hi
+        assert hi - lo == pytest.approx(2 * 1.96 * se, rel=0.1)
+        again = bootstrap_dwell_fit(dwells, n_boot=2000, seed=0)
+        np.testing.assert_array_equal(boot.samples["tau"], again.samples["tau"])
+
+
+def test_fit_with_bootstrap_ci(tmp_path, capsys):
+    import json
+
+    from pynanopore.cli import main
+
+    rng = np.random.default_rng(8)
+    dwells = np.concatenate([rng.exponential(0.002, 1500), rng.exponential(0.03, 500)])
+    dwells = np.ceil(dwells * 2e5) / 2e5
+    fit = DwellTimeExponentialFit(pd.DataFrame({"difference": dwells}), bins=40)
+    result = fit.fit("double", ci=0.9, n_boot=96, seed=3)
+    assert result.ci == 0.9 and result.n_boot == 96
+    for name in ("w", "tau1", "tau2"):
+        lo, hi = result.confidence_intervals[name]
+        assert lo < result.parameters[name] < hi
+    assert result.confidence_intervals["tau1"][1] < result.confidence_intervals["tau2"][0]
+    # Seeded blocks: the process pool reproduces the serial intervals exactly
+    fresh = DwellTimeExponentialFit(
+        pd.DataFrame({"difference": dwells}), bins=40, shared_cache=False
+    )
+    pooled = fresh.fit("double", ci=0.9, n_boot=96, seed=3, n_jobs=2)
+    assert pooled.confidence_intervals == result.confidence_intervals
+    assert fit.fit("single").confidence_intervals is None
+    with pytest.raises(ValueError, match="mle"):
+        fit.fit("single", method="histogram", ci=0.95)
+    with pytest.raises(ValueError, match="ci"):
+        fit.fit("single", ci=1.5)
+
+    path = tmp_path / "events.csv"
+    pd.DataFrame({"difference": dwells}).to_csv(path, index=False)
+    assert main(["dwelltime", str(path), "--ci", "0.95", "--n-boot", "50", "--seed", "1"]) == 0
+    out = json.loads(capsys.readouterr().out)
+    assert out["ci"] == 0.95 and len(out["confidence_intervals"]["tau"]) == 2
+
+
+def test_fits_are_memoized_per_instance_and_across_instances():
+    rng = np.random.default_rng(9)
+    dwells = np.concatenate([rng.exponential(0.002, 600), rng.exponential(0.03, 400)])
+    df = pd.DataFrame({"difference": dwells})
+    clear_fit_cache()
+
+    fit = DwellTimeExponentialFit(df, bins=40)
+    double = fit.fit("double")
+    both = fit.compare_models()
+    assert both["double"] is double
+    assert fit.fit("auto") in (both["single"], double)
+    assert fit.fit("double", ci=0.9, n_boot=20, seed=1) is fit.fit(
+        "double", ci=0.9, n_boot=20, seed=1
+    )
+    assert double.confidence_intervals is None  # CIs go on a copy
+    # A histogram fit reports its own curve_fit curve, never a memoized MLE/EM pdf
+    hist_double = fit.fit("double", method="histogram")
+    np.testing.assert_array_equal(
+        hist_double.fitted, fit.double_exponential(fit.bin_centers, *fit.params_double)
+    )
+    assert hist_double.fitted != double.fitted
+    # Histogram fits restore the legacy parameter arrays on a hit
+    hist = fit.fit("single", method="histogram")
+    assert fit.fit("single", method="histogram") is hist
+    misses = fit_cache_info()["misses"]
+
+    # Same dwells, bins and binning: served from the process-wide LRU as copies
+    other = DwellTimeExponentialFit(df, bins=40)
+    again = other.fit("double")
+    assert again is not double and again == double
+    other.fit("single", method="histogram")
+    assert other.params_single is not None
+    assert fit_cache_info()["misses"] == misses
+    # Different binning or a private cache: fitted afresh
+    assert DwellTimeExponentialFit(df, bins=40, binning="log").fit("double") is not None
+    assert fit_cache_info()["misses"] > misses
+    private = DwellTimeExponentialFit(df, bins=40, shared_cache=False)
+    assert private.fit("double") == double and private.fit("double") is not again
+
+    set_fit_cache_size(1)
+    assert fit_cache_info()["size"] == 1
+    set_fit_cache_size(0)
+    DwellTimeExponentialFit(df, bins=40).fit("single")
+    assert fit_cache_info()["size"] == 0
+    with pytest.raises(ValueError, match="maxsize"):
+        set_fit_cache_size(-1)
+    set_fit_cache_size(256)
+    clear_fit_cache()
+    assert fit_cache_info() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 256}
@@ -7,7 +7,7 @@ import pytest
 
 from pynanopore.detection.baseline import ConstantBaseline, MedianBaseline, NoneBaseline
 from pynanopore.detection.events import EventDetector
-from pynanopore.detection.pulse_shape import PulseShapeIdealizer
+from pynanopore.detection.pulse_shape import PulseShapeIdealizer, PulseShapeResult
 from pynanopore.io.trace import Trace
 
 
@@ -107,6 +107,43 @@ def test_pulse_shape_levels():
     assert len(ft) == len(events)
 
 
+def test_pulse_shape_runs_match_dense_fill():
+    from pynanopore.detection.idealized import IdealizedTrace
+
+    trace = _make_trace(direction="down", open_level=100.0, depth=40.0, noise=0.2)
+    det = EventDetector(0.5, 2.0, min_duration=0.02, direction="down")
+    table = det.detect_trace(trace, interval_length=2.0, as_table=True)
+    assert len(table)
+    pulse = PulseShapeIdealizer.from_events(trace, table)
+
+    open_fill = float(np.median(table.columns["i0"]))
+    idealized = np.full(len(trace.current), open_fill)
+    open_level = np.full(len(trace.current), open_fill)
+    for ev in table:
+        idealized[ev.start_idx : ev.end_idx + 1] = ev.blockade_mean
+        open_level[ev.start_idx : ev.end_idx + 1] = ev.i0
+    np.testing.assert_array_equal(pulse.idealized, idealized)
+    np.testing.assert_array_equal(pulse.open_level, open_level)
+    assert pulse.runs.n_runs == 2 * len(table) + 1
+    np.testing.assert_array_equal(pulse.runs.to_array(300, 700), idealized[300:700])
+    assert pulse.rising_edges[0].tolist() == table.columns["start_time"].tolist()
+
+    # Dense arrays in the old (time, idealized, open_level, events) order
+    legacy = PulseShapeResult.from_arrays(trace.time, idealized, open_level, table)
+    assert legacy.idealized is idealized and legacy.time is trace.time
+    np.testing.assert_array_equal(legacy.runs.starts, pulse.runs.starts)
+    np.testing.assert_array_equal(legacy.runs.codes, pulse.runs.codes)
+    np.testing.assert_array_equal(legacy.open_runs.to_array(), open_level)
+
+    # Run-length encoding never touches per-sample storage
+    runs = IdealizedTrace.from_segments(
+        10**9, [10, 5 * 10**8], [19, 10**9 + 5], [1.0, 2.0], 1, fill_value=0.0
+    )
+    assert runs.starts.tolist() == [0, 10, 20, 5 * 10**8]
+    assert runs.to_array(8, 12).tolist() == [0.0, 0.0, 1.0, 1.0]
+    assert runs.codes_array(10**9 - 2).tolist() == [1, 1]
+
+
 def test_none_baseline_compatible():
     trace = _make_trace()
     det = EventDetector(0.5, 2.0, min_duration=0.02, baseline=NoneBaseline())
@@ -120,3 +157,44 @@ def test_overlap_dedup():
     events = det.detect_trace(trace, interval_length=1.0, overlap=0.2)
     starts = [e.start_idx for e in events]
     assert len(starts) == len(set(starts))
+
+
+@pytest.mark.parametrize("sample_rate", [1000.0, 0.0])
+def test_batched_features_match_build_event(sample_rate: float):
+    from pynanopore.detection.events import _build_event, _build_event_table
+
+    rng = np.random.default_rng(3)
+    n = 3000
+    time = np.arange(n) / 1000.0
+    current = 100.0 + rng.normal(0, 0.5, size=n)
+    starts = np.array([100, 900, 2000, 2990])
+    ends = np.array([180, 1020, 2003, 2999])
+    for s, e in zip(starts, ends, strict=True):
+        ramp = np.minimum(1.0, np.arange(e - s + 1) / 8.0) * np.minimum(
+            1.0, np.arange(e - s + 1)[::-1] / 5.0
+        )
+        current[s : e + 1] -= 30.0 * ramp
+    i0 = np.full(len(starts), 100.0)
+    i0[1] = 0.0  # exercises the delta_i_over_i0 = NaN branch
+
+    table = _build_event_table(
+        current=current,
+        time=time,
+        starts=starts,
+        ends=ends,
+        direction="down",
+        sample_rate=sample_rate,
+        baseline_values=i0,
+    )
+    for row, s, e, ref_i0 in zip(table, starts, ends, i0, strict=True):
+        ref = _build_event(
+            current=current,
+            time=time,
+            start_idx=int(s),
+            end_idx=int(e),
+            direction="down",
+            sample_rate=sample_rate,
+            baseline_value=float(ref_i0),
+        ).to_dict()
+        got = row.to_dict()
+        np.testing.assert_allclose([got[k] for k in ref], list(ref.values()), rtol=1e-9, atol=1e-12)
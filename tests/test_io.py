@@ -5,10 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
+from pynanopore.detection.events import EventDetector
+from pynanopore.io.abf_mmap import MemmapABFReader, ScaledSamples
+from pynanopore.io.npt import convert_to_npt, load_npt, read_npt_header, write_npt
 from pynanopore.io.readers import load_trace
-from pynanopore.io.trace import Trace
+from pynanopore.io.trace import Trace, UniformTime
 
 
 def test_trace_validation():
@@ -42,3 +46,194 @@ def test_unsupported_extension(tmp_path: Path):
     bad.write_text("nope")
     with pytest.raises(ValueError, match="Unsupported"):
         load_trace(bad)
+
+
+@pytest.fixture
+def abf_path(tmp_path: Path, synthetic_trace: Trace) -> Path:
+    from pyabf.abfWriter import writeABF1
+
+    path = tmp_path / "trace.abf"
+    writeABF1(synthetic_trace.current[None, :], str(path), synthetic_trace.sample_rate)
+    return path
+
+
+def test_memmap_abf_matches_full_load(abf_path: Path):
+    full = load_trace(abf_path)
+    lazy = load_trace(abf_path, mmap=True)
+    assert isinstance(lazy.current, ScaledSamples)
+    assert len(lazy.current) == len(full.current)
+    assert lazy.sample_rate == full.sample_rate
+    assert lazy.duration == pytest.approx(full.duration)
+    # pyabf scales in float32; the reader scales in float64
+    np.testing.assert_allclose(lazy.current[100:200], full.current[100:200], atol=1e-4)
+    np.testing.assert_array_equal(lazy.time[100:200], full.time[100:200])
+    assert lazy.current[5] == pytest.approx(full.current[5], abs=1e-4)
+
+
+def test_memmap_abf_windows_and_detection(abf_path: Path):
+    reader = MemmapABFReader(abf_path)
+    current, time = reader.window(10, 60)
+    assert current.shape == time.shape == (50,)
+    chunks = list(reader.iter_chunks(interval_length=0.5))
+    assert sum(len(c) for c, _ in chunks) == reader.n_samples
+
+    detector = EventDetector(0.5, 2.0, min_duration=0.01)
+    lazy_events = detector.detect_trace(reader.to_trace(), interval_length=1.0)
+    full_events = detector.detect_trace(load_trace(abf_path), interval_length=1.0)
+    assert [e.start_idx for e in lazy_events] == [e.start_idx for e in full_events]
+    assert len(lazy_events) >= 1
+
+
+def test_memmap_abf_bad_sweep(abf_path: Path):
+    with pytest.raises(ValueError, match="Sweep"):
+        MemmapABFReader(abf_path, sweep=3)
+
+
+def test_uniform_trace_slices_match_explicit(synthetic_trace: Trace):
+    uniform = Trace.uniform(synthetic_trace.current, synthetic_trace.sample_rate, t0=0.25)
+    explicit = Trace(
+        time=np.asarray(uniform.time), current=uniform.current, sample_rate=uniform.sample_rate
+    )
+    assert uniform.is_uniform and not explicit.is_uniform
+    assert uniform.duration == explicit.duration
+
+    sub = uniform.slice_by_index(100, 400)
+    assert isinstance(sub.time, UniformTime)
+    np.testing.assert_array_equal(sub.time[:], explicit.time[100:400])
+
+    times = np.asarray(uniform.time)
+    for t_start, t_end in [(0.5, 1.0), (times[10], times[20]), (0.0, 0.2500001), (1.3337, 9.0)]:
+        a = uniform.slice_by_time(t_start, t_end)
+        b = explicit.slice_by_time(t_start, t_end)
+        np.testing.assert_array_equal(np.asarray(a.time), b.time)
+        np.testing.assert_array_equal(a.current, b.current)
+    with pytest.raises(ValueError, match="no samples"):
+        uniform.slice_by_time(100.0, 101.0)
+
+
+def test_uniform_time_ndarray_api_and_pandas(abf_path: Path):
+    time = load_trace(abf_path).time
+    assert isinstance(time, UniformTime)
+    values = np.asarray(time)
+    sub = time.window(10, 5000)
+    assert time.size == values.size and time.shape == values.shape
+    assert time.astype(np.float32).dtype == np.float32
+    copied = time.copy()
+    copied[0] = -1.0
+    assert time[0] == values[0]
+    assert sub.mean() == pytest.approx(values[10:5000].mean(), rel=1e-12)
+    assert time.std() == pytest.approx(values.std()) and time.argmax() == len(values) - 1
+    assert list(sub) == values[10:5000].tolist()
+
+    frame = pd.DataFrame({"t": time, "i": load_trace(abf_path).current})
+    np.testing.assert_array_equal(frame["t"].to_numpy(), values)
+    np.testing.assert_array_equal(pd.Series(sub).to_numpy(), values[10:5000])
+
+
+def test_uniform_trace_detection_matches_explicit(synthetic_trace: Trace):
+    uniform = Trace.uniform(synthetic_trace.current, synthetic_trace.sample_rate)
+    explicit = Trace(
+        time=np.asarray(uniform.time), current=uniform.current, sample_rate=uniform.sample_rate
+    )
+    detector = EventDetector(0.5, 2.0, min_duration=0.01)
+    a = detector.detect_trace(uniform, interval_length=0.7, as_table=True)
+    b = detector.detect_trace(explicit, interval_length=0.7, as_table=True)
+    assert len(a) >= 1
+    assert a.to_dicts() == b.to_dicts()
+
+
+def test_npt_roundtrip_from_abf(abf_path: Path):
+    out = convert_to_npt(abf_path)
+    assert out == abf_path.with_suffix(".npt")
+    header = read_npt_header(out)
+    assert header["dtype"] == "<i2"
+    assert header["source"]["format"] == "abf"
+
+    reference = load_trace(abf_path, mmap=True)
+    cached = load_trace(out, mmap=True)
+    assert isinstance(cached.current, ScaledSamples)
+    assert isinstance(cached.time, UniformTime)
+    assert cached.sample_rate == reference.sample_rate
+    np.testing.assert_array_equal(cached.current[:], reference.current[:])
+    np.testing.assert_array_equal(cached.time[:], reference.time[:])
+
+    loaded = load_npt(out, mmap=False)
+    assert isinstance(loaded.current, np.ndarray)
+    np.testing.assert_array_equal(loaded.current, reference.current[:])
+
+
+def test_npt_roundtrip_from_csv(csv_trace_path: Path, tmp_path: Path):
+    out = convert_to_npt(csv_trace_path, tmp_path / "cache.npt", dtype="float32")
+    reference = load_trace(csv_trace_path)
+    cached = load_trace(out)
+    assert cached.sample_rate == pytest.approx(reference.sample_rate)
+    np.testing.assert_allclose(cached.current, reference.current, rtol=1e-6)
+    np.testing.assert_allclose(cached.time, reference.time, rtol=1e-9, atol=1e-12)
+
+
+def test_npt_from_large_csv_keeps_float64(tmp_path: Path, monkeypatch):
+    import pandas as pd
+
+    # Pretend the CSV is large enough for dtype='auto' to load float32
+    monkeypatch.setattr("pynanopore._dtypes.FLOAT32_MIN_SAMPLES", 10)
+    current = 100.0 + np.random.default_rng(0).normal(size=200)
+    path = tmp_path / "big.csv"
+    pd.DataFrame({"time_column": np.arange(200) / 1e3, "data_column": current}).to_csv(
+        path, index=False, float_format="%.17g"
+    )
+    assert load_trace(path).current.dtype == np.float32
+    cached = load_npt(convert_to_npt(path, tmp_path / "big.npt"), mmap=False, dtype="float64")
+    # float32 would be off by ~1e-6 relative; only CSV parsing rounding remains
+    np.testing.assert_allclose(cached.current, current, rtol=1e-14, atol=0)
+
+
+def test_npt_keeps_non_uniform_time(tmp_path: Path):
+    time = np.array([0.0, 0.1, 0.25, 0.3, 0.5])
+    current = np.arange(5, dtype=float)
+    path = write_npt(tmp_path / "irregular.npt", current, sample_rate=10.0, time=time)
+    assert read_npt_header(path)["time"]["kind"] == "explicit"
+    for mmap in (True, False):
+        trace = load_npt(path, mmap=mmap)
+        np.testing.assert_array_equal(np.asarray(trace.time), time)
+        np.testing.assert_array_equal(np.asarray(trace.current), current)
+
+
+def test_npt_rejects_foreign_file(csv_trace_path: Path, tmp_path: Path):
+    bad = tmp_path / "bad.npt"
+    bad.write_bytes(csv_trace_path.read_bytes())
+    with pytest.raises(ValueError, match="npt"):
+        load_trace(bad)
+
+
+def test_cli_convert(abf_path: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    from pynanopore.cli import main
+
+    out = tmp_path / "converted.npt"
+    assert main(["convert", str(abf_path), "-o", str(out), "--dtype", "float32"]) == 0
+    assert out.exists()
+    assert read_npt_header(out)["dtype"] == "<f4"
+    assert str(out) in capsys.readouterr().out
+
+
+def test_load_trace_working_dtype(csv_trace_path: Path, abf_path: Path):
+    small = load_trace(csv_trace_path)
+    assert small.current.dtype == np.float64
+    as32 = load_trace(csv_trace_path, dtype="float32")
+    assert as32.current.dtype == np.float32
+    assert as32.time.dtype == np.float64
+    np.testing.assert_allclose(as32.current, small.current, rtol=1e-6)
+
+    assert load_trace(abf_path, dtype="float32").current.dtype == np.float32
+    lazy = load_trace(abf_path, mmap=True, dtype="float32")
+    assert lazy.current[10:20].dtype == np.float32
+    with pytest.raises(ValueError, match="dtype"):
+        load_trace(csv_trace_path, dtype="int16")  # type: ignore[arg-type]
+
+
+def test_auto_dtype_is_float32_for_large_traces(monkeypatch: pytest.MonkeyPatch, abf_path: Path):
+    import pynanopore._dtypes as dtypes
+
+    monkeypatch.setattr(dtypes, "FLOAT32_MIN_SAMPLES", 100)
+    assert load_trace(abf_path).current.dtype == np.float32
+    assert load_trace(abf_path, mmap=True).current[:5].dtype == np.float32
+    assert load_trace(abf_path, dtype="float64").current.dtype == np.float64
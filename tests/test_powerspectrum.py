@@ -3,9 +3,21 @@
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
+import pytest
+from scipy.signal import lfilter, welch
 
+from pynanopore.detection.chunking import ChunkGenerator
 from pynanopore.psd.analyzer import PSDAnalyzer
-from pynanopore.psd.lorentzian import LorentzianFitter
+from pynanopore.psd.lorentzian import (
+    CompositePSDFitter,
+    LorentzianFitter,
+    LorentzianWhiteFitter,
+    MultiLorentzianFitter,
+    log_bin_psd,
+)
+from pynanopore.psd.spectrogram import fit_spectrogram
+from pynanopore.psd.streaming import WelchAccumulator
 
 
 def test_compute_psd():
@@ -24,3 +36,224 @@ def test_fit_lorentzian():
     s0, fc = fitter.fit_lorentzian()
     assert s0 is not None and fc is not None
     assert s0 > 0 and fc > 0
+
+
+@pytest.mark.parametrize(
+    ("fitter", "params"),
+    [
+        (LorentzianFitter, [0.8, 150.0]),
+        (LorentzianWhiteFitter, [0.8, 150.0, 1e-3]),
+        (CompositePSDFitter, [0.8, 150.0, 0.05, 1.3]),
+        (MultiLorentzianFitter, [0.8, 150.0, 0.1, 2000.0, 1e-3]),
+    ],
+)
+def test_analytic_jacobians_match_finite_differences(fitter, params):
+    f = np.linspace(1.0, 5000.0, 300)
+    instance = fitter(f, np.ones_like(f))
+    f_log = np.log10(f)
+    y = np.log10(1.0 / (1.0 + (f / 100.0) ** 2) + 1e-3)
+    params = np.array(params)
+    numeric = np.empty((len(f), len(params)))
+    for k in range(len(params)):
+        step = np.zeros_like(params)
+        step[k] = 1e-6 * params[k]
+        plus = instance.residuals_log(params + step, f_log, y)
+        minus = instance.residuals_log(params - step, f_log, y)
+        numeric[:, k] = (plus - minus) / (2 * step[k])
+    np.testing.assert_allclose(
+        instance.jacobian_log(params, f_log, y), numeric, rtol=1e-5, atol=1e-9
+    )
+
+
+def test_fitters_start_from_the_spectrum_and_accept_x0():
+    f = np.linspace(0.0, 25_000.0, 4097)
+    true = 1e-2 / (1 + (f / 40.0) ** 2) + 2e-4 / (1 + (f / 3000.0) ** 2) + 1e-7
+    # Corners far below the old fixed 1 kHz guess
+    s0, fc = LorentzianFitter(f, 1e-2 / (1 + (f / 40.0) ** 2)).fit_lorentzian()
+    assert fc == pytest.approx(40.0, rel=1e-3) and s0 == pytest.approx(1e-2, rel=1e-3)
+
+    fitter = MultiLorentzianFitter(f, true, n_components=2)
+    fit = fitter.fit()
+    assert fit["fc_1"] == pytest.approx(40.0, rel=1e-2)
+    assert fit["fc_2"] == pytest.approx(3000.0, rel=5e-2)
+    warm = MultiLorentzianFitter(f, true, n_components=2).fit(x0=list(fit.values()))
+    assert warm["fc_1"] == pytest.approx(fit["fc_1"], rel=1e-6)
+    with pytest.raises(ValueError):
+        fitter.fit(x0=[1.0, 2.0])
+
+
+def test_log_bin_psd_balances_decades():
+    f = np.linspace(0.0, 50_000.0, 32_769)[1:]
+    p = np.random.default_rng(0).gamma(8.0, 1 / 8, len(f))
+    binned = log_bin_psd(f, p, bins_per_decade=10)
+    assert binned.counts.sum() == len(f)
+    assert len(binned) <= 10 * np.log10(f[-1] / f[0]) + 1
+    log_f = np.log10(binned.frequencies)
+    assert np.all(np.diff(log_f) > 0)
+    # Every decade above the sparse lowest one holds ~10 bins
+    per_decade = np.histogram(log_f, bins=np.arange(1.0, 5.0))[0]
+    assert per_decade.tolist() == [10, 10, 10]
+    # Flat spectrum: weights follow sqrt(count) at a common variance
+    dense = binned.counts >= 100
+    ratio = binned.weights[dense] / np.sqrt(binned.counts[dense])
+    assert np.std(ratio) / ratio.mean() < 0.1
+    with pytest.raises(ValueError, match="bins_per_decade"):
+        log_bin_psd(f, p, bins_per_decade=0)
+    with pytest.raises(ValueError, match="positive"):
+        log_bin_psd(np.r_[0.0, f], np.r_[1.0, p])
+
+
+@pytest.mark.parametrize("fitter", [LorentzianWhiteFitter, MultiLorentzianFitter])
+def test_log_binned_fit_matches_full_resolution(fitter):
+    rng = np.random.default_rng(4)
+    f = np.linspace(0.0, 100_000.0, 32_769)
+    true = 1e-2 / (1 + (f / 300.0) ** 2) + 1e-7
+    if fitter is MultiLorentzianFitter:
+        true += 1e-5 / (1 + (f / 8000.0) ** 2)
+    p = true * rng.gamma(8.0, 1 / 8, len(f))
+    full = fitter(f, p, max_frequency=50_000.0)
+    binned = fitter(f, p, max_frequency=50_000.0, log_bins=20)
+    fc_full = full.fit()["fc" if fitter is LorentzianWhiteFitter else "fc_1"]
+    fc_binned = binned.fit()["fc" if fitter is LorentzianWhiteFitter else "fc_1"]
+    assert fc_binned == pytest.approx(fc_full, rel=0.03)
+    assert full.binned is None and binned.binned is not None and len(binned.binned) < 120
+    # Diagnostics are evaluated on every frequency bin, not on the bin averages
+    assert binned.diagnostics.n_points == full.diagnostics.n_points
+    assert binned.diagnostics.r2_log == pytest.approx(full.diagnostics.r2_log, abs=0.01)
+    with pytest.raises(ValueError, match="log_bins"):
+        fitter(f, p, log_bins=0)
+
+
+def test_compute_psd_float32_matches_float64():
+    rng = np.random.default_rng(1)
+    current = 100.0 + rng.normal(size=4096)
+    f64, p64 = PSDAnalyzer(fs=1000, dtype="float64").compute_psd(current, nperseg=512)
+    f32, p32 = PSDAnalyzer(fs=1000, dtype="float32").compute_psd(current, nperseg=512)
+    assert p32.dtype == np.float64
+    np.testing.assert_array_equal(f32, f64)
+    np.testing.assert_allclose(p32, p64, rtol=1e-3, atol=1e-6 * p64.max())
+
+
+@pytest.mark.parametrize(
+    ("nperseg", "noverlap", "window", "scaling"),
+    [
+        (512, None, "hamming", "spectrum"),
+        (301, 150, "hann", "density"),
+        (256, 0, "boxcar", "spectrum"),
+    ],
+)
+def test_welch_accumulator_matches_welch(nperseg, noverlap, window, scaling):
+    rng = np.random.default_rng(2)
+    current = 100.0 + rng.normal(size=20_011) + np.sin(0.3 * np.arange(20_011))
+    expected_f, expected_p = welch(
+        current,
+        1000.0,
+        window=window,
+        nperseg=nperseg,
+        noverlap=nperseg // 4 if noverlap is None else noverlap,
+        scaling=scaling,
+    )
+    # Uneven chunks, including ones shorter than a segment
+    cuts = np.sort(rng.integers(0, len(current), 40))
+    acc = WelchAccumulator(1000.0, nperseg, noverlap, window=window, scaling=scaling)
+    for part in np.split(current, cuts):
+        acc.update(part)
+    f, p = acc.result()
+    assert acc.n_samples == len(current)
+    np.testing.assert_allclose(f, expected_f)
+    np.testing.assert_allclose(p, expected_p, rtol=1e-10, atol=1e-12 * expected_p.max())
+
+    analyzer = PSDAnalyzer(fs=1000.0)
+    chunks = ChunkGenerator(1000.0, 1.7).generate(current, np.arange(len(current)) / 1000.0)
+    f2, p2 = analyzer.compute_psd_chunks(
+        chunks, nperseg=nperseg, noverlap=noverlap, window=window, scaling=scaling
+    )
+    ref_f, ref_p = analyzer.compute_psd(
+        current, nperseg=nperseg, noverlap=noverlap, window=window, scaling=scaling
+    )
+    np.testing.assert_allclose(f2, ref_f)
+    np.testing.assert_allclose(p2, ref_p, rtol=1e-10, atol=1e-12 * ref_p.max())
+
+
+def test_welch_accumulator_validation():
+    with pytest.raises(ValueError, match="noverlap"):
+        WelchAccumulator(1000.0, 64, 64)
+    acc = WelchAccumulator(1000.0, 64)
+    acc.update(np.zeros(10))
+    with pytest.raises(ValueError, match="segment"):
+        acc.result()
+
+
+def test_cli_psd_stream(csv_trace_path):
+    from pynanopore.cli import main
+
+    assert main(["psd", str(csv_trace_path), "--stream", "--nperseg", "256"]) == 0
+
+
+def test_cli_psd_log_bins(csv_trace_path, capsys):
+    import json
+
+    from pynanopore.cli import main
+
+    args = ["psd", str(csv_trace_path), "--fit", "--fit-model", "lorentzian_white"]
+    assert main([*args, "--log-bins", "10"]) == 0
+    binned = json.loads(capsys.readouterr().out)
+    assert main(args) == 0
+    full = json.loads(capsys.readouterr().out)
+    assert binned["diagnostics"]["n_points"] == full["diagnostics"]["n_points"]
+
+
+def _drifting_lorentzian(fs: float, corners: list[float], seconds: float) -> np.ndarray:
+    """AR(1) noise (Lorentzian spectrum) whose corner frequency steps every ``seconds``."""
+    rng = np.random.default_rng(4)
+    n = int(fs * seconds)
+    return np.concatenate(
+        [lfilter([1.0], [1.0, -np.exp(-2 * np.pi * fc / fs)], rng.normal(size=n)) for fc in corners]
+    )
+
+
+def test_spectrogram_windows_match_compute_psd_and_track_fc():
+    fs = 20_000.0
+    current = _drifting_lorentzian(fs, [200.0, 400.0, 800.0], 4.0)
+    analyzer = PSDAnalyzer(fs=fs)
+    spec = analyzer.compute_spectrogram(current, 2.0, 1.0, nperseg=2048)
+    assert spec.power.shape == (11, len(spec.frequencies))
+    np.testing.assert_allclose(spec.times, np.arange(1.0, 12.0))
+    f, p = analyzer.compute_psd(current[20_000:60_000], nperseg=2048)
+    np.testing.assert_allclose(spec.frequencies, f)
+    np.testing.assert_allclose(spec.power[1], p, rtol=1e-10)
+
+    table = fit_spectrogram(spec, max_frequency=5000.0)
+    assert list(table.columns) == ["t", "S0", "fc", "r2_log", "rmse_log", "n_points", "success"]
+    assert table["success"].all()
+    fc = table["fc"].to_numpy()
+    assert fc[1] == pytest.approx(200.0, rel=0.25)
+    assert fc[5] == pytest.approx(400.0, rel=0.25)
+    assert fc[9] == pytest.approx(800.0, rel=0.25)
+
+    cold = fit_spectrogram(spec, max_frequency=5000.0, warm_start=False)
+    np.testing.assert_allclose(table["fc"], cold["fc"], rtol=1e-3)
+    parallel = fit_spectrogram(spec, max_frequency=5000.0, n_jobs=2)
+    np.testing.assert_allclose(table["fc"], parallel["fc"], rtol=1e-3)
+
+    white = fit_spectrogram(spec, model="lorentzian_white", max_frequency=5000.0)
+    assert {"S0", "fc", "N"} <= set(white.columns)
+    with pytest.raises(ValueError, match="model"):
+        fit_spectrogram(spec, model="double_lorentzian")  # type: ignore[arg-type]
+
+
+def test_cli_psd_spectrogram(tmp_path):
+    from pynanopore.cli import main
+
+    fs = 20_000.0
+    path = tmp_path / "noise.csv"
+    current = _drifting_lorentzian(fs, [300.0, 600.0], 2.0)
+    pd.DataFrame(
+        {"time_column": np.arange(len(current)) / fs, "data_column": 100.0 + current}
+    ).to_csv(path, index=False)
+    out = tmp_path / "spec.csv"
+    argv = ["psd", str(path), "--spectrogram", "1", "--nperseg", "2048", "-o", str(out)]
+    assert main([*argv, "--max-frequency", "5000"]) == 0
+    table = pd.read_csv(out)
+    assert len(table) == 4 and table["success"].all()
+    assert table["fc"].iloc[-1] > table["fc"].iloc[0]
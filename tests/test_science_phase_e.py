@@ -37,6 +37,45 @@ def test_percentile_baseline_tracks_open_pore_with_events():
     assert float(np.median(bl)) >= float(np.median(med)) - 1.0
 
 
+@pytest.mark.parametrize(
+    "estimator",
+    [
+        MedianBaseline(window_s=0.2, engine="decimate", points_per_window=201),
+        PercentileBaseline(percentile=90.0, window_s=0.5, engine="decimate", points_per_window=501),
+    ],
+    ids=["median", "percentile"],
+)
+def test_decimated_baseline_engine_close_to_exact(estimator):
+    fs = 20_000.0
+    n = 100_000
+    t = np.arange(n) / fs
+    rng = np.random.default_rng(3)
+    current = (100.0 + 5.0 * np.sin(2 * np.pi * 0.5 * t) + rng.normal(0.0, 1.0, n)).astype(
+        np.float32
+    )
+    exact = type(estimator)(**{**vars(estimator), "engine": "exact"}).estimate(current, fs)
+    approx = estimator.estimate(current, fs)
+    assert approx.shape == exact.shape
+    assert approx.dtype == np.float32
+    # Away from the edges the error stays a fraction of the noise σ (=1)
+    edge = int(estimator.window_s * fs)
+    err = np.abs(approx - exact)[edge:-edge]
+    assert float(np.sqrt(np.mean(err**2))) < 0.15
+    assert float(err.max()) < 0.6
+
+
+def test_baseline_engine_validation():
+    with pytest.raises(ValueError, match="engine"):
+        MedianBaseline(engine="fast")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="points_per_window"):
+        PercentileBaseline(engine="decimate", points_per_window=1)
+    # Short windows fall back to the exact filter
+    x = np.random.default_rng(0).normal(size=500)
+    exact = MedianBaseline(window_s=0.01).estimate(x, 1000.0)
+    short = MedianBaseline(window_s=0.01, engine="decimate").estimate(x, 1000.0)
+    np.testing.assert_array_equal(short, exact)
+
+
 def test_analyze_event_levels_two_states():
     rng = np.random.default_rng(0)
     seg = np.concatenate(
@@ -51,6 +90,130 @@ def test_analyze_event_levels_two_states():
     assert feats.level1_fraction + feats.level2_fraction == pytest.approx(1.0, abs=0.05)
 
 
+def test_exact_level_split_matches_kmeans_and_is_optimal():
+    from pynanopore.detection.levels import _kmeans_1d, _split_1d, assign_event_levels
+
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        n = int(rng.integers(12, 300))
+        seg = np.concatenate([rng.normal(-20.0, 1.0, n // 3), rng.normal(-60.0, 1.0, n - n // 3)])
+        rng.shuffle(seg)
+        labels, centers = _split_1d(seg)
+        ref_labels, ref_centers = _kmeans_1d(seg, 2)
+        # Well-separated levels: same clusters as Lloyd iterations
+        np.testing.assert_array_equal(labels, ref_labels)
+        np.testing.assert_allclose(centers, ref_centers)
+
+        # Overlapping levels: never a worse least-squares fit than k-means
+        noisy = seg + rng.normal(0.0, 15.0, n)
+        labels, centers = _split_1d(noisy)
+        ref_labels, ref_centers = _kmeans_1d(noisy, 2)
+        sse = np.sum((noisy - centers[labels]) ** 2)
+        assert sse <= np.sum((noisy - ref_centers[ref_labels]) ** 2) + 1e-9
+
+    assignment = assign_event_levels(np.r_[np.full(20, -30.0), np.full(10, -60.0)], 0.0)
+    assert assignment.features.n_levels == 2.0
+    assert assignment.features.level1_current == -60.0
+    assert assignment.features.level1_fraction == pytest.approx(1 / 3)
+    assert assignment.labels.tolist() == [1] * 20 + [0] * 10
+    flat = assign_event_levels(np.full(30, -30.0), 0.0)
+    assert flat.features.n_levels == 1.0 and flat.labels.tolist() == [0] * 30
+
+
+def test_batched_levels_match_per_event_assignment():
+    from pynanopore.detection.levels import assign_event_levels, assign_levels_batch
+
+    rng = np.random.default_rng(3)
+    segments, i0 = [], []
+    for k in range(300):
+        n = int(rng.integers(1, 200))
+        if k % 3 == 0:
+            seg = np.where(rng.random(n) < 0.4, -30.0, -60.0) + rng.normal(0.0, 2.0, n)
+        elif k % 3 == 1:
+            seg = rng.normal(-40.0, 3.0, n)
+        else:
+            seg = np.round(rng.normal(-40.0, 1.0, n)) if k % 2 else np.full(n, -5.0)
+        segments.append(seg)
+        i0.append(0.0 if k % 7 == 0 else 100.0)
+    lengths = np.array([len(s) for s in segments])
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    current = np.concatenate(segments)
+
+    for max_levels in (1, 2):
+        batch = assign_levels_batch(
+            current, starts, starts + lengths - 1, np.array(i0), max_levels=max_levels
+        )
+        assert len(batch) == len(segments)
+        for k, seg in enumerate(segments):
+            ref = assign_event_levels(seg, i0[k], max_levels=max_levels)
+            got = batch.assignment(k)
+            np.testing.assert_array_equal(got.labels, ref.labels)
+            np.testing.assert_allclose(got.centers, ref.centers)
+            for name, value in ref.features.as_event_fields().items():
+                assert getattr(got.features, name) == pytest.approx(value, nan_ok=True)
+
+    picked = batch.take(np.arange(len(batch)) % 4 == 1)
+    np.testing.assert_array_equal(picked.assignment(2).labels, batch.assignment(9).labels)
+
+
+def test_event_table_caches_levels_for_idealization(synthetic_trace: Trace):
+    from pynanopore.detection.levels import MultiLevelIdealization, idealize_multilevel
+
+    table = EventDetector(0.5, 2.0, analyze_levels=True).detect_trace(
+        synthetic_trace, interval_length=1.0, as_table=True
+    )
+    assert len(table) and table.levels is not None and len(table.levels) == len(table)
+    np.testing.assert_array_equal(
+        table.levels.features["level1_current"], table.columns["level1_current"]
+    )
+    assert len(table[1:].levels) == len(table) - 1
+
+    cached = idealize_multilevel(synthetic_trace, table)
+    recomputed = idealize_multilevel(synthetic_trace, table.to_events())
+    np.testing.assert_allclose(cached.idealized, recomputed.idealized)
+    np.testing.assert_array_equal(cached.level_code, recomputed.level_code)
+    assert 1 in cached.level_code
+
+    # Dense reference: paint every event's labels sample by sample
+    open_fill = float(np.median(table.columns["i0"]))
+    idealized = np.full(len(synthetic_trace.current), open_fill)
+    level_code = np.zeros(len(synthetic_trace.current), dtype=int)
+    for k, ev in enumerate(table):
+        assignment = table.levels.assignment(k)
+        span = slice(ev.start_idx, ev.end_idx + 1)
+        idealized[span] = assignment.centers[assignment.labels]
+        level_code[span] = assignment.labels + 1
+    np.testing.assert_array_equal(cached.idealized, idealized)
+    np.testing.assert_array_equal(cached.level_code, level_code)
+    assert cached.runs.n_runs < len(synthetic_trace.current) // 10
+    legacy = MultiLevelIdealization.from_arrays(synthetic_trace.time, idealized, level_code, table)
+    assert legacy.level_code is level_code
+    np.testing.assert_array_equal(legacy.runs.starts, cached.runs.starts)
+    np.testing.assert_array_equal(legacy.runs.codes, cached.runs.codes)
+
+    # Same event positions over different samples: the cache must not be trusted
+    other = Trace(
+        time=synthetic_trace.time,
+        current=synthetic_trace.current[::-1].copy(),
+        sample_rate=synthetic_trace.sample_rate,
+    )
+    stale = idealize_multilevel(other, table)
+    np.testing.assert_array_equal(
+        stale.idealized, idealize_multilevel(other, table.to_events()).idealized
+    )
+    assert table[1:].levels.covers(
+        synthetic_trace.current,
+        table.columns["start_idx"][1:],
+        np.diff(table.levels.offsets)[1:],
+        2,
+    )
+
+    no_levels = EventDetector(0.5, 2.0, analyze_levels=False).detect_trace(
+        synthetic_trace, interval_length=1.0, as_table=True
+    )
+    assert no_levels.levels is None
+
+
 def test_event_detector_emits_level_fields(synthetic_trace: Trace):
     events = EventDetector(0.5, 2.0, analyze_levels=True).detect_trace(
         synthetic_trace, interval_length=1.0
@@ -65,6 +65,30 @@ def test_event_preview_csv(event_client: TestClient, csv_trace_path: Path):
     assert resp.headers.get("X-Request-ID")
 
 
+def test_event_preview_and_plot_npt(event_client: TestClient, tmp_path: Path):
+    from pynanopore import load_trace
+    from pynanopore.io.npt import write_npt
+    from pynanopore.viz import Plotting
+
+    rng = np.random.default_rng(0)
+    current = 100.0 + rng.normal(size=5000)
+    path = write_npt(tmp_path / "small.npt", current, sample_rate=1000.0)
+    with path.open("rb") as fh:
+        resp = event_client.post(
+            "/v1/preview", files={"file": ("small.npt", fh, "application/octet-stream")}
+        )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["n_points_returned"] == 5000 and body["time"][1] == pytest.approx(1e-3)
+
+    # Lazy time axis and memory-mapped samples plot like arrays
+    trace = load_trace(path, mmap=True)
+    fig = Plotting.plot_data_series(trace.time, trace.current)
+    assert len(fig.data[1].x) == 5000
+    assert Plotting.plot_data(trace.time, trace.current, []).data
+    assert trace.time.max() == pytest.approx(4.999) and (trace.time * 1e3).tolist()[2] == 2.0
+
+
 def test_event_detect_window(event_client: TestClient, csv_trace_path: Path):
     with csv_trace_path.open("rb") as fh:
         preview = event_client.post(
@@ -131,6 +155,33 @@ def test_stats_dwelltime(stats_client: TestClient):
     assert body["method"] == "mle"
     assert body["aic"] is not None
 
+    resp = stats_client.post(
+        "/v1/dwelltime", json={"events": events, "bins": 30, "fit_type": "double"}
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["converged"] is True and body["n_iter"] > 0
+    assert body["confidence_intervals"] is None
+
+    resp = stats_client.post(
+        "/v1/dwelltime",
+        json={"events": events, "fit_type": "single", "ci": 0.95, "n_boot": 200, "seed": 0},
+    )
+    assert resp.status_code == 200, resp.text
+    lo, hi = resp.json()["confidence_intervals"]["tau"]
+    assert lo < resp.json()["parameters"]["tau"] < hi
+
+    # A repeated request is answered from the shared fit cache without refitting
+    from pynanopore import fit_cache_info
+
+    misses = fit_cache_info()["misses"]
+    again = stats_client.post(
+        "/v1/dwelltime",
+        json={"events": events, "fit_type": "single", "ci": 0.95, "n_boot": 200, "seed": 0},
+    )
+    assert again.json()["confidence_intervals"] == resp.json()["confidence_intervals"]
+    assert fit_cache_info()["misses"] == misses
+
 
 def test_psd_array(psd_client: TestClient):
     rng = np.random.default_rng(0)
@@ -143,3 +194,16 @@ def test_psd_array(psd_client: TestClient):
     body = resp.json()
     assert body["n_frequencies"] > 0
     assert body["S0"] is not None
+
+
+def test_psd_spectrogram_array(psd_client: TestClient):
+    rng = np.random.default_rng(0)
+    current = rng.normal(size=4000).tolist()
+    resp = psd_client.post(
+        "/v1/psd/spectrogram",
+        json={"current": current, "fs": 1000.0, "window_s": 1.0, "nperseg": 256},
+    )
+    assert resp.status_code == 200, resp.text
+    body = resp.json()
+    assert body["n_windows"] == 4
+    assert {"t", "S0", "fc", "r2_log", "success"} <= set(body["windows"][0])
@@ -0,0 +1,155 @@
+"""Tests for stateful streaming event detection."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pynanopore.detection.baseline import ConstantBaseline, MedianBaseline
+from pynanopore.detection.chunking import ChunkGenerator
+from pynanopore.detection.events import EventDetector
+from pynanopore.io.trace import Trace
+
+
+def _step_trace(fs: float = 1000.0) -> Trace:
+    """Noise-free open pore with rectangular blockades, two straddling 0.5 s marks."""
+    n = 4000
+    t = np.arange(n) / fs
+    current = np.full(n, 100.0)
+    for a, b in [(120, 180), (470, 560), (1490, 1530), (2250, 2320), (2980, 3100)]:
+        current[a:b] = 60.0
+    return Trace(time=t, current=current, sample_rate=fs, source="steps")
+
+
+def _bounds(events):
+    return [(e.start_idx, e.end_idx) for e in events]
+
+
+def test_streaming_recovers_boundary_spanning_events():
+    trace = _step_trace()
+    det = EventDetector(0.5, 2.0, min_duration=0.01, baseline=ConstantBaseline(100.0))
+    whole = det.detect_events(trace.current, trace.time, sample_rate=trace.sample_rate)
+    chunked = det.detect_trace(trace, interval_length=0.5)
+    streamed = det.detect_trace(trace, interval_length=0.5, streaming=True)
+
+    assert len(whole) == 5
+    assert len(chunked) < len(whole)  # plain windows cut the straddling events
+    assert _bounds(streamed) == _bounds(whole)
+    for a, b in zip(streamed, whole, strict=True):
+        assert a.dwell_time == pytest.approx(b.dwell_time)
+        assert a.area == pytest.approx(b.area)
+        assert a.i0 == pytest.approx(b.i0)
+
+
+def test_streaming_single_feed_matches_detect_events(synthetic_trace: Trace):
+    det = EventDetector(0.5, 2.0, min_duration=0.01)
+    ref = det.detect_events(
+        synthetic_trace.current, synthetic_trace.time, sample_rate=synthetic_trace.sample_rate
+    )
+    stream = det.stream(synthetic_trace.sample_rate)
+    got = stream.feed(synthetic_trace.current, synthetic_trace.time)
+    assert len(stream.flush()) == 0
+    assert _bounds(got) == _bounds(ref)
+    np.testing.assert_allclose(
+        got.columns["blockade_mean"], [e.blockade_mean for e in ref], rtol=1e-9
+    )
+
+
+def test_streaming_tiny_chunks_and_chunk_generator():
+    trace = _step_trace()
+    det = EventDetector(0.5, 2.0, min_duration=0.01, baseline=ConstantBaseline(100.0))
+    expected = _bounds(det.detect_events(trace.current, trace.time, sample_rate=1000.0))
+
+    stream = det.stream(trace.sample_rate)
+    tiny = [stream.feed(trace.current[i : i + 7]) for i in range(0, len(trace.current), 7)]
+    assert [b for table in tiny for b in _bounds(table)] == expected
+    assert stream.n_samples == len(trace.current)
+
+    chunks = ChunkGenerator(trace.sample_rate, interval_length=0.5).generate(
+        trace.current, trace.time
+    )
+    assert _bounds(det.stream(trace.sample_rate).detect_chunks(chunks)) == expected
+
+
+def test_streaming_rejects_overlap(synthetic_trace: Trace):
+    with pytest.raises(ValueError, match="overlap"):
+        EventDetector().detect_trace(synthetic_trace, overlap=0.1, streaming=True)
+
+
+def test_streaming_with_moving_baseline_keeps_context(synthetic_trace: Trace):
+    det = EventDetector(0.5, 2.0, min_duration=0.01, baseline=MedianBaseline(window_s=0.1))
+    stream = det.stream(synthetic_trace.sample_rate)
+    assert stream.baseline_context == 100
+    table = stream.detect_chunks(
+        synthetic_trace.current[i : i + 250] for i in range(0, len(synthetic_trace.current), 250)
+    )
+    assert len(table) >= 2
+    assert np.all(np.diff(table.columns["start_idx"]) > 0)
+
+
+def test_streaming_caps_open_event_buffer():
+    trace = _step_trace()
+    det = EventDetector(0.5, 2.0, min_duration=0.01, baseline=ConstantBaseline(100.0))
+    whole = _bounds(det.detect_events(trace.current, trace.time, sample_rate=1000.0))
+
+    # The 120-sample blockade exceeds 0.1 s, whether it spans chunks or not
+    for size in (7, len(trace.current)):
+        stream = det.stream(trace.sample_rate, max_event_s=0.1)
+        got = [
+            b
+            for i in range(0, 4000, size)
+            for b in _bounds(stream.feed(trace.current[i : i + size]))
+        ]
+        assert got == [b for b in whole if b != (2980, 3100)]
+        assert stream.n_dropped == 1
+
+    # A clogged pore: the open event's buffer stays bounded and nothing is emitted
+    clog = np.r_[trace.current, np.full(20_000, 60.0)]
+    stream = det.stream(trace.sample_rate, max_event_s=0.1)
+    for i in range(0, len(clog), 50):
+        stream.feed(clog[i : i + 50])
+        assert sum(len(x) for x in stream._open_current) <= 100 + 50
+    assert stream.n_dropped == 2
+    unlimited = det.stream(trace.sample_rate, max_event_s=None)
+    assert (
+        _bounds(unlimited.detect_chunks(trace.current[i : i + 7] for i in range(0, 4000, 7)))
+        == whole
+    )
+    with pytest.raises(ValueError, match="max_event_s"):
+        det.stream(1000.0, max_event_s=0)
+
+
+def _record_baselines(stream) -> list:
+    """Keep every baseline slice the stream computes, in order."""
+    pieces: list = []
+    compute = stream._baseline
+
+    def baseline(raw, ready):
+        pieces.append(compute(raw, ready))
+        return pieces[-1]
+
+    stream._baseline = baseline
+    return pieces
+
+
+def test_streaming_moving_baseline_matches_one_shot():
+    rng = np.random.default_rng(3)
+    fs = 10_000.0
+    n = 40_000
+    current = 100.0 + 8.0 * np.sin(np.arange(n) / 700.0) + rng.normal(0.0, 1.0, n)
+    for a in range(500, n - 200, 1_731):
+        current[a : a + 60] -= 30.0
+    estimator = MedianBaseline(window_s=0.05)
+    det = EventDetector(0.5, 2.0, min_duration=0.001, baseline=estimator)
+    expected = estimator.estimate(current, fs)
+
+    for size in (1_000, 333, 7):
+        stream = det.stream(fs)
+        pieces = _record_baselines(stream)
+        tables = [stream.feed(current[i : i + size]) for i in range(0, n, size)]
+        tables.append(stream.flush())
+        np.testing.assert_allclose(np.concatenate(pieces), expected, rtol=0, atol=1e-9)
+        starts = np.concatenate([t.columns["start_idx"] for t in tables]).astype(int)
+        assert len(starts) >= 20 and np.all(np.diff(starts) > 0)
+        i0 = np.concatenate([t.columns["i0"] for t in tables])
+        np.testing.assert_allclose(i0, expected[starts], atol=1e-9)